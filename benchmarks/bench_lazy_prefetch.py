@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Lazy Animation Prefetch Benchmark
+Times the first use of lazy animations loaded on demand against prefetched ones,
+and checks that a prefetched animation is never decoded on the main thread.
+
+Run from the project root:
+    python benchmarks/bench_lazy_prefetch.py
+"""
+
+import os
+import sys
+import threading
+import time
+from functools import partial
+
+# Run headless so the benchmark works without a display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+from game.animation_manifest import animation_manifest
+from game.resource_utils import sprite_path
+from game.sprite_system import FrameCache, LazyAnimation, TextureAtlas
+
+
+class TracingFrameCache(FrameCache):
+    """Frame cache (without the offline bake) that counts strips decoded on the main thread."""
+
+    def __init__(self):
+        super().__init__(atlas=TextureAtlas())
+        self.main_thread_loads = 0
+
+    def _load_strip(self, *args):
+        if threading.current_thread() is threading.main_thread():
+            self.main_thread_loads += 1
+        return super()._load_strip(*args)
+
+
+def lazy_specs():
+    """(name, strip spec) of every lazy animation in the manifest, without duplicates."""
+    specs = {}
+    for character in animation_manifest.names:
+        entry = animation_manifest.character(character)
+        for name, animation in entry["animations"].items():
+            if animation.get("lazy", False):
+                spec = (sprite_path(animation["sheet"]), animation["frames"], entry["scale"], entry.get("tint"),
+                        entry["palette"])
+                specs.setdefault(spec, f"{character}/{name}")
+    return [(name, spec) for spec, name in specs.items()]
+
+
+def first_use(specs, prefetch: bool):
+    """Milliseconds each animation's first use takes on the main thread, and the strips decoded there."""
+    cache = TracingFrameCache()
+    animations = [LazyAnimation(partial(cache.get_strip, *spec)) for _, spec in specs]
+    if prefetch:
+        for animation in animations:
+            animation.prefetch()
+        # Let the background loader finish, as it does between the hint and the hit
+        for animation in animations:
+            animation._prefetch.result()
+    times = []
+    for animation in animations:
+        start = time.perf_counter()
+        animation.ensure_loaded()
+        times.append((time.perf_counter() - start) * 1000)
+    return times, cache.main_thread_loads
+
+
+def main():
+    """Run the benchmark, print a per-animation comparison and fail if a prefetch was decoded again."""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    specs = lazy_specs()
+    on_demand, on_demand_loads = first_use(specs, prefetch=False)
+    prefetched, prefetched_loads = first_use(specs, prefetch=True)
+
+    print(f"{'animation':<28}{'on demand ms':>14}{'prefetched ms':>15}")
+    for (name, _), cold, warm in zip(specs, on_demand, prefetched):
+        print(f"{name:<28}{cold:>14.2f}{warm:>15.2f}")
+    print(f"{'TOTAL':<28}{sum(on_demand):>14.2f}{sum(prefetched):>15.2f}")
+    print()
+    print(f"Strips decoded on the main thread: {on_demand_loads} on demand, {prefetched_loads} after prefetching.")
+
+    pygame.quit()
+    if prefetched_loads:
+        print("FAIL: prefetched animations were decoded again on first use")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Sprite Slicing Benchmark
+Compares the copying frame extraction path against zero-copy subsurface views.
+
+Run from the project root:
+    python benchmarks/bench_sprite_slicing.py
+"""
+
+import os
+import sys
+import time
+
+# Run headless so the benchmark works without a display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+from game.sprite_system import SpriteSheet
+from game.resource_utils import sprite_path
+
+
+# (sheet, frame count, scale) as loaded by the characters
+SHEETS = [
+    ("Idle.png", 8, 2),
+    ("Attack1.png", 6, 2),
+    ("Attack2.png", 6, 2),
+    ("Run.png", 8, 2),
+    ("Death.png", 6, 2),
+    ("Take Hit.png", 4, 2),
+    ("Take Hit - white silhouette.png", 4, 2),
+    ("Jump.png", 2, 2),
+    ("YellowNinja/yellowNinja - idle.png", 8, 2.25),
+    ("YellowNinja/yellowNinja - walk.png", 10, 2.25),
+    ("YellowNinja/yellowNinja - attack.png", 20, 2.25),
+    ("YellowNinja/yellowNinja - hit.png", 4, 2.25),
+    ("YellowNinja/yellowNinja - Death.png", 14, 2.25),
+]
+
+REPEATS = 20
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Pixel memory owned by a surface (views own none)."""
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def copy_path(sheet: SpriteSheet, frame_count: int, scale: float):
+    """Original path: copy every frame out of the sheet, then scale every frame.
+
+    Returns the frames and the bytes allocated on the way (including the
+    unscaled copies that become garbage once scaled).
+    """
+    frame_width = sheet.width // frame_count
+    raw_frames = sheet.get_frames(frame_width, sheet.height, frame_count, 0)
+    allocated = sum(surface_bytes(frame) for frame in raw_frames)
+    if scale == 1:
+        return raw_frames, allocated
+    scaled_size = (int(frame_width * scale), int(sheet.height * scale))
+    frames = [pygame.transform.scale(frame, scaled_size) for frame in raw_frames]
+    return frames, allocated + sum(surface_bytes(frame) for frame in frames)
+
+
+def view_path(sheet: SpriteSheet, frame_count: int, scale: float):
+    """Zero-copy path: scale the sheet once (if at all) and hand out subsurface views."""
+    frame_width = sheet.width // frame_count
+    frames = sheet.get_scaled_frames(frame_width, sheet.height, frame_count, scale, copy=False)
+    # Views over the loaded sheet itself allocate nothing new
+    parents = {id(frame.get_parent()): frame.get_parent() for frame in frames
+               if frame.get_parent() is not None and frame.get_parent() is not sheet.sheet}
+    return frames, sum(surface_bytes(parent) for parent in parents.values())
+
+
+def time_call(func, *args) -> float:
+    """Average wall time of func(*args) in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        func(*args)
+    return (time.perf_counter() - start) * 1000 / REPEATS
+
+
+def main():
+    """Run the benchmark and print a per-sheet comparison."""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    columns = ("raw KB", "1x copy", "1x view", "Nx copy", "Nx view", "copy ms", "view ms")
+    print(f"{'sheet':<38}" + "".join(f"{column:>9}" for column in columns))
+    totals = [0.0] * len(columns)
+    for filename, frame_count, scale in SHEETS:
+        sheet = SpriteSheet(sprite_path(filename))
+        row = [
+            surface_bytes(sheet.sheet) / 1024,
+            copy_path(sheet, frame_count, 1)[1] / 1024,
+            view_path(sheet, frame_count, 1)[1] / 1024,
+            copy_path(sheet, frame_count, scale)[1] / 1024,
+            view_path(sheet, frame_count, scale)[1] / 1024,
+            time_call(copy_path, sheet, frame_count, scale),
+            time_call(view_path, sheet, frame_count, scale),
+        ]
+        totals = [total + value for total, value in zip(totals, row)]
+        print(f"{filename:<38}" + "".join(f"{value:>9.1f}" for value in row))
+    print(f"{'TOTAL':<38}" + "".join(f"{value:>9.1f}" for value in totals))
+
+    raw_kb, copy_1x, view_1x, copy_nx, view_nx, copy_ms, view_ms = totals
+    print()
+    print(f"Unscaled: copying allocates {copy_1x:.0f} KB for {raw_kb:.0f} KB of sheets, views allocate {view_1x:.0f} KB.")
+    print(f"Scaled:   copying allocates {copy_nx:.0f} KB, views over one scaled sheet {view_nx:.0f} KB "
+          f"({copy_nx / max(1.0, view_nx):.2f}x less), {copy_ms / max(1e-9, view_ms):.1f}x faster.")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
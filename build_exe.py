@@ -19,6 +19,13 @@ def main():
     if os.path.exists("dist"):
         shutil.rmtree("dist")
     
+    # Bake sprites so the bundled assets include the ready-to-blit cache
+    try:
+        from game.sprite_bake import bake
+        bake()
+    except Exception as e:
+        print(f"Sprite bake failed, the game will decode sprites at startup: {e}")
+    
     # PyInstaller command
     cmd = [
         "pyinstaller",
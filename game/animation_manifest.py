@@ -0,0 +1,86 @@
+"""
+Animation Manifest
+Data-driven description of every character's sprite animations (assets/animations.json).
+"""
+
+import json
+from typing import Dict, List, Tuple
+from game.palette import parse_palette
+from game.resource_utils import asset_path
+
+
+class AnimationManifest:
+    """Character sprite sets read from a JSON manifest.
+    
+    Each entry maps animation names to {"sheet", "frames", "duration", "loop",
+    "hit_frame", "lazy"} and may set a "scale", a BLEND_MULT "tint", a "palette" of
+    [from, to] color pairs and "aliases" for states that reuse another animation.
+    An entry with a "base" inherits every field of that entry, so color variants
+    (such as the AI samurai) only list the tint or palette that differs.
+    """
+    
+    def __init__(self, data: Dict[str, dict]):
+        """Wrap already parsed manifest data."""
+        self.data = data
+    
+    @classmethod
+    def load(cls, path: str) -> "AnimationManifest":
+        """Read a manifest file (empty if it is missing or invalid)."""
+        try:
+            with open(path, "r") as manifest_file:
+                return cls(json.load(manifest_file))
+        except (OSError, ValueError) as e:
+            print(f"Could not load animation manifest {path}: {e}")
+            return cls({})
+    
+    @property
+    def names(self) -> List[str]:
+        """Every sprite set in the manifest."""
+        return list(self.data)
+    
+    def character(self, name: str) -> dict:
+        """A sprite set with its base entries merged in (KeyError if unknown)."""
+        entry = dict(self.data[name])
+        base = entry.pop("base", None)
+        if base is not None:
+            merged = self.character(base)
+            merged.update(entry)
+            entry = merged
+        entry.setdefault("scale", 1)
+        entry.setdefault("aliases", {})
+        if entry.get("tint") is not None:
+            entry["tint"] = tuple(entry["tint"])
+        entry["palette"] = parse_palette(entry.get("palette"))
+        return entry
+    
+    def sprite_specs(self, name: str, include_lazy: bool = True, pixel_scale: int = 1) -> List[Tuple]:
+        """Sprite strips of a sprite set as (sheet, frame count, scale, tint, palette).
+        
+        Lazy animations (loaded on first play) can be left out. For scenes drawn
+        pixel_scale times smaller than the game, the sheets are scaled that much less.
+        """
+        entry = self.character(name)
+        scale = scene_scale(entry["scale"], pixel_scale)
+        return [(animation["sheet"], animation["frames"], scale, entry.get("tint"), entry["palette"])
+                for animation in entry["animations"].values()
+                if include_lazy or not animation.get("lazy", False)]
+    
+    def all_specs(self, pixel_scales: Tuple[int, ...] = (1,)) -> List[Tuple]:
+        """Sprite strips of every sprite set at each pixel scale, without duplicates."""
+        specs = []
+        for pixel_scale in pixel_scales:
+            for name in self.names:
+                for spec in self.sprite_specs(name, pixel_scale=pixel_scale):
+                    if spec not in specs:
+                        specs.append(spec)
+        return specs
+
+
+def scene_scale(scale: float, pixel_scale: int) -> float:
+    """A manifest scale for a scene drawn pixel_scale times smaller (whole results stay ints, like the manifest's)."""
+    scale = scale / pixel_scale
+    return int(scale) if scale == int(scale) else scale
+
+
+# Shared by every character
+animation_manifest = AnimationManifest.load(asset_path("animations.json"))
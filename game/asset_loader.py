@@ -0,0 +1,125 @@
+"""
+Asset Loader
+Background decoding of scene assets so scene switches do not stall the game loop.
+"""
+
+import pygame
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from game.resource_utils import sprite_path
+
+
+class ImageCache:
+    """Process-wide cache of loaded (and optionally scaled/converted) images.
+    
+    Cached surfaces are shared between scenes and must never be drawn on; copy
+    them first (as the compositor does before darkening the menu background).
+    """
+    
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._images: Dict[Tuple, pygame.Surface] = {}
+        self._lock = threading.RLock()
+    
+    def get(self, filename: str, size: Optional[Tuple[int, int]] = None,
+            convert: bool = False, alpha: bool = False) -> pygame.Surface:
+        """Load a sprite-folder image, scaled to size and converted to the display format.
+        
+        Raises pygame.error / OSError like pygame.image.load; failures are not cached.
+        """
+        key = (filename, size, convert, alpha)
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                image = pygame.image.load(sprite_path(filename))
+                if alpha:
+                    image = image.convert_alpha()
+                elif convert:
+                    image = image.convert()
+                if size is not None:
+                    image = pygame.transform.scale(image, size)
+                self._images[key] = image
+            return image
+    
+    def clear(self):
+        """Drop every cached image."""
+        with self._lock:
+            self._images.clear()
+
+
+class AssetLoader:
+    """Loads groups of assets on a worker thread, one future per group.
+    
+    A group is a list of callables that warm the shared caches (frame_cache,
+    image_cache). Scenes built after the group finished find everything cached.
+    """
+    
+    def __init__(self):
+        """Start the loader with a single worker thread."""
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asset-loader")
+        self._groups: Dict[str, Future] = {}
+        self._progress: Dict[str, Tuple[int, int]] = {}
+    
+    def preload(self, name: str, jobs: List[Callable]) -> Future:
+        """Queue a group of load jobs (only once per name) and return its future."""
+        future = self._groups.get(name)
+        if future is None:
+            self._progress[name] = (0, len(jobs))
+            future = self._executor.submit(self._run_group, name, jobs)
+            self._groups[name] = future
+        return future
+    
+    def _run_group(self, name: str, jobs: List[Callable]) -> int:
+        """Run a group's jobs in order on the worker thread, returning how many failed."""
+        start = time.perf_counter()
+        failed = 0
+        for done, job in enumerate(jobs, 1):
+            try:
+                job()
+            except Exception as e:
+                # The scene falls back (and reports) when it loads the asset itself
+                failed += 1
+                print(f"Could not preload {name} asset: {e}")
+            self._progress[name] = (done, len(jobs))
+        print(f"Preloaded {name} assets: {len(jobs) - failed}/{len(jobs)} in {time.perf_counter() - start:.2f}s")
+        return failed
+    
+    def submit(self, job: Callable) -> Future:
+        """Queue a single job behind the queued groups (used for prefetch hints)."""
+        return self._executor.submit(job)
+    
+    def progress(self, name: str) -> float:
+        """Fraction of a group's jobs completed (0.0 if it was never queued)."""
+        done, total = self._progress.get(name, (0, 0))
+        if total == 0:
+            return 1.0 if name in self._groups else 0.0
+        return done / total
+    
+    def is_ready(self, name: str) -> bool:
+        """Whether a group has finished loading."""
+        future = self._groups.get(name)
+        return future is not None and future.done()
+    
+    def wait(self, name: str, timeout: Optional[float] = None):
+        """Block until a queued group finishes (no-op for unknown groups)."""
+        future = self._groups.get(name)
+        if future is None or future.done():
+            return
+        print(f"Waiting for {name} assets ({self.progress(name):.0%} loaded)...")
+        try:
+            future.result(timeout)
+        except Exception as e:
+            print(f"Could not preload {name} assets: {e}")
+    
+    def shutdown(self):
+        """Stop the worker, dropping groups that have not started."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+# Shared by every scene, filled by the scenes themselves or ahead of time by the loader
+image_cache = ImageCache()
+
+# Single background worker shared by the engine (scene preloads) and lazy animations
+asset_loader = AssetLoader()
@@ -0,0 +1,140 @@
+"""
+Bitmap Font
+Glyph atlas text rendering: glyphs are rasterized once and strings are composed with blits.
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+
+# Widest row of the master glyph atlas
+ATLAS_WIDTH = 1024
+
+# Composed strings kept per font before the least recently used is dropped
+MAX_STRINGS = 256
+
+# Palette of glyph surfaces: index 0 is the transparent background, the glyph index is recolored
+GLYPH_PALETTE = [(0, 0, 0), (255, 255, 255)]
+GLYPH_INDEX = 1
+
+
+class BitmapFont:
+    """The default font at one size, drawn from pre-scaled glyph atlases.
+    
+    Every glyph is rasterized once, the first time it is drawn (no anti-aliasing,
+    like the pixel text always was), into a master atlas; a nearest-neighbor scale
+    of it serves each text scale. Strings are composed from the atlas with one
+    Surface.blits call and kept. Like Font.render output, atlases and strings are
+    8-bit with a two-color palette (transparent colorkey, glyph), so drawing a
+    kept string in any color (including the per-frame glow colors) is a copy and
+    a palette change. Glyph positions come from the TrueType layout (kerning,
+    sub-pixel advances), so composed text is identical to scaling up Font.render
+    output.
+    """
+    
+    def __init__(self, size: int):
+        """Load the default font at size; glyphs are rasterized on first use."""
+        self.size = size
+        self.font = pygame.font.Font(None, size)
+        self._glyph_images: Dict[str, pygame.Surface] = {}
+        self._glyph_rects: Dict[str, pygame.Rect] = {}
+        self._atlases: Dict[int, Tuple[pygame.Surface, Dict[str, pygame.Rect]]] = {}
+        self._strings: "OrderedDict[Tuple[str, int], pygame.Surface]" = OrderedDict()
+        self._add_glyphs(" ")
+    
+    def _add_glyphs(self, characters: str):
+        """Rasterize new glyphs and repack the master atlas (drops the scaled atlases)."""
+        for character in characters:
+            if character not in self._glyph_images:
+                self._glyph_images[character] = self.font.render(character, False, GLYPH_PALETTE[GLYPH_INDEX])
+        
+        # Shelf packing: glyphs left to right, a new row when one is full
+        rects = {}
+        x = y = row_height = 0
+        for character, image in self._glyph_images.items():
+            width, height = image.get_size()
+            if x + width > ATLAS_WIDTH:
+                x, y, row_height = 0, y + row_height, 0
+            rects[character] = pygame.Rect(x, y, width, height)
+            x += width
+            row_height = max(row_height, height)
+        
+        width = max(rect.right for rect in rects.values())
+        master = _glyph_surface((width, y + row_height))
+        master.blits([(self._glyph_images[character], rect) for character, rect in rects.items()], doreturn=False)
+        self._glyph_rects = rects
+        self._atlases = {1: (master, rects)}
+    
+    def _atlas(self, scale: int) -> Tuple[pygame.Surface, Dict[str, pygame.Rect]]:
+        """The glyph atlas and glyph rects at a scale, built on first use."""
+        atlas = self._atlases.get(scale)
+        if atlas is None:
+            master = self._atlases[1][0]
+            surface = pygame.transform.scale(master, (master.get_width() * scale, master.get_height() * scale))
+            rects = {character: pygame.Rect(rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale)
+                     for character, rect in self._glyph_rects.items()}
+            atlas = (surface, rects)
+            self._atlases[scale] = atlas
+        return atlas
+    
+    def _compose(self, text: str, scale: int) -> pygame.Surface:
+        """Text in the glyph palette, composed from the atlas on first use."""
+        key = (text, scale)
+        surface = self._strings.get(key)
+        if surface is not None:
+            self._strings.move_to_end(key)
+            return surface
+        
+        missing = set(text).difference(self._glyph_images)
+        if missing:
+            self._add_glyphs("".join(sorted(missing)))
+        atlas, rects = self._atlas(scale)
+        
+        # A glyph ends where the prefix ending with it ends, whatever the kerning before it
+        width, height = self.font.size(text)
+        surface = _glyph_surface((width * scale, height * scale))
+        surface.blits([(atlas, ((self.font.size(text[:end])[0] - self._glyph_images[character].get_width()) * scale, 0),
+                        rects[character])
+                       for end, character in enumerate(text, 1)], doreturn=False)
+        
+        self._strings[key] = surface
+        if len(self._strings) > MAX_STRINGS:
+            self._strings.popitem(last=False)
+        return surface
+    
+    def text_size(self, text: str, scale: int = 1) -> Tuple[int, int]:
+        """Size of text drawn at a scale."""
+        return self._compose(text, scale).get_size()
+    
+    def render(self, text: str, color: tuple, scale: int = 1) -> pygame.Surface:
+        """Text in color on a new colorkeyed surface, like scaling up Font.render output."""
+        surface = self._compose(text, scale).copy()
+        surface.set_palette_at(GLYPH_INDEX, color[:3])
+        return surface
+    
+    def draw(self, surface: pygame.Surface, text: str, color: tuple, position: Tuple[int, int], scale: int = 1):
+        """Blit text onto surface with its top left at position."""
+        surface.blit(self.render(text, color, scale), position)
+
+
+def _glyph_surface(size: Tuple[int, int]) -> pygame.Surface:
+    """A blank 8-bit surface in the glyph palette, transparent until glyphs are blitted on."""
+    surface = pygame.Surface(size, 0, 8)
+    surface.set_palette(GLYPH_PALETTE)
+    surface.fill(GLYPH_PALETTE[0])
+    surface.set_colorkey(GLYPH_PALETTE[0])
+    return surface
+
+
+# Fonts are shared by every scene, one per size
+_fonts: Dict[int, BitmapFont] = {}
+
+
+def get_font(size: int) -> BitmapFont:
+    """The shared bitmap font for a size, created on first use."""
+    font = _fonts.get(size)
+    if font is None:
+        font = BitmapFont(size)
+        _fonts[size] = font
+    return font
@@ -0,0 +1,201 @@
+"""
+Capture
+Renders recorded fights headlessly into offscreen surfaces and encodes the frames in parallel.
+
+Run from the project root:
+    python -m game.capture RECORDING [RECORDING ...] [--format png|gif] [--start S] [--end S] [--jobs N]
+
+Record fights by setting RECORD_DIR in game/engine.py. Each recording is replayed
+in fixed simulation steps without a display. Frames are read out of the offscreen
+surface with pygame.surfarray as NumPy arrays and handed to a process pool. The
+pool writes numbered PNGs, or quantizes the frames of one animated GIF (GIF needs
+Pillow). Pulsing effects follow the scenes' simulated time, so a recording renders
+the same frames every time.
+"""
+
+import argparse
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Iterator, List, Optional
+
+try:
+    import numpy
+except ImportError:
+    # surfarray needs NumPy; without it there is nothing to capture
+    numpy = None
+
+try:
+    from PIL import Image
+except ImportError:
+    # Only GIF export needs Pillow
+    Image = None
+
+import pygame
+from game.draw_list import draw_list
+from game.input_handler import AIController
+from game.match_recording import MatchRecording
+
+
+# Frame rates when none is given; GIF frame delays are whole hundredths of a second
+DEFAULT_FPS = {"png": 60, "gif": 25}
+
+# Frames handed to the pool but not encoded yet, per worker
+PENDING_PER_WORKER = 4
+
+# zlib level for PNG frames: fast, and nearly as small as pygame.image.save's (about 6x slower) output
+PNG_COMPRESSION = 1
+
+
+def _init_display():
+    """Give this process a hidden display, so scenes can convert their images."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def _create_scene(name: str):
+    """A new fight scene of the recorded kind, at the game's logical resolution."""
+    from game.scenes import FightScene, Level2Scene
+    scene_class = {"fight": FightScene, "level2": Level2Scene}[name]
+    return scene_class(800, 600)
+
+
+def replay_frames(recording: MatchRecording, frame_rate: int = 60, start: float = 0.0,
+                  end: Optional[float] = None) -> Iterator["numpy.ndarray"]:
+    """Replay a recording, yielding its frames from start to end seconds as width x height x 3 arrays.
+    
+    Frames are rendered frame_rate times per second of fight time (frozen steps
+    don't count), with the fighters interpolated between steps like the game does.
+    """
+    scene = _create_scene(recording.scene)
+    random.seed(recording.seed)
+    ai_controller = AIController()
+    # Scenes drawn at a native resolution are upscaled once, like the window backend does
+    pixel_scale = getattr(scene, "pixel_scale", 1)
+    full_size = (scene.screen_width, scene.screen_height)
+    surface = pygame.Surface((scene.screen_width // pixel_scale, scene.screen_height // pixel_scale))
+    
+    step = recording.step
+    frame_time = 1.0 / frame_rate
+    fight_time = 0.0
+    next_frame = start
+    for player_input, frozen in recording.steps():
+        # Same update order as GameEngine.update, so the AI draws the same random numbers
+        scene.begin_step()
+        if recording.scene == "fight":
+            ai_input = ai_controller.update(step, scene.player2, scene.player1)
+            scene.update(0.0 if frozen else step, player_input, ai_input)
+        else:
+            scene.is_paused = frozen
+            scene.update(step, player_input, None)
+        if frozen:
+            continue
+        
+        fight_time += step
+        while next_frame <= fight_time:
+            if end is not None and next_frame > end:
+                return
+            scene.set_render_blend(1.0 - (fight_time - next_frame) / step)
+            draw_list.begin_frame()
+            surface.fill((20, 20, 30))
+            scene.render(surface)
+            frame = surface if pixel_scale == 1 else pygame.transform.scale(surface, full_size)
+            yield pygame.surfarray.array3d(frame)
+            next_frame += frame_time
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    """One PNG chunk: length, type, data and CRC."""
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def _write_png(frame: "numpy.ndarray", path: str):
+    """Encode one frame as an 8-bit RGB PNG file."""
+    width, height = frame.shape[:2]
+    # Rows of RGB pixels, each after a 0 byte (no filter)
+    rows = numpy.zeros((height, 1 + width * 3), numpy.uint8)
+    rows[:, 1:] = frame.swapaxes(0, 1).reshape(height, width * 3)
+    with open(path, "wb") as png_file:
+        png_file.write(b"\x89PNG\r\n\x1a\n")
+        png_file.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        png_file.write(_png_chunk(b"IDAT", zlib.compress(rows.tobytes(), PNG_COMPRESSION)))
+        png_file.write(_png_chunk(b"IEND", b""))
+
+
+def _quantize(frame: "numpy.ndarray") -> "Image.Image":
+    """Reduce one frame to a 256 color palette image for a GIF."""
+    return Image.fromarray(frame.swapaxes(0, 1)).quantize(256, method=Image.Quantize.FASTOCTREE)
+
+
+def capture(recording_path: str, output: str, pool: ProcessPoolExecutor, workers: int, image_format: str = "png",
+            frame_rate: Optional[int] = None, start: float = 0.0, end: Optional[float] = None) -> int:
+    """Render one recording into output (a directory of PNGs, or a GIF file), returning the frame count."""
+    frame_rate = frame_rate or DEFAULT_FPS[image_format]
+    recording = MatchRecording.load(recording_path)
+    if image_format == "png":
+        os.makedirs(output, exist_ok=True)
+    
+    # Keep a bounded number of frames in flight so memory stays flat on long recordings
+    pending: Deque[Future] = deque()
+    results = []
+    count = 0
+    for count, frame in enumerate(replay_frames(recording, frame_rate, start, end), 1):
+        if image_format == "png":
+            pending.append(pool.submit(_write_png, frame, os.path.join(output, f"frame{count:05d}.png")))
+        else:
+            pending.append(pool.submit(_quantize, frame))
+        if len(pending) > workers * PENDING_PER_WORKER:
+            results.append(pending.popleft().result())
+    results.extend(future.result() for future in pending)
+    
+    if image_format == "gif" and results:
+        results[0].save(output, save_all=True, append_images=results[1:], loop=0,
+                        duration=round(1000 / frame_rate))
+    return count
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Render recorded fights into PNG sequences or animated GIFs.")
+    parser.add_argument("recordings", nargs="+", help="recordings saved by the game (RECORD_DIR in game/engine.py)")
+    parser.add_argument("--output", default="captures", help="output directory (default: captures)")
+    parser.add_argument("--format", choices=("png", "gif"), default="png", help="PNG sequence or animated GIF")
+    parser.add_argument("--fps", type=int, default=None, help="frames per second of fight time (default: 60 PNG, 25 GIF)")
+    parser.add_argument("--start", type=float, default=0.0, help="first second of fight time to capture")
+    parser.add_argument("--end", type=float, default=None, help="last second of fight time to capture")
+    parser.add_argument("--jobs", type=int, default=None, help="encoder processes (default: all cores)")
+    args = parser.parse_args(argv)
+    
+    if numpy is None:
+        print("Capture needs NumPy for pygame.surfarray")
+        return 1
+    if args.format == "gif" and Image is None:
+        print("GIF export needs Pillow; use --format png or install Pillow")
+        return 1
+    
+    _init_display()
+    workers = args.jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path in args.recordings:
+            name = os.path.splitext(os.path.basename(path))[0]
+            output = os.path.join(args.output, name + (".gif" if args.format == "gif" else ""))
+            start = time.perf_counter()
+            try:
+                frames = capture(path, output, pool, workers, args.format, args.fps, args.start, args.end)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Could not capture {path}: {e}")
+                continue
+            elapsed = time.perf_counter() - start
+            print(f"Captured {frames} frames of {path} to {output} in {elapsed:.2f}s "
+                  f"({frames / elapsed if elapsed else 0:.0f} frames/s)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
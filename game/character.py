@@ -8,15 +8,41 @@ import os
 import random
 from typing import Tuple, Optional
 from game.input_handler import PlayerInput
-from game.sprite_system import SpriteSheet, Animation, SpriteAnimator
+from functools import partial
+from game.sprite_system import Animation, LazyAnimation, SpriteAnimator, frame_cache
+from game.animation_manifest import animation_manifest, scene_scale
+from game.draw_list import LAYER_FIGHTERS, DrawList
 from game.resource_utils import sprite_path
 
 
+def load_roster_strips(character_classes, include_lazy: bool = True, pixel_scale: int = 1, pack: bool = True) -> list:
+    """Load the sprite strips of several characters in one batch.
+    
+    Sheets shared by the roster (such as both samurai, which differ only in color)
+    are decoded once. Returns the strips in sprite_specs() order. The background
+    loader passes pack=False: the strips are packed into the atlas on first use.
+    """
+    specs = []
+    for character_class in character_classes:
+        specs.extend((sprite_path(sheet), frame_count, scale, tint, palette)
+                     for sheet, frame_count, scale, tint, palette
+                     in character_class.sprite_specs(include_lazy, pixel_scale))
+    return frame_cache.get_strips(specs, pack)
+
+
+# Health at which the death animation is prefetched
+LOW_HEALTH_PREFETCH = 30
+
+
 class Character:
     """Base character class for samurai fighters."""
     
-    def __init__(self, x: float, y: float, facing_right: bool = True, attack_sound=None, block_sound=None, pain_sound=None):
-        """Initialize character."""
+    # Entry of assets/animations.json with this character's sprites (None: fallback only)
+    sprite_set: Optional[str] = None
+    
+    def __init__(self, x: float, y: float, facing_right: bool = True, attack_sound=None, block_sound=None, pain_sound=None,
+                 pixel_scale: int = 1):
+        """Initialize character (drawn pixel_scale times smaller than the game, for native-resolution scenes)."""
         # Position and movement
         self.x = x
         self.y = y
@@ -24,6 +50,12 @@ class Character:
         self.velocity_y = 0.0
         self.facing_right = facing_right
         
+        # Position at the start of the last simulation step; rendering is
+        # render_blend of the way from there to the current position
+        self.previous_x = x
+        self.previous_y = y
+        self.render_blend = 1.0
+        
         # Character stats
         self.health = 100
         self.max_health = 100
@@ -90,6 +122,7 @@ class Character:
         self.visual_width = 32   # Visual sprite width (for rendering)
         self.visual_height = 48  # Visual sprite height (for rendering)
         self.color = (100, 100, 200)  # Fallback color
+        self.pixel_scale = pixel_scale  # Game pixels per drawn pixel; sprites are loaded that much smaller
         
         # Animation system
         self.animator = SpriteAnimator()
@@ -105,6 +138,51 @@ class Character:
         fallback_animation = Animation([fallback_surface], 0.2)
         self.animator.add_animation("idle", fallback_animation)
     
+    @classmethod
+    def sprite_specs(cls, include_lazy: bool = True, pixel_scale: int = 1) -> list:
+        """Sprite strips loaded by load_sprites as (sheet, frame count, scale, tint, palette)."""
+        if cls.sprite_set is None:
+            return []
+        return animation_manifest.sprite_specs(cls.sprite_set, include_lazy, pixel_scale)
+    
+    def _load_sprite_set(self) -> dict:
+        """Load every animation of this character's manifest entry and return the entry.
+        
+        Eager animations are loaded in one batch; lazy ones load on first play.
+        """
+        entry = animation_manifest.character(self.sprite_set)
+        eager_names = [name for name, spec in entry["animations"].items() if not spec.get("lazy", False)]
+        strips = dict(zip(eager_names, load_roster_strips([type(self)], include_lazy=False,
+                                                          pixel_scale=self.pixel_scale)))
+        scale = scene_scale(entry["scale"], self.pixel_scale)
+        for name, spec in entry["animations"].items():
+            if name in strips:
+                strip = strips[name]
+                animation = Animation(strip.frames, spec["duration"], strip.offsets, strip.cell_size)
+            else:
+                strip_spec = (sprite_path(spec["sheet"]), spec["frames"], scale, entry.get("tint"), entry["palette"])
+                animation = LazyAnimation(partial(frame_cache.get_strip, *strip_spec), spec["duration"],
+                                          partial(frame_cache.discard, *strip_spec))
+            animation.loop = spec.get("loop", True)
+            self.animator.add_animation(name, animation)
+            if "hit_frame" in spec:
+                # attack -> attack_hit_frame, special_attack -> special_attack_hit_frame
+                setattr(self, f"{name}_hit_frame", spec["hit_frame"])
+        
+        # Reuse existing animations for states without dedicated sprites
+        for alias, target in entry["aliases"].items():
+            self.animator.add_animation(alias, self.animator.animations[target])
+        return entry
+    
+    def prefetch_reactions(self, opponent: "Character"):
+        """Prefetch the (lazy) animations the fight is likely to need next."""
+        if opponent.is_attacking or opponent.is_special_attacking:
+            # Getting hit, or parrying and stunning the attacker
+            self.animator.prefetch("hit")
+            opponent.animator.prefetch("stun")
+        if self.health <= LOW_HEALTH_PREFETCH:
+            self.animator.prefetch("dead")
+    
     def update(self, dt: float, player_input: PlayerInput):
         """Update character state."""
         # Don't process input or physics if dead
@@ -136,7 +214,7 @@ class Character:
         
         # Update animations
         self._update_animations(dt)
-
+    
     # Added simple attack API used by AI opponents
     def attack(self):
         """Start a normal attack sequence if not cooling down."""
@@ -150,7 +228,7 @@ class Character:
         self.animator.play_animation("attack", True)
         if self.attack_sound:
             self.attack_sound.play()
-
+    
     def special_attack(self):
         """Start a special attack if not cooling down."""
         if self.is_dead or self.is_special_attacking or self.special_attack_cooldown > 0:
@@ -351,19 +429,19 @@ class Character:
                 self.is_special_attacking = False
                 # Start cooldown when special attack finishes
                 self.special_attack_cooldown = self.special_attack_cooldown_time
-
+        
         # Cooldowns tick down
         if self.attack_cooldown > 0:
             self.attack_cooldown = max(0.0, self.attack_cooldown - dt)
         if self.special_attack_cooldown > 0:
             self.special_attack_cooldown = max(0.0, self.special_attack_cooldown - dt)
-
+        
         # Stamina regeneration and block timer
         if not self.is_blocking and not self.is_stunned and self.stamina < self.max_stamina:
             self.stamina = min(self.max_stamina, self.stamina + self.stamina_regen_rate * dt)
         if not self.is_blocking:
             self.last_block_time += dt
-
+    
     # Exposed helper for scenes/AI: enter stun state
     def start_stun(self, duration: Optional[float] = None):
         """Put character into stunned state for a duration."""
@@ -434,7 +512,7 @@ class Character:
                 is_effective_block = True  # Facing right, attacker is to the right
             elif not self.facing_right and attacker_x < self.x:
                 is_effective_block = True  # Facing left, attacker is to the left
-
+        
         if is_effective_block:
             # Attack was blocked - play block sound
             if self.block_sound:
@@ -509,488 +587,113 @@ class Character:
         """Get character collision rectangle."""
         return pygame.Rect(self.x, self.y, self.width, self.height)
     
-    def render(self, surface: pygame.Surface):
-        """Render the character."""
-        # Get current sprite frame
-        current_frame = self.animator.get_current_frame()
-        
-        # Apply horizontal flip if character is facing left
-        if not self.facing_right:
-            current_frame = pygame.transform.flip(current_frame, True, False)
-        
-        # Calculate render position (center the visual sprite on character hitbox position)
-        render_x = self.x - (current_frame.get_width() - self.width) // 2
-        render_y = self.y - (current_frame.get_height() - self.height) // 2
-        
-        # Render sprite
-        surface.blit(current_frame, (render_x, render_y))
+    def store_position(self):
+        """Remember the current position as the one rendering interpolates from."""
+        self.previous_x = self.x
+        self.previous_y = self.y
+    
+    def draw_position(self) -> Tuple[float, float]:
+        """Where to draw the character, between the last two simulation steps."""
+        behind = 1.0 - self.render_blend  # Exactly the current position at a blend of 1
+        return (self.x - (self.x - self.previous_x) * behind,
+                self.y - (self.y - self.previous_y) * behind)
+    
+    def render(self, draw_list: DrawList):
+        """Submit the character's current frame (culled by the draw list when off screen)."""
+        # Get current sprite frame (pre-mirrored if character is facing left)
+        flipped = not self.facing_right
+        current_frame = self.animator.get_current_frame(flipped=flipped)
+        offset_x, offset_y = self.animator.get_current_offset(flipped=flipped)
+        cell_width, cell_height = self.animator.get_cell_size()
+        
+        # Calculate render position (center the visual sprite cell on character hitbox position)
+        x, y = self.draw_position()
+        render_x = x / self.pixel_scale - (cell_width - self.width // self.pixel_scale) // 2
+        render_y = y / self.pixel_scale - (cell_height - self.height // self.pixel_scale) // 2
+        
+        # Render the trimmed sprite at its place inside the cell
+        self._submit_frame(draw_list, current_frame, (int(render_x) + offset_x, int(render_y) + offset_y), flipped)
+    
+    def _submit_frame(self, draw_list: DrawList, frame: pygame.Surface, position: tuple, flipped: bool):
+        """Submit the current frame, with the upright frame for the GPU renderer to mirror."""
+        upright = self.animator.get_current_frame(flipped=False) if flipped else None
+        draw_list.submit(frame, position, LAYER_FIGHTERS, mirror=upright)
 
 
 class Samurai1(Character):
     """First samurai character (blue) - Player character with sprites."""
     
-    def __init__(self, x: float, y: float, attack_sound=None, block_sound=None, pain_sound=None):
-        super().__init__(x, y, facing_right=True, attack_sound=attack_sound, block_sound=block_sound, pain_sound=pain_sound)
+    sprite_set = "samurai"
+    
+    def __init__(self, x: float, y: float, attack_sound=None, block_sound=None, pain_sound=None, pixel_scale: int = 1):
+        super().__init__(x, y, facing_right=True, attack_sound=attack_sound, block_sound=block_sound, pain_sound=pain_sound,
+                         pixel_scale=pixel_scale)
         self.color = (100, 100, 255)  # Blue fallback
         self.speed = 250.0  # Player is faster than base speed (was 200.0)
     
     def load_sprites(self):
         """Load samurai sprites."""
-        # Path to sprites
-        idle_path = sprite_path("Idle.png")
-        attack_path = sprite_path("Attack1.png")
-        run_path = sprite_path("Run.png")
-        
-        # Character scale factor (2x bigger)
-        scale_factor = 2
-        
         try:
-            # Load idle sprite sheet
-            idle_sheet = SpriteSheet(idle_path)
-            
-            # Extract 8 frames from the idle sprite sheet
-            # Assuming each frame is 32 pixels wide and the sheet height is the frame height
-            frame_width = idle_sheet.width // 8  # 8 frames horizontally
-            frame_height = idle_sheet.height
-            
-            idle_frames_raw = idle_sheet.get_frames(frame_width, frame_height, 8, 0)
-            # Scale frames to 2x size
-            idle_frames = [pygame.transform.scale(frame, (frame_width * scale_factor, frame_height * scale_factor)) for frame in idle_frames_raw]
-            idle_animation = Animation(idle_frames, 0.15)  # 0.15 seconds per frame
-            
-            self.animator.add_animation("idle", idle_animation)
-            
-            # Update visual dimensions based on scaled sprite (hitbox stays 32x48)
-            if idle_frames:
-                self.visual_width = frame_width * scale_factor
-                self.visual_height = frame_height * scale_factor
-            
-            print(f"Loaded idle animation with {len(idle_frames)} frames (visual: {self.visual_width}x{self.visual_height}, hitbox: {self.width}x{self.height})")
-            
-            # Load attack sprite sheet
-            attack_sheet = SpriteSheet(attack_path)
-            
-            # Attack1.png has 6 frames
-            attack_frame_count = 6
-            attack_frame_width = attack_sheet.width // attack_frame_count
-            attack_frame_height = attack_sheet.height
+            for name in self._load_sprite_set()["animations"]:
+                animation = self.animator.animations[name]
+                if isinstance(animation, LazyAnimation):
+                    print(f"Deferred {name} animation until first use")
+                    continue
+                frame_w, frame_h = animation.cell_size
+                print(f"Loaded {name} animation with {len(animation.frames)} frames ({frame_w}x{frame_h})")
             
-            attack_frames_raw = attack_sheet.get_frames(attack_frame_width, attack_frame_height, attack_frame_count, 0)
-            # Scale attack frames to 2x size
-            attack_frames = [pygame.transform.scale(frame, (attack_frame_width * scale_factor, attack_frame_height * scale_factor)) for frame in attack_frames_raw]
-            # Attack animation should be faster and not loop
-            attack_animation = Animation(attack_frames, 0.08)  # 0.08 seconds per frame
-            attack_animation.loop = False  # Don't loop attack animation
-            
-            self.animator.add_animation("attack", attack_animation)
-            
-            print(f"Loaded attack animation with {len(attack_frames)} frames ({attack_frame_width * scale_factor}x{attack_frame_height * scale_factor})")
-            
-            # Load special attack sprite sheet (Attack2.png)
-            special_attack_path = sprite_path("Attack2.png")
-            special_attack_sheet = SpriteSheet(special_attack_path)
-            
-            # Attack2.png has 6 frames
-            special_attack_frame_count = 6
-            special_attack_frame_width = special_attack_sheet.width // special_attack_frame_count
-            special_attack_frame_height = special_attack_sheet.height
-            
-            special_attack_frames_raw = special_attack_sheet.get_frames(special_attack_frame_width, special_attack_frame_height, special_attack_frame_count, 0)
-            # Scale special attack frames to 2x size
-            special_attack_frames = [pygame.transform.scale(frame, (special_attack_frame_width * scale_factor, special_attack_frame_height * scale_factor)) for frame in special_attack_frames_raw]
-            # Special attack animation should be slower and not loop
-            special_attack_animation = Animation(special_attack_frames, 0.12)  # 0.12 seconds per frame (slower than regular attack)
-            special_attack_animation.loop = False  # Don't loop special attack animation
-            
-            self.animator.add_animation("special_attack", special_attack_animation)
-            
-            print(f"Loaded special attack animation with {len(special_attack_frames)} frames ({special_attack_frame_width * scale_factor}x{special_attack_frame_height * scale_factor})")
-            
-            # Load run sprite sheet
-            run_sheet = SpriteSheet(run_path)
-            
-            # Run.png has 8 frames
-            run_frame_count = 8
-            run_frame_width = run_sheet.width // run_frame_count
-            run_frame_height = run_sheet.height
-            
-            run_frames_raw = run_sheet.get_frames(run_frame_width, run_frame_height, run_frame_count, 0)
-            # Scale run frames to 2x size
-            run_frames = [pygame.transform.scale(frame, (run_frame_width * scale_factor, run_frame_height * scale_factor)) for frame in run_frames_raw]
-            run_animation = Animation(run_frames, 0.1)  # 0.1 seconds per frame for smooth running
-            
-            self.animator.add_animation("walk", run_animation)
-            
-            print(f"Loaded run animation with {len(run_frames)} frames ({run_frame_width * scale_factor}x{run_frame_height * scale_factor})")
-            
-            # Load death sprite sheet
-            death_path = sprite_path("Death.png")
-            death_sheet = SpriteSheet(death_path)
-            
-            # Death.png has 6 frames
-            death_frame_count = 6
-            death_frame_width = death_sheet.width // death_frame_count
-            death_frame_height = death_sheet.height
-            
-            death_frames_raw = death_sheet.get_frames(death_frame_width, death_frame_height, death_frame_count, 0)
-            # Scale death frames to 2x size
-            death_frames = [pygame.transform.scale(frame, (death_frame_width * scale_factor, death_frame_height * scale_factor)) for frame in death_frames_raw]
-            death_animation = Animation(death_frames, 0.15)  # 0.15 seconds per frame
-            death_animation.loop = False  # Don't loop death animation
-            
-            self.animator.add_animation("dead", death_animation)
-            
-            print(f"Loaded death animation with {len(death_frames)} frames ({death_frame_width * scale_factor}x{death_frame_height * scale_factor})")
-            
-            # Load hit sprite sheet
-            hit_path = sprite_path("Take Hit.png")
-            hit_sheet = SpriteSheet(hit_path)
-            
-            # Take Hit.png - need to determine frame count (checking common counts)
-            # Most sprite sheets have 4-6 frames for hit animations
-            hit_frame_count = 4  # Starting with 4, will adjust if needed
-            if hit_sheet.width % 4 == 0:
-                hit_frame_count = 4
-            elif hit_sheet.width % 3 == 0:
-                hit_frame_count = 3
-            elif hit_sheet.width % 5 == 0:
-                hit_frame_count = 5
-            elif hit_sheet.width % 6 == 0:
-                hit_frame_count = 6
-                
-            hit_frame_width = hit_sheet.width // hit_frame_count
-            hit_frame_height = hit_sheet.height
-            
-            hit_frames_raw = hit_sheet.get_frames(hit_frame_width, hit_frame_height, hit_frame_count, 0)
-            # Scale hit frames to 2x size
-            hit_frames = [pygame.transform.scale(frame, (hit_frame_width * scale_factor, hit_frame_height * scale_factor)) for frame in hit_frames_raw]
-            hit_animation = Animation(hit_frames, 0.1)  # 0.1 seconds per frame for quick hit reaction
-            hit_animation.loop = False  # Don't loop hit animation
-            
-            self.animator.add_animation("hit", hit_animation)
-            
-            print(f"Loaded hit animation with {len(hit_frames)} frames ({hit_frame_width * scale_factor}x{hit_frame_height * scale_factor})")
-            
-            # Load stun sprite sheet (white silhouette)
-            stun_path = sprite_path("Take Hit - white silhouette.png")
-            stun_sheet = SpriteSheet(stun_path)
-            
-            # Take Hit - white silhouette.png has 4 frames
-            stun_frame_count = 4
-            stun_frame_width = stun_sheet.width // stun_frame_count
-            stun_frame_height = stun_sheet.height
-            
-            stun_frames_raw = stun_sheet.get_frames(stun_frame_width, stun_frame_height, stun_frame_count, 0)
-            # Scale stun frames to 2x size
-            stun_frames = [pygame.transform.scale(frame, (stun_frame_width * scale_factor, stun_frame_height * scale_factor)) for frame in stun_frames_raw]
-            stun_animation = Animation(stun_frames, 0.2)  # 0.2 seconds per frame for stun effect
-            stun_animation.loop = True  # Loop stun animation while stunned
-            
-            self.animator.add_animation("stun", stun_animation)
-            
-            print(f"Loaded stun animation with {len(stun_frames)} frames ({stun_frame_width * scale_factor}x{stun_frame_height * scale_factor})")
-            
-            # Load jump sprite sheet
-            jump_path = sprite_path("Jump.png")
-            jump_sheet = SpriteSheet(jump_path)
-            
-            # Jump.png has 2 frames (400x200 = 2 frames of 200x200 each)
-            jump_frame_count = 2
-            jump_frame_width = jump_sheet.width // jump_frame_count
-            jump_frame_height = jump_sheet.height
-            
-            jump_frames_raw = jump_sheet.get_frames(jump_frame_width, jump_frame_height, jump_frame_count, 0)
-            # Scale jump frames to 2x size
-            jump_frames = [pygame.transform.scale(frame, (jump_frame_width * scale_factor, jump_frame_height * scale_factor)) for frame in jump_frames_raw]
-            jump_animation = Animation(jump_frames, 0.15)  # 0.15 seconds per frame for smooth jumping
-            jump_animation.loop = False  # Don't loop jump animation
-            
-            self.animator.add_animation("jump", jump_animation)
-            
-            print(f"Loaded jump animation with {len(jump_frames)} frames ({jump_frame_width * scale_factor}x{jump_frame_height * scale_factor})")
+            # Update visual dimensions based on scaled sprite (hitbox stays 100x100)
+            self.visual_width, self.visual_height = self.animator.animations["idle"].cell_size
             
         except Exception as e:
             print(f"Could not load sprites: {e}")
             # Use fallback animation
             super().load_sprites()
-        
-        # Use idle animation for other states that don't have dedicated sprites yet
-        if "idle" in self.animator.animations:
-            idle_anim = self.animator.animations["idle"]
-            self.animator.add_animation("block", idle_anim)
 
 
 class Samurai2(Character):
     """Second samurai character (red) - AI opponent."""
     
-    def __init__(self, x: float, y: float, attack_sound=None, block_sound=None, pain_sound=None):
-        super().__init__(x, y, facing_right=False, attack_sound=attack_sound, block_sound=block_sound, pain_sound=pain_sound)
+    sprite_set = "samurai_ai"
+    
+    def __init__(self, x: float, y: float, attack_sound=None, block_sound=None, pain_sound=None, pixel_scale: int = 1):
+        super().__init__(x, y, facing_right=False, attack_sound=attack_sound, block_sound=block_sound, pain_sound=pain_sound,
+                         pixel_scale=pixel_scale)
         self.color = (255, 100, 100)  # Red fallback
         self.speed = 180.0  # AI is slower than base speed (was 200.0)
     
     def load_sprites(self):
-        """Load samurai sprites (same as player for now)."""
-        # Path to sprites
-        idle_path = sprite_path("Idle.png")
-        attack_path = sprite_path("Attack1.png")
-        run_path = sprite_path("Run.png")
-        
-        # Character scale factor (2x bigger)
-        scale_factor = 2
-        
+        """Load samurai sprites (same as player, with a red tint)."""
         try:
-            # Load idle sprite sheet
-            idle_sheet = SpriteSheet(idle_path)
-            
-            # Extract 8 frames from the idle sprite sheet
-            frame_width = idle_sheet.width // 8  # 8 frames horizontally
-            frame_height = idle_sheet.height
-            
-            idle_frames_raw = idle_sheet.get_frames(frame_width, frame_height, 8, 0)
-            
-            # Apply red tint and scale to make AI character different
-            tinted_idle_frames = []
-            for frame in idle_frames_raw:
-                # Scale frame to 2x size first
-                scaled_frame = pygame.transform.scale(frame, (frame_width * scale_factor, frame_height * scale_factor))
-                # Apply red overlay
-                red_overlay = pygame.Surface(scaled_frame.get_size(), pygame.SRCALPHA)
-                red_overlay.fill((255, 100, 100, 50))  # Light red with transparency
-                scaled_frame.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
-                tinted_idle_frames.append(scaled_frame)
-            
-            idle_animation = Animation(tinted_idle_frames, 0.15)
-            self.animator.add_animation("idle", idle_animation)
-            
-            # Update visual dimensions based on scaled sprite (hitbox stays 32x48)
-            if tinted_idle_frames:
-                self.visual_width = frame_width * scale_factor
-                self.visual_height = frame_height * scale_factor
-            
-            print(f"Loaded AI idle animation with {len(tinted_idle_frames)} frames (visual: {self.visual_width}x{self.visual_height}, hitbox: {self.width}x{self.height})")
-            
-            # Load attack sprite sheet
-            attack_sheet = SpriteSheet(attack_path)
-            
-            # Attack1.png has 6 frames
-            attack_frame_count = 6
-            attack_frame_width = attack_sheet.width // attack_frame_count
-            attack_frame_height = attack_sheet.height
-            
-            attack_frames_raw = attack_sheet.get_frames(attack_frame_width, attack_frame_height, attack_frame_count, 0)
-            
-            # Apply red tint and scale to attack frames
-            tinted_attack_frames = []
-            for frame in attack_frames_raw:
-                # Scale frame to 2x size first
-                scaled_frame = pygame.transform.scale(frame, (attack_frame_width * scale_factor, attack_frame_height * scale_factor))
-                # Apply red overlay
-                red_overlay = pygame.Surface(scaled_frame.get_size(), pygame.SRCALPHA)
-                red_overlay.fill((255, 100, 100, 50))
-                scaled_frame.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
-                tinted_attack_frames.append(scaled_frame)
-            
-            attack_animation = Animation(tinted_attack_frames, 0.08)
-            attack_animation.loop = False
-            self.animator.add_animation("attack", attack_animation)
-            
-            print(f"Loaded AI attack animation with {len(tinted_attack_frames)} frames ({attack_frame_width * scale_factor}x{attack_frame_height * scale_factor})")
-            
-            # Load special attack sprite sheet (Attack2.png)
-            special_attack_path = sprite_path("Attack2.png")
-            special_attack_sheet = SpriteSheet(special_attack_path)
-            
-            # Attack2.png has 6 frames
-            special_attack_frame_count = 6
-            special_attack_frame_width = special_attack_sheet.width // special_attack_frame_count
-            special_attack_frame_height = special_attack_sheet.height
-            
-            special_attack_frames_raw = special_attack_sheet.get_frames(special_attack_frame_width, special_attack_frame_height, special_attack_frame_count, 0)
-            
-            # Apply red tint and scale to special attack frames
-            tinted_special_attack_frames = []
-            for frame in special_attack_frames_raw:
-                # Scale frame to 2x size first
-                scaled_frame = pygame.transform.scale(frame, (special_attack_frame_width * scale_factor, special_attack_frame_height * scale_factor))
-                # Apply red overlay
-                red_overlay = pygame.Surface(scaled_frame.get_size(), pygame.SRCALPHA)
-                red_overlay.fill((255, 100, 100, 50))
-                scaled_frame.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
-                tinted_special_attack_frames.append(scaled_frame)
-            
-            special_attack_animation = Animation(tinted_special_attack_frames, 0.12)  # 0.12 seconds per frame (slower)
-            special_attack_animation.loop = False
-            self.animator.add_animation("special_attack", special_attack_animation)
-            
-            print(f"Loaded AI special attack animation with {len(tinted_special_attack_frames)} frames ({special_attack_frame_width * scale_factor}x{special_attack_frame_height * scale_factor})")
-            
-            # Load run sprite sheet
-            run_sheet = SpriteSheet(run_path)
-            
-            # Run.png has 8 frames
-            run_frame_count = 8
-            run_frame_width = run_sheet.width // run_frame_count
-            run_frame_height = run_sheet.height
-            
-            run_frames_raw = run_sheet.get_frames(run_frame_width, run_frame_height, run_frame_count, 0)
-            
-            # Apply red tint and scale to run frames
-            tinted_run_frames = []
-            for frame in run_frames_raw:
-                # Scale frame to 2x size first
-                scaled_frame = pygame.transform.scale(frame, (run_frame_width * scale_factor, run_frame_height * scale_factor))
-                # Apply red overlay
-                red_overlay = pygame.Surface(scaled_frame.get_size(), pygame.SRCALPHA)
-                red_overlay.fill((255, 100, 100, 50))
-                scaled_frame.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
-                tinted_run_frames.append(scaled_frame)
-            
-            run_animation = Animation(tinted_run_frames, 0.1)
-            self.animator.add_animation("walk", run_animation)
-            
-            print(f"Loaded AI run animation with {len(tinted_run_frames)} frames ({run_frame_width * scale_factor}x{run_frame_height * scale_factor})")
-            
-            # Load death sprite sheet
-            death_path = sprite_path("Death.png")
-            death_sheet = SpriteSheet(death_path)
-            
-            # Death.png has 6 frames
-            death_frame_count = 6
-            death_frame_width = death_sheet.width // death_frame_count
-            death_frame_height = death_sheet.height
-            
-            death_frames_raw = death_sheet.get_frames(death_frame_width, death_frame_height, death_frame_count, 0)
-            
-            # Apply red tint and scale to death frames
-            tinted_death_frames = []
-            for frame in death_frames_raw:
-                # Scale frame to 2x size first
-                scaled_frame = pygame.transform.scale(frame, (death_frame_width * scale_factor, death_frame_height * scale_factor))
-                # Apply red overlay
-                red_overlay = pygame.Surface(scaled_frame.get_size(), pygame.SRCALPHA)
-                red_overlay.fill((255, 100, 100, 50))
-                scaled_frame.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
-                tinted_death_frames.append(scaled_frame)
-            
-            death_animation = Animation(tinted_death_frames, 0.15)
-            death_animation.loop = False
-            self.animator.add_animation("dead", death_animation)
-            
-            print(f"Loaded AI death animation with {len(tinted_death_frames)} frames ({death_frame_width * scale_factor}x{death_frame_height * scale_factor})")
-            
-            # Load hit sprite sheet
-            hit_path = sprite_path("Take Hit.png")
-            hit_sheet = SpriteSheet(hit_path)
-            
-            # Take Hit.png - determine frame count
-            hit_frame_count = 4  # Starting with 4, will adjust if needed
-            if hit_sheet.width % 4 == 0:
-                hit_frame_count = 4
-            elif hit_sheet.width % 3 == 0:
-                hit_frame_count = 3
-            elif hit_sheet.width % 5 == 0:
-                hit_frame_count = 5
-            elif hit_sheet.width % 6 == 0:
-                hit_frame_count = 6
-                
-            hit_frame_width = hit_sheet.width // hit_frame_count
-            hit_frame_height = hit_sheet.height
-            
-            hit_frames_raw = hit_sheet.get_frames(hit_frame_width, hit_frame_height, hit_frame_count, 0)
-            
-            # Apply red tint and scale to hit frames
-            tinted_hit_frames = []
-            for frame in hit_frames_raw:
-                # Scale frame to 2x size first
-                scaled_frame = pygame.transform.scale(frame, (hit_frame_width * scale_factor, hit_frame_height * scale_factor))
-                # Apply red overlay
-                red_overlay = pygame.Surface(scaled_frame.get_size(), pygame.SRCALPHA)
-                red_overlay.fill((255, 100, 100, 50))
-                scaled_frame.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
-                tinted_hit_frames.append(scaled_frame)
-            
-            hit_animation = Animation(tinted_hit_frames, 0.1)
-            hit_animation.loop = False
-            self.animator.add_animation("hit", hit_animation)
-            
-            print(f"Loaded AI hit animation with {len(tinted_hit_frames)} frames ({hit_frame_width * scale_factor}x{hit_frame_height * scale_factor})")
-            
-            # Load stun sprite sheet (white silhouette)
-            stun_path = sprite_path("Take Hit - white silhouette.png")
-            stun_sheet = SpriteSheet(stun_path)
+            for name in self._load_sprite_set()["animations"]:
+                animation = self.animator.animations[name]
+                if isinstance(animation, LazyAnimation):
+                    print(f"Deferred AI {name} animation until first use")
+                    continue
+                frame_w, frame_h = animation.cell_size
+                print(f"Loaded AI {name} animation with {len(animation.frames)} frames ({frame_w}x{frame_h})")
             
-            # Take Hit - white silhouette.png has 4 frames
-            stun_frame_count = 4
-            stun_frame_width = stun_sheet.width // stun_frame_count
-            stun_frame_height = stun_sheet.height
-            
-            stun_frames_raw = stun_sheet.get_frames(stun_frame_width, stun_frame_height, stun_frame_count, 0)
-            
-            # Apply red tint and scale to stun frames (to differentiate AI)
-            tinted_stun_frames = []
-            for frame in stun_frames_raw:
-                # Scale frame to 2x size first
-                scaled_frame = pygame.transform.scale(frame, (stun_frame_width * scale_factor, stun_frame_height * scale_factor))
-                # Apply red overlay
-                red_overlay = pygame.Surface(scaled_frame.get_size(), pygame.SRCALPHA)
-                red_overlay.fill((255, 100, 100, 50))
-                scaled_frame.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
-                tinted_stun_frames.append(scaled_frame)
-            
-            stun_animation = Animation(tinted_stun_frames, 0.2)  # 0.2 seconds per frame for stun effect
-            stun_animation.loop = True  # Loop stun animation while stunned
-            self.animator.add_animation("stun", stun_animation)
-            
-            print(f"Loaded AI stun animation with {len(tinted_stun_frames)} frames ({stun_frame_width * scale_factor}x{stun_frame_height * scale_factor})")
-            
-            # Load jump sprite sheet
-            jump_path = sprite_path("Jump.png")
-            jump_sheet = SpriteSheet(jump_path)
-            
-            # Jump.png has 2 frames (400x200 = 2 frames of 200x200 each)
-            jump_frame_count = 2
-            jump_frame_width = jump_sheet.width // jump_frame_count
-            jump_frame_height = jump_sheet.height
-            
-            jump_frames_raw = jump_sheet.get_frames(jump_frame_width, jump_frame_height, jump_frame_count, 0)
-            
-            # Apply red tint and scale to jump frames
-            tinted_jump_frames = []
-            for frame in jump_frames_raw:
-                # Scale frame to 2x size first
-                scaled_frame = pygame.transform.scale(frame, (jump_frame_width * scale_factor, jump_frame_height * scale_factor))
-                # Apply red overlay
-                red_overlay = pygame.Surface(scaled_frame.get_size(), pygame.SRCALPHA)
-                red_overlay.fill((255, 100, 100, 50))
-                scaled_frame.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
-                tinted_jump_frames.append(scaled_frame)
-            
-            jump_animation = Animation(tinted_jump_frames, 0.15)
-            jump_animation.loop = False
-            self.animator.add_animation("jump", jump_animation)
-            
-            print(f"Loaded AI jump animation with {len(tinted_jump_frames)} frames ({jump_frame_width * scale_factor}x{jump_frame_height * scale_factor})")
+            # Update visual dimensions based on scaled sprite (hitbox stays 100x100)
+            self.visual_width, self.visual_height = self.animator.animations["idle"].cell_size
             
         except Exception as e:
             print(f"Could not load AI sprites: {e}")
             # Use fallback animation
             super().load_sprites()
-        
-        # Use idle animation for other states
-        if "idle" in self.animator.animations:
-            idle_anim = self.animator.animations["idle"]
-            self.animator.add_animation("block", idle_anim)
 
 
 class YellowNinja(Character):
     """Yellow Ninja enemy with sprite animations and AI behavior."""
     
-    def __init__(self, x: float, y: float, attack_sound=None, block_sound=None, pain_sound=None):
+    sprite_set = "yellow_ninja"
+    
+    def __init__(self, x: float, y: float, attack_sound=None, block_sound=None, pain_sound=None, pixel_scale: int = 1):
         """Initialize Yellow Ninja enemy."""
-        # Set sprite_scale BEFORE calling super().__init__ to ensure it's available for load_sprites()
-        self.sprite_scale = 2.25  # Slightly larger than player
+        # Additional render offset to align feet to ground (computed by load_sprites)
+        self.sprite_y_offset = 0
         
-        super().__init__(x, y, facing_right=False, attack_sound=attack_sound, block_sound=block_sound, pain_sound=pain_sound)
+        super().__init__(x, y, facing_right=False, attack_sound=attack_sound, block_sound=block_sound, pain_sound=pain_sound,
+                         pixel_scale=pixel_scale)
         
         # Yellow Ninja appearance
         self.color = (255, 255, 0)  # Yellow fallback
@@ -1008,12 +711,6 @@ class YellowNinja(Character):
         # Special attacks
         self.special_attack_cooldown = 0.0
         self.special_attack_cooldown_time = 8.0  # Faster special attack cooldown
-        
-        # Additional render offset to align feet to ground
-        self.sprite_y_offset = 0
-
-        # Load Yellow Ninja sprites
-        self.load_sprites()
     
     def load_sprites(self):
         """Load Yellow Ninja sprite animations."""
@@ -1021,92 +718,30 @@ class YellowNinja(Character):
             # Initialize sprite animator
             self.animator = SpriteAnimator()
             
-            # Load sprite sheets for Yellow Ninja
-            idle_sheet = SpriteSheet(sprite_path("YellowNinja/yellowNinja - idle.png"))
-            walk_sheet = SpriteSheet(sprite_path("YellowNinja/yellowNinja - walk.png"))
-            attack_sheet = SpriteSheet(sprite_path("YellowNinja/yellowNinja - attack.png"))
-            hit_sheet = SpriteSheet(sprite_path("YellowNinja/yellowNinja - hit.png"))
-            death_sheet = SpriteSheet(sprite_path("YellowNinja/yellowNinja - Death.png"))
-            
-            # Use the correct frame counts provided by user
-            idle_frames = 8
-            walk_frames = 10
-            attack_frames = 20
-            hit_frames = 4
-            death_frames = 14
-            
-            print(f"Yellow Ninja loading sprites with frame counts: idle={idle_frames}, walk={walk_frames}, attack={attack_frames}, hit={hit_frames}, death={death_frames}")
-            
-            # Match the player's dynamic slicing approach
-            # Determine per-frame dimensions from sheet sizes
-            idle_w = idle_sheet.width // idle_frames
-            idle_h = idle_sheet.height
-            walk_w = walk_sheet.width // walk_frames
-            walk_h = walk_sheet.height
-            attack_w = attack_sheet.width // attack_frames
-            attack_h = attack_sheet.height
-            hit_w = hit_sheet.width // hit_frames
-            hit_h = hit_sheet.height
-            death_w = death_sheet.width // death_frames
-            death_h = death_sheet.height
-            
-            idle_frames_list_raw = idle_sheet.get_frames(idle_w, idle_h, idle_frames, 0)
-            walk_frames_list_raw = walk_sheet.get_frames(walk_w, walk_h, walk_frames, 0)
-            attack_frames_list_raw = attack_sheet.get_frames(attack_w, attack_h, attack_frames, 0)
-            hit_frames_list_raw = hit_sheet.get_frames(hit_w, hit_h, hit_frames, 0)
-            death_frames_list_raw = death_sheet.get_frames(death_w, death_h, death_frames, 0)
-            
-            # Scale factor: slightly larger than player
-            scale_factor = self.sprite_scale
-            def scale(frames, fw, fh):
-                return [
-                    pygame.transform.scale(frame, (int(fw * scale_factor), int(fh * scale_factor)))
-                    for frame in frames
-                ]
-            
-            idle_frames_list = scale(idle_frames_list_raw, idle_w, idle_h)
-            walk_frames_list = scale(walk_frames_list_raw, walk_w, walk_h)
-            attack_frames_list = scale(attack_frames_list_raw, attack_w, attack_h)
-            hit_frames_list = scale(hit_frames_list_raw, hit_w, hit_h)
-            death_frames_list = scale(death_frames_list_raw, death_w, death_h)
-            
-            # Update YellowNinja visual dimensions (hitbox stays 32x48)
-            if idle_frames_list:
-                self.visual_width = int(idle_w * scale_factor)
-                self.visual_height = int(idle_h * scale_factor)
+            # Animation timing aligned with Character timers
+            # - Attack duration in Character is 0.48s → 20 frames => 0.024s/frame
+            # - Hit duration is 0.4s → 4 frames => 0.1s/frame
+            self._load_sprite_set()
+            animations = self.animator.animations
+            
+            # Update YellowNinja visual dimensions (hitbox stays 100x100)
+            idle_animation = animations["idle"]
+            if idle_animation.frames:
+                test_frame = idle_animation.frames[0]
+                self.visual_width, self.visual_height = idle_animation.cell_size
                 # Compute baseline offset so visible feet (bbox.bottom) align to collision bottom
-                test_frame = idle_frames_list[0]
                 try:
-                    bbox = test_frame.get_bounding_rect(min_alpha=1)
-                    frame_h = test_frame.get_height()
-                    bottom_padding = frame_h - bbox.bottom  # transparent pixels below the visible feet
+                    # Frames are already trimmed to their bounding rect, placed by their offset
+                    bbox_bottom = idle_animation.offsets[0][1] + test_frame.get_height()
+                    frame_h = idle_animation.cell_size[1]
+                    bottom_padding = frame_h - bbox_bottom  # transparent pixels below the visible feet
                     # Base anchor puts sprite bottom (frame_h) below collision bottom by (frame_h - self.height)/2.
                     # We add an offset so bbox.bottom sits on collision bottom:
                     # offset = bottom_padding - (frame_h - self.height)/2
-                    self.sprite_y_offset = int(bottom_padding - (frame_h - self.height) / 2)
+                    self.sprite_y_offset = int(bottom_padding - (frame_h - self.height // self.pixel_scale) / 2)
                 except Exception:
                     self.sprite_y_offset = 0
             
-            # Animation timing aligned with Character timers
-            # - Attack duration in Character is 0.48s → 20 frames => 0.024s/frame
-            # - Hit duration is 0.4s → 4 frames => 0.1s/frame
-            idle_anim = Animation(idle_frames_list, 0.15)
-            walk_anim = Animation(walk_frames_list, 0.10)
-            attack_anim = Animation(attack_frames_list, 0.024); attack_anim.loop = False
-            hit_anim = Animation(hit_frames_list, 0.10); hit_anim.loop = False
-            death_anim = Animation(death_frames_list, 0.12); death_anim.loop = False
-            
-            # Add animations to animator
-            self.animator.add_animation("idle", idle_anim)
-            self.animator.add_animation("walk", walk_anim)
-            self.animator.add_animation("run", walk_anim)  # Use walk for run
-            self.animator.add_animation("attack", attack_anim)
-            self.animator.add_animation("block", idle_anim)  # Use idle for block
-            # Use idle as jump placeholder (requested)
-            self.animator.add_animation("jump", idle_anim)
-            self.animator.add_animation("hit", hit_anim)
-            self.animator.add_animation("dead", death_anim)
-            
             # Start with idle animation
             self.animator.play_animation("idle", True)
             
@@ -1268,7 +903,7 @@ class YellowNinja(Character):
         desired_facing_right = self.facing_right
         if abs(self.x - player.x) > 8:  # deadzone of 8px to prevent oscillation
             desired_facing_right = self.x < player.x
-
+        
         if self.ai_current_action == "approach":
             # Move towards player
             if desired_facing_right:
@@ -1324,28 +959,28 @@ class YellowNinja(Character):
             self.velocity_x = 0
             self.is_blocking = False
     
-    def render(self, surface: pygame.Surface):
-        """Render YellowNinja with baseline adjustment so feet align with ground."""
+    def render(self, draw_list: DrawList):
+        """Submit YellowNinja's frame with baseline adjustment so feet align with ground."""
         # Blink effect: skip rendering on alternating frames while timer active
         if hasattr(self, "_blink_timer") and self._blink_timer > 0:
-            # 50ms cadence blink
-            if (int(pygame.time.get_ticks() / 50) % 2) == 0:
+            # 50ms cadence blink, timed by the simulated blink timer
+            if (int(self._blink_timer / 0.05) % 2) == 0:
                 return
-        # Get current sprite frame
-        current_frame = self.animator.get_current_frame()
+        # Get current sprite frame (pre-mirrored if character is facing left)
+        flipped = not self.facing_right
+        current_frame = self.animator.get_current_frame(flipped=flipped)
         if not current_frame:
             return
-        
-        # Apply horizontal flip if character is facing left
-        if not self.facing_right:
-            current_frame = pygame.transform.flip(current_frame, True, False)
+        offset_x, offset_y = self.animator.get_current_offset(flipped=flipped)
+        cell_width, cell_height = self.animator.get_cell_size()
         
         # Match base render anchor and apply vertical offset computed from idle frame padding
-        render_x = self.x - (current_frame.get_width() - self.width) // 2
-        render_y = self.y - (current_frame.get_height() - self.height) // 2
+        x, y = self.draw_position()
+        render_x = x / self.pixel_scale - (cell_width - self.width // self.pixel_scale) // 2
+        render_y = y / self.pixel_scale - (cell_height - self.height // self.pixel_scale) // 2
         render_y += int(self.sprite_y_offset)
         
-        surface.blit(current_frame, (render_x, render_y))
+        self._submit_frame(draw_list, current_frame, (int(render_x) + offset_x, int(render_y) + offset_y), flipped)
 
 
 # FUTURE: Scalable Enemy System for 10 Levels
@@ -0,0 +1,41 @@
+"""
+Compositor
+Static scene layers (backgrounds, ground, darkening) merged once into a single display-format surface.
+"""
+
+import pygame
+from typing import NamedTuple, Optional, Tuple
+from game.effects import effect_cache
+
+
+class StaticLayer(NamedTuple):
+    """One static layer: an image blitted at a position, optionally tinted first.
+    
+    tint is a BLEND_RGBA_MULT fill applied to a copy of the image (the shared image
+    is never drawn on).
+    """
+    image: pygame.Surface
+    position: Tuple[int, int] = (0, 0)
+    tint: Optional[Tuple[int, int, int, int]] = None
+
+
+def compose_static(size: Tuple[int, int], layers: Tuple[StaticLayer, ...],
+                   fill: Tuple[int, int, int] = (0, 0, 0)) -> pygame.Surface:
+    """The layers (the first one at the bottom) merged over fill, built on first use.
+    
+    The result is opaque and in the display format, so the static part of a scene
+    is one plain blit per frame. Scenes with the same layers share one surface.
+    """
+    def build():
+        static = pygame.Surface(size)
+        static.fill(fill)
+        for layer in layers:
+            image = layer.image
+            if layer.tint is not None:
+                image = image.copy()
+                image.fill(layer.tint, special_flags=pygame.BLEND_RGBA_MULT)
+            static.blit(image, layer.position)
+        if pygame.display.get_surface() is not None:
+            static = static.convert()
+        return static
+    return effect_cache.get(("static", tuple(size), tuple(layers), tuple(fill)), build)
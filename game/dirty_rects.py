@@ -0,0 +1,55 @@
+"""
+Dirty Rectangles
+Tracks which screen regions a scene changed so only those are presented.
+"""
+
+import pygame
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class DirtyTracker:
+    """Collects the regions a scene changed since the last presented frame.
+    
+    Scenes still draw the whole frame, but call track() for every element that can
+    change, with a state value describing how it looks (color, blink phase, ...).
+    An element whose state or rect differs from the previous frame dirties both its
+    old and new rect; an element that stops being drawn dirties its old rect.
+    """
+    
+    def __init__(self):
+        """Start with a full redraw pending (the first frame of a scene)."""
+        self._previous: Dict[Hashable, Tuple[Hashable, pygame.Rect]] = {}
+        self._current: Dict[Hashable, Tuple[Hashable, pygame.Rect]] = {}
+        self._rects: List[pygame.Rect] = []
+        self._full = True
+    
+    def invalidate(self):
+        """Request a full redraw for the next frame."""
+        self._full = True
+    
+    def add(self, rect):
+        """Mark a region as changed this frame."""
+        self._rects.append(pygame.Rect(rect))
+    
+    def track(self, key: Hashable, state: Hashable, rect):
+        """Record an element drawn this frame, dirtying it if its state or rect changed."""
+        rect = pygame.Rect(rect)
+        self._current[key] = (state, rect)
+        previous = self._previous.get(key)
+        if previous is None:
+            self._rects.append(rect)
+        elif previous[0] != state or previous[1] != rect:
+            self._rects.append(previous[1])
+            self._rects.append(rect)
+    
+    def collect(self) -> Optional[List[pygame.Rect]]:
+        """Finish the frame, returning its changed regions (None for a full redraw)."""
+        for key, (_, rect) in self._previous.items():
+            if key not in self._current:
+                self._rects.append(rect)
+        rects = None if self._full else self._rects
+        self._previous = self._current
+        self._current = {}
+        self._rects = []
+        self._full = False
+        return rects
@@ -0,0 +1,108 @@
+"""
+Draw List
+Per-frame draw commands, sorted into layers, culled against the viewport and flushed in batches.
+"""
+
+import pygame
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+from game.render_backend import sprite_backend
+
+
+# Layers, bottom to top
+LAYER_BACKGROUND = 0
+LAYER_FIGHTERS = 10
+LAYER_HUD = 20
+
+
+class DrawCommand(NamedTuple):
+    """One image to draw at a position in a layer.
+    
+    mirror is the upright image that the GPU renderer mirrors instead of drawing
+    image (a pre-mirrored copy, for blits).
+    """
+    layer: int
+    image: pygame.Surface
+    position: Tuple[int, int]
+    mirror: Optional[pygame.Surface] = None
+
+
+class DrawList:
+    """Draw commands collected during a frame and drawn by flush() in layer order.
+    
+    Commands in the same layer keep their submission order. Commands entirely
+    outside the surface's clip rect are dropped, and the rest go to the surface
+    in one Surface.blits() call (or to the GPU renderer in a sprite pass). Images are drawn at flush time, so
+    they must not be drawn on in between.
+    """
+    
+    def __init__(self):
+        """Create an empty list with zeroed counters."""
+        self._commands: List[DrawCommand] = []
+        self.counts = self._zero_counts()  # This frame
+        self.totals = self._zero_counts()  # Every frame so far
+        self.frames = 0
+    
+    @staticmethod
+    def _zero_counts() -> Dict[str, int]:
+        """Counters for commands submitted, culled and flushed, and the draw calls flushing took."""
+        return {"submitted": 0, "culled": 0, "flushed": 0, "calls": 0}
+    
+    def begin_frame(self):
+        """Start counting a new frame."""
+        self.counts = self._zero_counts()
+        self.frames += 1
+    
+    def submit(self, image: pygame.Surface, position: Union[Tuple[int, int], pygame.Rect], layer: int,
+               mirror: Optional[pygame.Surface] = None):
+        """Add an image to draw with its top left at position."""
+        if isinstance(position, pygame.Rect):
+            position = position.topleft
+        self._commands.append(DrawCommand(layer, image, position, mirror))
+        self._count("submitted")
+    
+    def blit(self, image: pygame.Surface, position: Union[Tuple[int, int], pygame.Rect], layer: int = LAYER_HUD):
+        """Submit like Surface.blit, so HUD helpers written for a surface can draw into the list."""
+        self.submit(image, position, layer)
+    
+    def flush(self, surface: pygame.Surface):
+        """Draw every submitted command onto surface, lowest layer first, and empty the list."""
+        if not self._commands:
+            return
+        self._commands.sort(key=lambda command: command.layer)
+        viewport = surface.get_clip()
+        backend = sprite_backend(surface)
+        batch = []
+        for command in self._commands:
+            if not viewport.colliderect(command.position, command.image.get_size()):
+                self._count("culled")
+                continue
+            self._count("flushed")
+            if backend is not None:
+                # The GPU renderer mirrors from the upright image
+                if command.mirror is not None:
+                    backend.draw_sprite(command.mirror, command.position, flip_x=True)
+                else:
+                    backend.draw_sprite(command.image, command.position)
+                self._count("calls")
+            else:
+                batch.append((command.image, command.position))
+        if batch:
+            surface.blits(batch, doreturn=False)
+            self._count("calls")
+        self._commands.clear()
+    
+    def _count(self, name: str):
+        """Add one to a counter for this frame and overall."""
+        self.counts[name] += 1
+        self.totals[name] += 1
+    
+    def report(self) -> str:
+        """Average commands and draw calls per frame, for the console."""
+        if self.frames == 0:
+            return "No frames drawn through the draw list"
+        averages = ", ".join(f"{count / self.frames:.1f} {name}" for name, count in self.totals.items())
+        return f"Draw list over {self.frames} frames, per frame: {averages}"
+
+
+# Shared by every scene; one frame is drawn at a time
+draw_list = DrawList()
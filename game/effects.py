@@ -0,0 +1,276 @@
+"""
+Effects
+Pre-rendered effect surfaces (dimming overlays, baked glow and shadow text, block barriers, glow masks)
+built once and reused.
+"""
+
+import math
+import pygame
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple, Tuple
+from game.bitmap_font import BitmapFont
+from game.render_backend import sprite_backend, upper_layer_backend
+from game.text_render import render_pixel_text
+
+
+class EffectCache:
+    """Process-wide LRU cache of effect surfaces keyed by the recipe that built them.
+    
+    Cached surfaces are shared between scenes and must never be drawn on.
+    """
+    
+    def __init__(self, max_entries: int = 64):
+        """Initialize an empty cache holding at most max_entries effects."""
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+    
+    def get(self, key: Hashable, build: Callable[[], object]):
+        """The effect for key, calling build() on a cache miss."""
+        effect = self._entries.get(key)
+        if effect is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return effect
+        
+        self.misses += 1
+        effect = build()
+        self._entries[key] = effect
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return effect
+    
+    def clear(self):
+        """Drop every cached effect."""
+        self._entries.clear()
+
+
+# Shared by every scene
+effect_cache = EffectCache()
+
+
+def get_overlay(size: Tuple[int, int], alpha: int, color: Tuple[int, int, int] = (0, 0, 0)) -> pygame.Surface:
+    """A solid color layer, for dimming the screen behind menus and results.
+    
+    The alpha is per pixel, which blends like surface alpha on an opaque frame and
+    also works as a renderer texture.
+    """
+    def build():
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill((*color, alpha))
+        return overlay
+    return effect_cache.get(("overlay", tuple(size), alpha, tuple(color)), build)
+
+
+def draw_overlay(surface: pygame.Surface, alpha: int, color: Tuple[int, int, int] = (0, 0, 0)):
+    """Cover the whole surface with a solid color layer of the given alpha."""
+    overlay = get_overlay(surface.get_size(), alpha, color)
+    backend = upper_layer_backend(surface)
+    if backend is not None:
+        backend.draw_over(overlay, (0, 0))
+    else:
+        surface.blit(overlay, (0, 0))
+
+
+class TextLayer(NamedTuple):
+    """One layer of baked text: pixel text drawn with an alpha at offsets from a shared center."""
+    text: str
+    font: BitmapFont
+    color: Tuple[int, int, int]
+    scale: int
+    alpha: int = 255
+    offsets: Tuple[Tuple[int, int], ...] = ((0, 0),)
+
+
+class BakedText:
+    """Layered text (glows, drop shadows) flattened into one premultiplied-alpha surface.
+    
+    Layers are composited in order with premultiplied "over", which is associative,
+    so one draw() of the result stands in for every per-layer, per-offset blit.
+    Alpha blending rounds once instead of once per layer, so translucent layers can
+    differ from blitting them one by one by a color level.
+    """
+    
+    def __init__(self, layers: Tuple[TextLayer, ...]):
+        """Composite the layers (the first one at the bottom)."""
+        placements = []
+        for layer in layers:
+            text_surface = render_pixel_text(layer.text, layer.font, layer.color, layer.scale)
+            width, height = text_surface.get_size()
+            
+            # Straight alpha layer, then premultiplied for compositing
+            premultiplied = pygame.Surface((width, height), pygame.SRCALPHA)
+            premultiplied.blit(text_surface, (0, 0))
+            if layer.alpha < 255:
+                premultiplied.fill((255, 255, 255, layer.alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            premultiplied = premultiplied.premul_alpha()
+            
+            # Same placement as setting rect.center to center + offset
+            for offset_x, offset_y in layer.offsets:
+                placements.append((premultiplied, pygame.Rect(offset_x - width // 2, offset_y - height // 2,
+                                                              width, height)))
+        
+        bounds = placements[0][1].unionall([rect for _, rect in placements])
+        self.surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for surface, rect in placements:
+            self.surface.blit(surface, rect.move(-bounds.x, -bounds.y), special_flags=pygame.BLEND_PREMULTIPLIED)
+        self.offset = bounds.topleft
+    
+    def draw(self, surface: pygame.Surface, center: Tuple[int, int]):
+        """Blit the baked text with its layers centered on center."""
+        position = (center[0] + self.offset[0], center[1] + self.offset[1])
+        backend = upper_layer_backend(surface)
+        if backend is not None:
+            backend.draw_over(self.surface, position, premultiplied=True)
+        else:
+            surface.blit(self.surface, position, special_flags=pygame.BLEND_PREMULTIPLIED)
+
+
+def bake_text(layers: Tuple[TextLayer, ...]) -> BakedText:
+    """The baked composite of text layers, built on first use."""
+    return effect_cache.get(("text", layers), lambda: BakedText(layers))
+
+
+def get_barrier(size: Tuple[int, int], color: Tuple[int, int, int]) -> pygame.Surface:
+    """An energy barrier in color, fading to half brightness across its width.
+    
+    Shared: callers set its alpha (the pulse) right before each blit.
+    """
+    def build():
+        width, height = size
+        barrier = pygame.Surface(size)
+        # Gradient effect - one column per pixel for the energy look
+        for i in range(width):
+            alpha_mult = 1.0 - (i / width) * 0.5
+            column_color = tuple(int(channel * alpha_mult) if channel > 0 else 0 for channel in color)
+            barrier.fill(column_color, (i, 0, 1, height))
+        return barrier
+    return effect_cache.get(("barrier", tuple(size), tuple(color)), build)
+
+
+def get_glow_plate(size: Tuple[int, int], color: Tuple[int, int, int]) -> pygame.Surface:
+    """A reusable plate for a pulsing glow of a base color, with alpha 80.
+    
+    The glow pulses in brightness, so callers fill it with the current glow color
+    right before each blit instead of allocating a new plate.
+    """
+    def build():
+        plate = pygame.Surface(size)
+        plate.set_alpha(80)
+        return plate
+    return effect_cache.get(("glow", tuple(size), tuple(color)), build)
+
+
+def draw_blocking_effect(surface: pygame.Surface, character, current_time: int, is_parrying: bool = False):
+    """Draw a character's energy barrier and weapon glow (blue when blocking, green when parrying).
+    
+    Sizes are in game pixels, drawn at the character's pixel scale. current_time is
+    the scene's simulated time in milliseconds, which drives the pulsing.
+    """
+    # Choose colors based on parrying state
+    if is_parrying:
+        # Green colors for parrying
+        barrier_base_color = (0, 255, 0)  # Green barrier
+        glow_base_color = (0, 255, 100)  # Green-tinted glow
+    else:
+        # Blue colors for normal blocking
+        barrier_base_color = (0, 100, 255)  # Blue barrier
+        glow_base_color = (100, 100, 255)  # Blue-tinted glow
+    
+    # Energy barrier effect
+    barrier_width = 8
+    barrier_height = character.height - 10
+    barrier_alpha = 180 + int(40 * math.sin(current_time * 0.01))  # Pulsing effect
+    
+    # Position barrier in front of character based on facing direction
+    x, y = character.draw_position()
+    if character.facing_right:
+        barrier_x = x + character.width + 5
+    else:
+        barrier_x = x - barrier_width - 5
+    barrier_y = y + 5
+    
+    scale = character.pixel_scale
+    barrier = get_barrier((barrier_width // scale, barrier_height // scale), barrier_base_color)
+    barrier_position = (int(barrier_x / scale), int(barrier_y / scale))
+    backend = sprite_backend(surface)
+    if backend is not None:
+        # The GPU renderer fades the barrier texture
+        backend.draw_sprite(barrier, barrier_position, alpha=barrier_alpha)
+    else:
+        barrier.set_alpha(barrier_alpha)
+        surface.blit(barrier, barrier_position)
+    
+    # Weapon glow effect (overlay on character sprite area)
+    glow_intensity = 150 + int(50 * math.sin(current_time * 0.015))  # Pulsing glow
+    glow_color = (glow_intensity if glow_base_color[0] > 0 else glow_intensity // 3,
+                  glow_intensity if glow_base_color[1] > 0 else glow_intensity // 3,
+                  glow_intensity if glow_base_color[2] > 0 else 255)
+    
+    # Render glow outline behind character
+    glow_size = ((character.width + 6) // scale, (character.height + 6) // scale)
+    glow_position = (int((x - 3) / scale), int((y - 3) / scale))
+    if backend is not None:
+        # A white plate the GPU renderer tints and fades
+        backend.draw_sprite(get_overlay(glow_size, 255, (255, 255, 255)), glow_position,
+                            alpha=80, color=glow_color)
+    else:
+        glow = get_glow_plate(glow_size, glow_base_color)
+        glow.fill(glow_color)
+        surface.blit(glow, glow_position)
+
+
+# Stand-in color for the glow while glow art is drawn; no real art uses it
+GLOW_KEY = (255, 0, 255)
+
+
+class GlowMask:
+    """Static art in a few flat colors, kept as an 8-bit surface whose glow color is a palette entry.
+    
+    The art is drawn once with GLOW_KEY wherever the pulsing glow color goes.
+    Each frame the glow is recolored by changing one palette entry, and the whole
+    mask fades with surface alpha (8-bit alpha blits round a color level apart from
+    per-pixel alpha ones). Per-frame marks (sparkles) can be drawn on it and are
+    erased the next frame.
+    """
+    
+    def __init__(self, art: pygame.Surface, colors: Tuple[Tuple[int, int, int], ...], area: pygame.Rect = None):
+        """Keep the art's drawn pixels (every one GLOW_KEY or one of colors), plus area for marks."""
+        bounds = art.get_bounding_rect()
+        if area is not None:
+            bounds = bounds.union(area).clip(art.get_rect())
+        self.offset = bounds.topleft
+        
+        # Palette: transparent (the colorkey), the glow, then the flat colors
+        palette = [(0, 0, 0), GLOW_KEY] + [tuple(color) for color in colors]
+        self._base = pygame.Surface(bounds.size, 0, 8)
+        self._base.set_palette(palette)
+        self._base.fill(palette[0])
+        # Blits to 8-bit go through a lossy 3-3-2 color lookup, so each color is matched exactly
+        drawn = art.subsurface(bounds)
+        for color in palette[1:]:
+            pygame.mask.from_threshold(drawn, color, (1, 1, 1, 255)).to_surface(self._base, setcolor=color, unsetcolor=None)
+        self.surface = self._base.copy()
+        self.surface.set_colorkey(palette[0])
+        self._marks = []
+    
+    def set_glow(self, color: Tuple[int, int, int]):
+        """Recolor the glow and erase last frame's marks."""
+        self._base.set_palette_at(1, color)
+        self.surface.set_palette_at(1, color)
+        # Same palettes, so the base copies back index for index
+        for rect in self._marks:
+            self.surface.blit(self._base, rect, rect)
+        self._marks = []
+    
+    def mark_circle(self, color: Tuple[int, int, int], center: Tuple[int, int], radius: int):
+        """Draw a filled circle (in one of the mask's colors) for this frame only."""
+        rect = pygame.draw.circle(self.surface, color, (center[0] - self.offset[0], center[1] - self.offset[1]), radius)
+        if rect.width and rect.height:
+            self._marks.append(rect)
+    
+    def draw(self, surface: pygame.Surface, alpha: int = 255):
+        """Blit the mask at its place in the art, faded to alpha."""
+        self.surface.set_alpha(alpha if alpha < 255 else None)
+        surface.blit(self.surface, self.offset)
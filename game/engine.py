@@ -5,12 +5,45 @@ Core game loop and rendering system.
 
 import pygame
 import os
+import random
 from typing import Optional, Union
 from game.scenes import FightScene, MainMenuScene, SplashScene, Level2Scene, LevelSelectScene
-from game.input_handler import InputHandler
+from game.input_handler import AIController, InputHandler
+from game.asset_loader import asset_loader
+from game.draw_list import draw_list
+from game.frame_pacer import FramePacer
+from game.match_recording import MatchRecording
+from game.render_backend import create_backend
 from game.resource_utils import audio_path
 
 
+# Present with a full flip once the changed regions cover this much of the screen
+FULL_PRESENT_FRACTION = 0.5
+
+# The window is this whole-number multiple of the logical resolution (F10 cycles it)
+WINDOW_SCALE = 1
+
+# "surface" (software blits) or "texture" (GPU textures through pygame._sdl2.video)
+RENDER_BACKEND = "surface"
+
+# Renderer driver for the texture backend: None picks the best, "software" needs no GPU
+RENDER_DRIVER = None
+
+# Wait for the display refresh when presenting (the frame pacer then only measures)
+VSYNC = False
+
+# The game is simulated in fixed steps at this rate, whatever the frame rate. An attack
+# that connects is re-armed on the next step while its hit frame shows, so damage per
+# swing grows with the step rate; 60 Hz keeps the balance the game was tuned at
+SIMULATION_HZ = 60
+
+# Most steps simulated per frame; time beyond that is dropped (the game slows down instead of stalling)
+MAX_STEPS_PER_FRAME = 4
+
+# Save every fight's inputs in this directory, for rendering clips with game.capture (None: don't record)
+RECORD_DIR = None
+
+
 class GameEngine:
     """Main game engine handling the game loop and scene management."""
     
@@ -21,24 +54,44 @@ class GameEngine:
         self.SCREEN_HEIGHT = 600
         self.FPS = 60
         
-        # Initialize display
-        self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        # Initialize display: scenes draw at the logical resolution (or their sprites'
+        # native one, see pixel_scale), and the render backend scales their frames up to the window
+        self.backend = create_backend(RENDER_BACKEND, (self.SCREEN_WIDTH, self.SCREEN_HEIGHT),
+                                      WINDOW_SCALE, RENDER_DRIVER, VSYNC)
         pygame.display.set_caption("Proper Duel - Pixel Fighting Game")
         
         # Game state
-        self.clock = pygame.time.Clock()
+        self.pacer = FramePacer(self.FPS, vsync=self.backend.vsync)
         self.running = True
         self.paused = False  # Pause state
         self.current_scene: Optional[Union[SplashScene, MainMenuScene, FightScene]] = None
         self.scene_type = "splash"  # "splash", "menu" or "fight"
         self.scene_transition_cooldown = 0.0  # Prevent immediate key detection after transition
         
+        # Fixed-step simulation: time not simulated yet, and events waiting for the next step
+        self.simulation_step = 1.0 / SIMULATION_HZ
+        self.accumulator = 0.0
+        self.pending_events = []
+        self.recording: Optional[MatchRecording] = None  # Inputs of the current fight (with RECORD_DIR)
+        
+        # Presentation: push only the regions scenes report as changed
+        self.dirty_rects_enabled = True
+        self.force_full_present = True  # Set when the window needs a full redraw
+        self.pixels_pushed = 0  # Pixels sent to the display by the last frame
+        self.present_stats = {"frames": 0, "full": 0, "pixels": 0}
+        
         # Input handler
         self.input_handler = InputHandler()
         
         # Initialize the VIC VEGA splash scene first
         self.current_scene = SplashScene(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
         
+        # Decode menu and fight assets in the background while the splash plays
+        self.asset_loader = asset_loader
+        self.asset_loader.preload("menu", MainMenuScene.asset_jobs(self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        self.asset_loader.preload("fight", FightScene.asset_jobs(self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        self.asset_loader.preload("level2", Level2Scene.asset_jobs(self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        
         # Initialize background music and sound effects
         self._load_audio()
         
@@ -51,6 +104,16 @@ class GameEngine:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # The window contents were lost; partial updates would leave holes
+                self.force_full_present = True
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                # Frame-time and draw statistics so far
+                print(self.pacer.report())
+                print(draw_list.report())
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
+                # Next window size that fits the desktop (scenes are unaffected)
+                self.set_window_scale(self.window_scale % self._max_window_scale() + 1)
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 # Handle ESC key for pause/unpause in fight scene
                 if self.scene_type == "fight":
@@ -133,6 +196,8 @@ class GameEngine:
                     
                     # Get input states for player 1
                     player1_input = self.input_handler.get_player1_input()
+                    if self.recording is not None:
+                        self.recording.record(player1_input, self.current_scene.is_paused)
                     
                     # Update Level 2 scene with player input
                     self.current_scene.update(dt, player1_input, None)
@@ -162,7 +227,10 @@ class GameEngine:
                     player2_input = self.input_handler.get_player2_input(dt, self.current_scene.player2, self.current_scene.player1)
                     
                     # Update current scene (but freeze game logic during dialogue/pause)
-                    if not self.paused and not (hasattr(self.current_scene, 'showing_dialogue') and self.current_scene.showing_dialogue):
+                    frozen = self.paused or (hasattr(self.current_scene, 'showing_dialogue') and self.current_scene.showing_dialogue)
+                    if self.recording is not None:
+                        self.recording.record(player1_input, frozen)
+                    if not frozen:
                         self.current_scene.update(dt, player1_input, player2_input)
                     else:
                         # Still call update but with zero delta time to freeze game logic
@@ -193,9 +261,33 @@ class GameEngine:
                     # Return to menu on error
                     self._switch_to_menu_scene()
     
+    def simulate(self, frame_time: float, events: list):
+        """Run the fixed steps frame_time adds up to, then place the fighters between the last two."""
+        self.pending_events.extend(events)
+        self.accumulator += frame_time
+        steps = 0
+        while self.accumulator >= self.simulation_step:
+            if steps == MAX_STEPS_PER_FRAME:
+                # Too far behind to catch up: drop the whole steps, keep the fraction
+                self.accumulator %= self.simulation_step
+                break
+            if hasattr(self.current_scene, 'begin_step'):
+                self.current_scene.begin_step()
+            # Each event is handled by exactly one step
+            step_events, self.pending_events = self.pending_events, []
+            self.update(self.simulation_step, step_events)
+            self.accumulator -= self.simulation_step
+            steps += 1
+        
+        # Render interpolation: how far the next step has come
+        if hasattr(self.current_scene, 'set_render_blend'):
+            self.current_scene.set_render_blend(self.accumulator / self.simulation_step)
+    
     def _switch_to_fight_scene(self):
         """Switch from menu to fight scene."""
         try:
+            # Normally finished during the splash; otherwise finish it here
+            self.asset_loader.wait("fight")
             self.current_scene = FightScene(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
             self.scene_type = "fight"
             self.scene_transition_cooldown = 0.5  # 0.5 second cooldown
@@ -209,6 +301,8 @@ class GameEngine:
             # Apply audio to the new fight scene
             if hasattr(self, 'attack_sound') and hasattr(self.current_scene, 'set_sounds'):
                 self.current_scene.set_sounds(self.attack_sound, self.block_sound, self.pain_sound)
+            
+            self._start_recording("fight")
         except Exception as e:
             print(f"ERROR creating fight scene: {e}")
             import traceback
@@ -219,12 +313,15 @@ class GameEngine:
     
     def _switch_to_menu_scene(self):
         """Switch from splash or fight scene to menu."""
+        self._finish_recording()
+        self.asset_loader.wait("menu")
         self.current_scene = MainMenuScene(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
         self.scene_type = "menu"
         self.scene_transition_cooldown = 0.5  # 0.5 second cooldown
         
     def _switch_to_level_select_scene(self):
         """Switch from menu to level select."""
+        self._finish_recording()
         self.current_scene = LevelSelectScene(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
         self.scene_type = "level_select"
         self.scene_transition_cooldown = 0.5  # 0.5 second cooldown
@@ -232,6 +329,7 @@ class GameEngine:
     def _switch_to_level2_scene(self):
         """Switch from fight scene to Level 2."""
         try:
+            self.asset_loader.wait("level2")
             self.current_scene = Level2Scene(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
             self.scene_type = "level2"
             self.scene_transition_cooldown = 0.5  # 0.5 second cooldown
@@ -240,6 +338,7 @@ class GameEngine:
             if hasattr(self, 'attack_sound') and hasattr(self.current_scene, 'set_sounds'):
                 self.current_scene.set_sounds(self.attack_sound, self.block_sound, self.pain_sound)
             
+            self._start_recording("level2")
             print("Transitioning to Level 2...")
         except Exception as e:
             print(f"ERROR creating Level 2 scene: {e}")
@@ -251,23 +350,99 @@ class GameEngine:
         # Switch to menu music (if not already playing)
         self._play_menu_music()
     
+    def _start_recording(self, scene: str):
+        """Seed the AI and start recording the new fight's inputs, when RECORD_DIR is set."""
+        self._finish_recording()
+        if RECORD_DIR is None:
+            return
+        seed = random.randrange(2 ** 32)
+        random.seed(seed)
+        # Replays start from a fresh AI too
+        self.input_handler.ai_controller = AIController()
+        self.recording = MatchRecording(scene, seed, self.simulation_step)
+    
+    def _finish_recording(self):
+        """Save the current fight's recording, if any."""
+        recording, self.recording = self.recording, None
+        if recording is None or recording.step_count == 0:
+            return
+        try:
+            path = recording.save(RECORD_DIR)
+            print(f"Recorded {recording.step_count} steps to {path}")
+        except OSError as e:
+            print(f"Could not save match recording: {e}")
+    
+    @property
+    def screen(self) -> pygame.Surface:
+        """The logical-resolution surface scenes draw on."""
+        return self.backend.screen
+    
+    @property
+    def window_scale(self) -> int:
+        """Whole-number factor from the logical resolution to the window."""
+        return self.backend.window_scale
+    
+    def set_window_scale(self, scale: int):
+        """Resize the window to a whole-number multiple of the logical resolution."""
+        self.backend.set_window_scale(scale)
+        self.force_full_present = True
+    
+    def _max_window_scale(self) -> int:
+        """Largest window scale that fits the desktop."""
+        try:
+            desktop_width, desktop_height = pygame.display.get_desktop_sizes()[0]
+        except (pygame.error, IndexError):
+            return 1
+        return max(1, min(desktop_width // self.SCREEN_WIDTH, desktop_height // self.SCREEN_HEIGHT))
+    
     def render(self):
         """Render the current frame."""
         try:
+            # Scenes with a pixel_scale draw at their sprites' native resolution
+            pixel_scale = getattr(self.current_scene, 'pixel_scale', 1)
+            if pixel_scale != self.backend.pixel_scale:
+                self.backend.set_pixel_scale(pixel_scale)
+                self.force_full_present = True
+            
             # Clear screen with a dark background
-            self.screen.fill((20, 20, 30))
+            screen = self.backend.begin_frame()
+            draw_list.begin_frame()
+            screen.fill((20, 20, 30))
             
             # Render current scene
             if self.current_scene:
-                self.current_scene.render(self.screen)
+                self.current_scene.render(screen)
             
             # Update display
-            pygame.display.flip()
+            self._present()
         except Exception as e:
             print(f"ERROR in render: {e}")
             import traceback
             traceback.print_exc()
     
+    def _present(self):
+        """Push the rendered frame, limited to the scene's changed regions when possible."""
+        screen_rect = self.screen.get_rect()
+        rects = None
+        if self.dirty_rects_enabled and hasattr(self.current_scene, 'get_dirty_rects'):
+            rects = self.current_scene.get_dirty_rects()
+        if self.force_full_present:
+            rects = None
+            self.force_full_present = False
+        
+        if rects is not None:
+            rects = [rect.clip(screen_rect) for rect in rects]
+            rects = [rect for rect in rects if rect.width and rect.height]
+            area = sum(rect.width * rect.height for rect in rects)
+            if area > screen_rect.width * screen_rect.height * FULL_PRESENT_FRACTION:
+                rects = None
+        
+        self.pixels_pushed = self.backend.present(rects)
+        if rects is None:
+            self.present_stats["full"] += 1
+        self.present_stats["frames"] += 1
+        self.present_stats["pixels"] += self.pixels_pushed
+    
     def _load_audio(self):
         """Load background music and sound effects."""
         try:
@@ -372,8 +547,8 @@ class GameEngine:
         
         try:
             while self.running:
-                # Calculate delta time
-                dt = self.clock.tick(self.FPS) / 1000.0  # Convert to seconds
+                # Time since the last frame, simulated in fixed steps
+                frame_time = self.pacer.tick()
                 
                 # Handle events
                 try:
@@ -386,7 +561,7 @@ class GameEngine:
                 
                 # Update game state
                 try:
-                    self.update(dt, events)
+                    self.simulate(frame_time, events)
                 except Exception as e:
                     print(f"ERROR in update: {e}")
                     import traceback
@@ -407,4 +582,21 @@ class GameEngine:
             import traceback
             traceback.print_exc()
         
-        print("Game ended.")
\ No newline at end of file
+        self._finish_recording()
+        self.asset_loader.shutdown()
+        self.backend.close()
+        self._print_present_stats()
+        print(self.pacer.report())
+        print(draw_list.report())
+        print("Game ended.")
+    
+    def _print_present_stats(self):
+        """Report how many pixels presentation pushed compared to full flips."""
+        frames = self.present_stats["frames"]
+        if frames == 0:
+            return
+        window_width, window_height = self.backend.window_size
+        full_pixels = frames * window_width * window_height
+        print(f"Presented {frames} frames ({self.present_stats['full']} full flips): "
+              f"{self.present_stats['pixels'] // frames} pixels/frame, "
+              f"{self.present_stats['pixels'] / full_pixels:.0%} of flipping every frame")
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Frame Pacer
+Steady frame timing (sleep most of the wait, spin the rest) with rolling frame-time statistics.
+"""
+
+import time
+from collections import deque
+from typing import Dict, List, Tuple
+
+
+# Waits are slept until this long before the deadline, then spun (sleep can overshoot about this much)
+SPIN_MARGIN = 0.002
+
+# A frame ending more than this past its deadline counts as a missed deadline
+MISS_TOLERANCE = 0.001
+
+
+class FramePacer:
+    """Ends frames on a fixed schedule of deadlines, 1/fps apart.
+    
+    tick() sleeps until shortly before the next deadline and spins the rest of the
+    way, so frames don't alternate between 16 and 17+ ms the way coarse sleeps do.
+    With vsync the display's present already waits for the refresh, so tick() only
+    measures. The last history frame times are kept for stats() and histogram().
+    """
+    
+    def __init__(self, fps: int, vsync: bool = False, history: int = 600):
+        """Pace to fps frames per second, remembering the last history frames."""
+        self.period = 1.0 / fps
+        self.vsync = vsync
+        self.frame_times: "deque[float]" = deque(maxlen=history)
+        self.missed: "deque[bool]" = deque(maxlen=history)
+        self.total_frames = 0
+        self.total_missed = 0
+        self._last_tick = None
+        self._deadline = 0.0
+    
+    def tick(self) -> float:
+        """Wait for the end of the frame, returning the seconds since the last tick."""
+        now = time.perf_counter()
+        if self._last_tick is None:
+            # First frame: start the schedule here
+            self._last_tick = self._deadline = now
+            return 0.0
+        
+        if self.vsync:
+            late = now - self._last_tick - self.period
+        else:
+            self._deadline += self.period
+            remaining = self._deadline - now
+            if remaining > SPIN_MARGIN:
+                time.sleep(remaining - SPIN_MARGIN)
+            while time.perf_counter() < self._deadline:
+                pass
+            now = time.perf_counter()
+            late = now - self._deadline
+            if late > self.period:
+                # More than a frame behind: restart the schedule instead of rushing to catch up
+                self._deadline = now
+        
+        frame_time = now - self._last_tick
+        self._last_tick = now
+        missed = late > MISS_TOLERANCE
+        self.frame_times.append(frame_time)
+        self.missed.append(missed)
+        self.total_frames += 1
+        self.total_missed += missed
+        return frame_time
+    
+    def stats(self) -> Dict[str, float]:
+        """Frame-time statistics over the recent frames (times in milliseconds)."""
+        times = sorted(self.frame_times)
+        count = len(times)
+        if count == 0:
+            return {"frames": 0, "missed": 0}
+        return {
+            "frames": count,
+            "missed": sum(self.missed),
+            "mean_ms": sum(times) / count * 1000,
+            "p50_ms": times[count // 2] * 1000,
+            "p99_ms": times[min(count - 1, int(count * 0.99))] * 1000,
+            "max_ms": times[-1] * 1000,
+        }
+    
+    def histogram(self, bin_ms: float = 1.0) -> List[Tuple[float, int]]:
+        """Recent frame times counted in bin_ms wide bins, as (bin start in ms, count) for non-empty bins."""
+        counts: Dict[int, int] = {}
+        for frame_time in self.frame_times:
+            index = int(frame_time * 1000 // bin_ms)
+            counts[index] = counts.get(index, 0) + 1
+        return [(index * bin_ms, counts[index]) for index in sorted(counts)]
+    
+    def report(self, bin_ms: float = 1.0, width: int = 40) -> str:
+        """The statistics and a text histogram of the recent frames, for the console."""
+        stats = self.stats()
+        if stats["frames"] == 0:
+            return "No frames paced"
+        lines = [f"Frame times over the last {stats['frames']} frames (target {self.period * 1000:.2f} ms"
+                 f"{', vsync' if self.vsync else ''}): mean {stats['mean_ms']:.2f} ms, "
+                 f"p50 {stats['p50_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms, max {stats['max_ms']:.2f} ms",
+                 f"Missed deadlines: {stats['missed']} recent, {self.total_missed} of {self.total_frames} in total"]
+        histogram = self.histogram(bin_ms)
+        most = max(count for _, count in histogram)
+        for start, count in histogram:
+            bar = "#" * max(1, round(count / most * width))
+            lines.append(f"{start:6.1f} ms {count:6d} {bar}")
+        return "\n".join(lines)
@@ -0,0 +1,70 @@
+"""
+HUD Bars
+Segmented retro health and stamina bars, kept as surfaces and redrawn only when they change.
+"""
+
+import pygame
+from typing import Hashable, Tuple, Union
+from game.draw_list import DrawList
+from game.effects import effect_cache
+
+
+def get_segment_strip(size: Tuple[int, int], pixel_size: int, color: Tuple[int, int, int],
+                      background: Tuple[int, int, int]) -> pygame.Surface:
+    """A completely full bar of color segments (pixel_size - 1 wide, 1px apart) on background.
+    
+    A bar with n segments is the first n * pixel_size columns of the strip.
+    """
+    def build():
+        width, height = size
+        strip = pygame.Surface(size)
+        strip.fill(background)
+        for segment_x in range(0, width, pixel_size):
+            strip.fill(color, (segment_x, 0, pixel_size - 1, height))  # -1 for pixel separation
+        return strip
+    return effect_cache.get(("segments", tuple(size), pixel_size, tuple(color), tuple(background)), build)
+
+
+class SegmentBar:
+    """One on-screen bar: a border, a dark background and a row of segments.
+    
+    The bar is drawn into its own surface, and only when the segment count or one
+    of its colors changes; every other frame it costs a single blit. Segments come
+    from a full strip of the band color, clipped to the filled width.
+    """
+    
+    def __init__(self, width: int, height: int, border: int, pixel_size: int = 4, outline: int = 0):
+        """Create a bar with a border around a width x height inner area.
+        
+        outline draws a border of that thickness over the edge of the inner area too.
+        """
+        self.width = width
+        self.height = height
+        self.border = border
+        self.pixel_size = pixel_size
+        self.outline = outline
+        self.surface = pygame.Surface((width + border * 2, height + border * 2))
+        self._state: Hashable = None
+    
+    def draw(self, surface: Union[pygame.Surface, DrawList], position: Tuple[int, int], segments: int,
+             segment_color: Tuple[int, int, int], background: Tuple[int, int, int],
+             border_color: Tuple[int, int, int] = (255, 255, 255)):
+        """Blit (or submit, to a DrawList) the bar with its inner area's top left at position, redrawing it first if it changed."""
+        segments = max(0, min(segments, self.width // self.pixel_size))
+        state = (segments, segment_color, background, border_color)
+        if state != self._state:
+            self._redraw(segments, segment_color, background, border_color)
+            self._state = state
+        surface.blit(self.surface, (position[0] - self.border, position[1] - self.border))
+    
+    def _redraw(self, segments: int, segment_color: Tuple[int, int, int], background: Tuple[int, int, int],
+                border_color: Tuple[int, int, int]):
+        """Draw the border, background and filled segments into the bar surface."""
+        inner = pygame.Rect(self.border, self.border, self.width, self.height)
+        self.surface.fill(border_color)
+        self.surface.fill(background, inner)
+        if segments:
+            strip = get_segment_strip((self.width, self.height), self.pixel_size, segment_color, background)
+            self.surface.blit(strip, inner, (0, 0, segments * self.pixel_size, self.height))
+        if self.outline:
+            pygame.draw.rect(self.surface, border_color, inner, self.outline)
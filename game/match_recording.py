@@ -0,0 +1,74 @@
+"""
+Match Recording
+Player 1's input for every simulation step of a fight, saved so the fight can be replayed offline (see game.capture).
+"""
+
+import json
+import os
+import time
+from typing import Iterator, List, Optional, Tuple
+from game.input_handler import PlayerInput
+
+
+# PlayerInput fields, in bit order
+INPUT_FIELDS = ("left", "right", "up", "down", "attack", "block", "special", "is_parrying")
+
+# Set on steps where the fight was frozen (paused, or waiting on dialogue) instead of advancing
+FROZEN = 1 << len(INPUT_FIELDS)
+
+
+class MatchRecording:
+    """A fight's random seed and its per-step player 1 inputs, run-length encoded.
+    
+    The game simulates in fixed steps and the AI draws from the random module, so
+    running the same inputs from the same seed replays the same fight. Cheat codes
+    are not recorded.
+    """
+    
+    def __init__(self, scene: str, seed: int, step: float, runs: Optional[List[List[int]]] = None):
+        """Start a recording of a "fight" or "level2" scene simulated in steps of step seconds."""
+        self.scene = scene
+        self.seed = seed
+        self.step = step
+        self.runs = runs if runs is not None else []  # [input bits, step count] pairs
+    
+    @property
+    def step_count(self) -> int:
+        """Number of recorded steps."""
+        return sum(count for _, count in self.runs)
+    
+    def record(self, player_input: PlayerInput, frozen: bool = False):
+        """Add one simulation step's input."""
+        bits = sum(1 << index for index, field in enumerate(INPUT_FIELDS) if getattr(player_input, field, False))
+        if frozen:
+            bits |= FROZEN
+        if self.runs and self.runs[-1][0] == bits:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([bits, 1])
+    
+    def steps(self) -> Iterator[Tuple[PlayerInput, bool]]:
+        """Each recorded step's input and whether the fight was frozen during it."""
+        for bits, count in self.runs:
+            player_input = PlayerInput()
+            for index, field in enumerate(INPUT_FIELDS):
+                setattr(player_input, field, bool(bits >> index & 1))
+            for _ in range(count):
+                yield player_input, bool(bits & FROZEN)
+    
+    def save(self, directory: str) -> str:
+        """Write the recording to a new file in directory, returning its path."""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{self.scene}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        temp_path = path + ".tmp"
+        with open(temp_path, "w") as recording_file:
+            json.dump({"scene": self.scene, "seed": self.seed, "step": self.step, "runs": self.runs}, recording_file)
+        os.replace(temp_path, path)
+        return path
+    
+    @classmethod
+    def load(cls, path: str) -> "MatchRecording":
+        """Read a recording written by save()."""
+        with open(path) as recording_file:
+            data = json.load(recording_file)
+        return cls(data["scene"], data["seed"], data["step"], data["runs"])
@@ -0,0 +1,79 @@
+"""
+Palette Utilities
+Whole-sheet recoloring (tints and palette swaps) for character color variants.
+"""
+
+import pygame
+from typing import Optional, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:
+    # surfarray needs NumPy; palette swaps fall back to PixelArray without it
+    numpy = None
+
+
+RGB = Tuple[int, int, int]
+Palette = Tuple[Tuple[RGB, RGB], ...]
+
+
+def parse_color(value) -> RGB:
+    """Parse "#rrggbb" or [r, g, b] into an RGB tuple."""
+    if isinstance(value, str):
+        value = value.lstrip("#")
+        return (int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16))
+    return (int(value[0]), int(value[1]), int(value[2]))
+
+
+def parse_palette(pairs: Optional[Sequence]) -> Optional[Palette]:
+    """Parse [[from, to], ...] color pairs into a hashable palette (None if empty)."""
+    if not pairs:
+        return None
+    return tuple((parse_color(source), parse_color(target)) for source, target in pairs)
+
+
+def tint_surface(surface: pygame.Surface, tint: Tuple[int, int, int, int]):
+    """Multiply the RGB of every pixel by tint/255 in place, leaving alpha untouched.
+    
+    SDL's BLEND_MULT fill does this for the whole surface in one pass (and measured
+    faster than a NumPy lookup table), computing (c * t + 255) >> 8 per channel.
+    """
+    surface.fill(tint, special_flags=pygame.BLEND_MULT)
+
+
+def swap_palette(surface: pygame.Surface, palette: Palette):
+    """Replace exact RGB colors in place, keeping every pixel's alpha.
+    
+    All pairs are matched against the original colors, so palettes may swap two
+    colors with each other.
+    """
+    if numpy is None:
+        _swap_palette_pixelarray(surface, palette)
+        return
+    
+    rgb = pygame.surfarray.pixels3d(surface)
+    packed = (rgb[..., 0].astype(numpy.uint32) << 16) | (rgb[..., 1].astype(numpy.uint32) << 8) | rgb[..., 2]
+    masks = [packed == ((r << 16) | (g << 8) | b) for (r, g, b), _ in palette]
+    for mask, (_, target) in zip(masks, palette):
+        rgb[mask] = target
+    # Release the surface lock held by the pixel view
+    del rgb
+
+
+def _swap_palette_pixelarray(surface: pygame.Surface, palette: Palette):
+    """Slower fallback without NumPy: only fully opaque pixels, applied pair by pair."""
+    pixels = pygame.PixelArray(surface)
+    try:
+        for source, target in palette:
+            pixels.replace(source, target)
+    finally:
+        pixels.close()
+
+
+def recolor_surface(surface: pygame.Surface, tint: Optional[Tuple[int, int, int, int]] = None,
+                    palette: Optional[Palette] = None):
+    """Apply a palette swap, then a tint, to a whole sheet in place."""
+    if palette:
+        swap_palette(surface, palette)
+    if tint is not None:
+        tint_surface(surface, tint)
@@ -0,0 +1,315 @@
+"""
+Render Backends
+How drawn frames reach the window: software surfaces, or GPU textures through pygame._sdl2.video.
+"""
+
+import os
+import weakref
+import pygame
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+try:
+    from pygame._sdl2.video import Renderer, Texture, Window
+except ImportError:
+    # pygame built without the SDL2 video module; only the surface backend is available
+    Renderer = Texture = Window = None
+
+
+# Game pixels per pixel of the samurai sprite art (their sheets are drawn at 2x).
+# Scenes whose pixel_scale is this draw at the art's native resolution.
+NATIVE_PIXEL_SCALE = 2
+
+
+class SurfaceBackend:
+    """Software rendering: scenes draw on a Surface that becomes the window contents.
+    
+    The window is a whole-number multiple of the logical size. Scenes with a
+    pixel scale draw on a target that many times smaller (their sprites' native
+    resolution). When neither scale applies scenes draw straight into the window;
+    otherwise the frame (or each changed region of it) is upscaled into the window
+    with one nearest-neighbor scale.
+    """
+    
+    name = "surface"
+    
+    def __init__(self, logical_size: Tuple[int, int], window_scale: int = 1, vsync: bool = False):
+        """Open the window at window_scale times the logical size (vsync: wait for the refresh on present)."""
+        self.logical_size = logical_size
+        self.vsync = vsync
+        self.window = None
+        self.screen = None
+        self.window_scale = 1
+        self.pixel_scale = 1
+        self.set_window_scale(window_scale)
+    
+    @property
+    def window_size(self) -> Tuple[int, int]:
+        """Size of the window in pixels."""
+        return self.window.get_size()
+    
+    @property
+    def target_size(self) -> Tuple[int, int]:
+        """Size of the surface scenes draw on."""
+        return _target_size(self.logical_size, self.pixel_scale)
+    
+    def set_window_scale(self, scale: int):
+        """Resize the window to a whole-number multiple of the logical size."""
+        self.window_scale = max(1, int(scale))
+        width, height = self.logical_size
+        self.window, self.vsync = _open_display((width * self.window_scale, height * self.window_scale), 0, self.vsync)
+        self._create_target()
+    
+    def set_pixel_scale(self, scale: int):
+        """Let scenes draw scale times smaller than the logical size; the upscale to the window grows to match."""
+        self.pixel_scale = max(1, int(scale))
+        self._create_target()
+    
+    def _create_target(self):
+        """Pick the surface scenes draw on for the current scales."""
+        if self.window_scale * self.pixel_scale == 1:
+            # Nothing to scale: scenes draw straight into the window
+            self.screen = self.window
+        elif self.screen is None or self.screen is self.window or self.screen.get_size() != self.target_size:
+            self.screen = pygame.Surface(self.target_size).convert()
+    
+    def begin_frame(self) -> pygame.Surface:
+        """The surface to draw the next frame on."""
+        return self.screen
+    
+    def present(self, rects: Optional[List[pygame.Rect]] = None) -> int:
+        """Push the frame (only rects of it, when given) to the window, returning the pixels pushed."""
+        scale = self.window_scale * self.pixel_scale
+        if rects is None:
+            if scale > 1:
+                pygame.transform.scale(self.screen, self.window.get_size(), self.window)
+            pygame.display.flip()
+            width, height = self.window.get_size()
+            return width * height
+        
+        if scale > 1:
+            # Upscale just the changed regions into the window
+            rects = [self._upscale(rect) for rect in rects]
+        if rects:
+            pygame.display.update(rects)
+        return sum(rect.width * rect.height for rect in rects)
+    
+    def _upscale(self, rect: pygame.Rect) -> pygame.Rect:
+        """Scale one region of the frame into the window, returning its window rect."""
+        scale = self.window_scale * self.pixel_scale
+        window_rect = pygame.Rect(rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale)
+        pygame.transform.scale(self.screen.subsurface(rect), window_rect.size, self.window.subsurface(window_rect))
+        return window_rect
+    
+    def close(self):
+        """Release the backend's resources (the display itself is closed by pygame.quit)."""
+
+
+class TextureBackend:
+    """GPU rendering through pygame._sdl2.video: the renderer scales, mirrors and blends.
+    
+    Scenes still draw on a software canvas, which is uploaded as a texture layer.
+    Inside a sprite pass, sprites (character frames, block effects) are drawn by
+    the renderer instead, from textures uploaded once per image and mirrored,
+    faded and tinted by the renderer. Whatever a scene draws after a sprite pass
+    goes on a fresh transparent layer above the sprites; translucent layers drawn
+    there (dimming, glowing text) are drawn by the renderer too, since blits only
+    blend correctly onto opaque pixels. The "software" driver works without a GPU.
+    """
+    
+    name = "texture"
+    
+    def __init__(self, logical_size: Tuple[int, int], window_scale: int = 1, driver: Optional[str] = None,
+                 vsync: bool = False):
+        """Open the window with a renderer (driver names one, like "software"; None picks the best)."""
+        if Renderer is None:
+            raise pygame.error("pygame._sdl2.video is not available")
+        if driver:
+            os.environ["SDL_RENDER_DRIVER"] = driver
+        # Textures are scaled up to the window nearest-neighbor, like the surface backend does
+        os.environ["SDL_RENDER_SCALE_QUALITY"] = "nearest"
+        
+        # A SCALED display gets a renderer from pygame, and images can still be converted
+        self.logical_size = logical_size
+        _, self.vsync = _open_display(logical_size, pygame.SCALED, vsync)
+        self.window = Window.from_display_module()
+        self.renderer = Renderer.from_window(self.window)
+        self.renderer.logical_size = logical_size
+        
+        self.screen = pygame.Surface(logical_size, pygame.SRCALPHA)
+        self._layers: List[Texture] = []
+        self._layer_count = 0
+        self._textures: "weakref.WeakKeyDictionary[pygame.Surface, Texture]" = weakref.WeakKeyDictionary()
+        self._premultiplied: "weakref.WeakKeyDictionary[pygame.Surface, Tuple[Texture, Texture]]" = weakref.WeakKeyDictionary()
+        self.window_scale = 1
+        self.pixel_scale = 1
+        self.set_window_scale(window_scale)
+    
+    @property
+    def window_size(self) -> Tuple[int, int]:
+        """Size of the window in pixels."""
+        return self.window.size
+    
+    @property
+    def target_size(self) -> Tuple[int, int]:
+        """Size of the canvas scenes draw on."""
+        return _target_size(self.logical_size, self.pixel_scale)
+    
+    def set_window_scale(self, scale: int):
+        """Resize the window to a whole-number multiple of the logical size (the renderer scales)."""
+        self.window_scale = max(1, int(scale))
+        width, height = self.logical_size
+        self.window.size = (width * self.window_scale, height * self.window_scale)
+    
+    def set_pixel_scale(self, scale: int):
+        """Let scenes draw scale times smaller than the logical size (the renderer scales it up)."""
+        self.pixel_scale = max(1, int(scale))
+        self.renderer.logical_size = self.target_size
+        self.screen = pygame.Surface(self.target_size, pygame.SRCALPHA)
+        self._layers = []
+    
+    def begin_frame(self) -> pygame.Surface:
+        """Start a frame, returning the canvas to draw it on."""
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        self._layer_count = 0
+        return self.screen
+    
+    @contextmanager
+    def sprite_pass(self):
+        """Draw sprites with the renderer above everything drawn on the canvas so far."""
+        global _sprite_backend
+        self._flush_layer()
+        _sprite_backend = self
+        try:
+            yield
+        finally:
+            _sprite_backend = None
+    
+    def draw_sprite(self, image: pygame.Surface, position: Tuple[int, int], flip_x: bool = False,
+                    alpha: int = 255, color: Tuple[int, int, int] = (255, 255, 255)):
+        """Draw an image (never drawn on afterwards) from its texture, mirrored, faded and tinted."""
+        texture = self._textures.get(image)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, image)
+            self._textures[image] = texture
+        # Opaque images (backgrounds) are copied without blending
+        opaque = alpha == 255 and not image.get_flags() & pygame.SRCALPHA and image.get_colorkey() is None
+        texture.blend_mode = pygame.BLENDMODE_NONE if opaque else pygame.BLENDMODE_BLEND
+        texture.alpha = alpha
+        texture.color = color
+        texture.draw(dstrect=(position[0], position[1], image.get_width(), image.get_height()), flip_x=flip_x)
+    
+    def draw_over(self, image: pygame.Surface, position: Tuple[int, int], premultiplied: bool = False):
+        """Draw an image (never drawn on afterwards) with the renderer above everything drawn so far."""
+        self._flush_layer()
+        if not premultiplied:
+            self.draw_sprite(image, position)
+            return
+        
+        textures = self._premultiplied.get(image)
+        if textures is None:
+            # Premultiplied "over" in two draws: darken by the alpha, then add the colors
+            cutout = image.copy()
+            cutout.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MULT)
+            colors = image.copy()
+            colors.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MAX)
+            textures = (Texture.from_surface(self.renderer, cutout), Texture.from_surface(self.renderer, colors))
+            textures[0].blend_mode = pygame.BLENDMODE_BLEND
+            textures[1].blend_mode = pygame.BLENDMODE_ADD
+            self._premultiplied[image] = textures
+        for texture in textures:
+            texture.draw(dstrect=(position[0], position[1], image.get_width(), image.get_height()))
+    
+    def _flush_layer(self):
+        """Upload the canvas as the next layer and clear it for whatever is drawn above."""
+        if self._layer_count == len(self._layers):
+            layer = Texture(self.renderer, self.target_size, streaming=True)
+            layer.blend_mode = pygame.BLENDMODE_BLEND
+            self._layers.append(layer)
+        layer = self._layers[self._layer_count]
+        layer.update(self.screen)
+        layer.draw()
+        self._layer_count += 1
+        self.screen.fill((0, 0, 0, 0))
+    
+    def present(self, rects: Optional[List[pygame.Rect]] = None) -> int:
+        """Draw the last canvas layer and show the frame, returning the pixels pushed.
+        
+        The renderer redraws the whole window every frame, so changed regions are ignored.
+        """
+        self._flush_layer()
+        self.renderer.present()
+        width, height = self.window.size
+        return width * height
+    
+    def close(self):
+        """Drop the textures before pygame.quit destroys the renderer."""
+        global _texture_backend
+        self._textures.clear()
+        self._premultiplied.clear()
+        self._layers = []
+        if _texture_backend is self:
+            _texture_backend = None
+
+
+# The texture backend whose sprite pass is running
+_sprite_backend: Optional[TextureBackend] = None
+
+# The texture backend that owns the window, if any
+_texture_backend: Optional[TextureBackend] = None
+
+
+def _target_size(logical_size: Tuple[int, int], pixel_scale: int) -> Tuple[int, int]:
+    """The logical size shrunk by a scene's pixel scale."""
+    return (logical_size[0] // pixel_scale, logical_size[1] // pixel_scale)
+
+
+def _open_display(size: Tuple[int, int], flags: int, vsync: bool) -> Tuple[pygame.Surface, bool]:
+    """set_mode, with vsync when asked for and available; also returns whether vsync is on."""
+    if vsync:
+        try:
+            return pygame.display.set_mode(size, flags, vsync=1), True
+        except pygame.error as e:
+            print(f"Could not enable vsync: {e}")
+    return pygame.display.set_mode(size, flags), False
+
+
+def create_backend(name: str, logical_size: Tuple[int, int], window_scale: int = 1,
+                   driver: Optional[str] = None, vsync: bool = False):
+    """Open the window with the named backend, falling back to software surfaces."""
+    global _texture_backend
+    if name == "texture":
+        try:
+            _texture_backend = TextureBackend(logical_size, window_scale, driver, vsync)
+            return _texture_backend
+        except (pygame.error, ValueError) as e:
+            print(f"Could not create texture renderer, using surfaces: {e}")
+    return SurfaceBackend(logical_size, window_scale, vsync)
+
+
+@contextmanager
+def sprite_pass(surface: pygame.Surface):
+    """Draw the sprites inside with the renderer when surface is a texture backend's canvas."""
+    backend = _texture_backend
+    if backend is not None and surface is backend.screen:
+        with backend.sprite_pass():
+            yield
+    else:
+        yield
+
+
+def sprite_backend(surface: pygame.Surface) -> Optional[TextureBackend]:
+    """The backend that draws sprites meant for surface (None when they are blitted)."""
+    backend = _sprite_backend
+    if backend is not None and surface is backend.screen:
+        return backend
+    return None
+
+
+def upper_layer_backend(surface: pygame.Surface) -> Optional[TextureBackend]:
+    """The backend when surface is its canvas and is a transparent layer above GPU-drawn sprites."""
+    backend = _texture_backend
+    if backend is not None and surface is backend.screen and backend._layer_count:
+        return backend
+    return None
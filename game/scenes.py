@@ -7,10 +7,20 @@ import pygame
 import os
 import math
 import random
+from functools import partial
 from typing import Optional
-from game.character import Samurai1, Samurai2, YellowNinja
+from game.asset_loader import image_cache
+from game.bitmap_font import get_font
+from game.character import Samurai1, Samurai2, YellowNinja, load_roster_strips
+from game.compositor import StaticLayer, compose_static
+from game.dirty_rects import DirtyTracker
+from game.draw_list import LAYER_BACKGROUND, DrawList, draw_list
+from game.effects import GLOW_KEY, GlowMask, TextLayer, bake_text, draw_blocking_effect, draw_overlay
+from game.hud_bars import SegmentBar
 from game.input_handler import PlayerInput
+from game.render_backend import NATIVE_PIXEL_SCALE, sprite_pass
 from game.resource_utils import sprite_path
+from game.text_render import render_pixel_text
 
 
 class SplashScene:
@@ -40,23 +50,16 @@ class SplashScene:
         self.glow_timer = 0.0
         self.glow_speed = 2.0  # Glow pulsing speed
         
+        # Static splash art, built on the first frame
+        self.splash_art = None
+        self.main_text_rect = None
+        
     def _init_fonts(self):
         """Initialize fonts for splash screen."""
-        self.mega_font = pygame.font.Font(None, 72)     # Extra large for splash
-        self.large_font = pygame.font.Font(None, 48)    # Large for underline
-        
-    def _render_pixel_text(self, text: str, font: pygame.font.Font, color: tuple, scale: int = 2):
-        """Render text with pixelated, retro look by scaling up small text."""
-        # Render text at small size first
-        small_surface = font.render(text, False, color)  # False = no anti-aliasing for pixel look
+        self.mega_font = get_font(72)     # Extra large for splash
+        self.large_font = get_font(48)    # Large for underline
+        self.ascii_font = get_font(12)    # Small for the ASCII art
         
-        # Scale up using nearest neighbor to maintain pixel edges
-        original_size = small_surface.get_size()
-        new_size = (original_size[0] * scale, original_size[1] * scale)
-        scaled_surface = pygame.transform.scale(small_surface, new_size)
-        
-        return scaled_surface
-    
     def handle_input(self, keys_pressed: dict, events: list) -> str:
         """Handle splash input - can skip with any key."""
         for event in events:
@@ -77,36 +80,10 @@ class SplashScene:
         """Check if splash screen is finished."""
         return self.finished
     
-    def render(self, screen: pygame.Surface):
-        """Render the splash screen."""
-        # Clear with dark background
-        screen.fill(self.bg_color)
-        
-        # Calculate fade effect
-        fade_alpha = 255  # Default full opacity
-        if self.splash_timer > self.fade_start_time:
-            # Calculate fade progress (0.0 = full opacity, 1.0 = fully transparent)
-            fade_progress = (self.splash_timer - self.fade_start_time) / self.fade_duration
-            fade_progress = min(fade_progress, 1.0)  # Clamp to 1.0
-            fade_alpha = int(255 * (1.0 - fade_progress))  # 255 -> 0
-        
-        # Calculate glow effect intensity
-        glow_intensity = abs(math.cos(self.glow_timer * self.glow_speed))
-        
-        # Create multiple glow layers for flashy effect
-        base_pink = (255, 20, 147)  # Hot pink base
-        bright_pink = (255, 105, 180)  # Brighter pink for glow
-        
-        # Mix colors based on glow intensity
-        glow_color = (
-            int(base_pink[0] + (bright_pink[0] - base_pink[0]) * glow_intensity),
-            int(base_pink[1] + (bright_pink[1] - base_pink[1]) * glow_intensity),
-            int(base_pink[2] + (bright_pink[2] - base_pink[2]) * glow_intensity)
-        )
-        
-        # Create a surface for the entire splash content to apply fade
-        splash_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        splash_surface.fill((0, 0, 0, 0))  # Transparent background
+    def _build_splash_art(self) -> GlowMask:
+        """Draw the static splash art once, with the glow as a recolorable palette entry."""
+        art = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+        art.fill((0, 0, 0, 0))  # Transparent background
         
         # ASCII Art above MOKKU text - Simple character silhouette
         ascii_art = [
@@ -136,24 +113,19 @@ class SplashScene:
         
         # Render ASCII art with neon pink glow
         try:
-            ascii_font = pygame.font.Font(None, 12)  # Smaller font for better fitting
             ascii_start_y = 20  # Start position for ASCII art
             
             for i, line in enumerate(ascii_art):
-                # Create the ASCII art line with glow effect
-                ascii_surface = ascii_font.render(line, False, glow_color)
-                ascii_rect = ascii_surface.get_rect()
+                # Glyphs are blitted straight from the font's atlas, no per-line surfaces
+                ascii_rect = pygame.Rect((0, 0), self.ascii_font.text_size(line))
                 ascii_rect.centerx = self.screen_width // 2
                 ascii_rect.y = ascii_start_y + i * 10  # Tighter line spacing
                 
                 # Add shadow effect for the ASCII art
-                shadow_surface = ascii_font.render(line, False, (80, 5, 40))
-                shadow_rect = shadow_surface.get_rect()
-                shadow_rect.centerx = self.screen_width // 2 + 1
-                shadow_rect.y = ascii_start_y + i * 10 + 1
+                shadow_rect = ascii_rect.move(1, 1)
                 
-                splash_surface.blit(shadow_surface, shadow_rect)
-                splash_surface.blit(ascii_surface, ascii_rect)
+                self.ascii_font.draw(art, line, (80, 5, 40), shadow_rect.topleft)
+                self.ascii_font.draw(art, line, GLOW_KEY, ascii_rect.topleft)
         except Exception as e:
             print(f"ASCII art rendering error: {e}")
         
@@ -167,19 +139,17 @@ class SplashScene:
         shadow_offsets = [(6, 6), (4, 4), (2, 2)]
         shadow_colors = [(80, 5, 40), (120, 10, 60), (160, 15, 80)]
         
-        for offset, shadow_color in zip(shadow_offsets, shadow_colors):
-            shadow_text = self._render_pixel_text(main_text, self.mega_font, shadow_color, 2)
-            shadow_rect = shadow_text.get_rect()
-            shadow_rect.centerx = self.screen_width // 2 + offset[0]
-            shadow_rect.centery = main_text_y + offset[1]
-            splash_surface.blit(shadow_text, shadow_rect)
+        # Baked once into a single surface
+        shadow_stack = tuple(TextLayer(main_text, self.mega_font, shadow_color, 2, offsets=(offset,))
+                             for offset, shadow_color in zip(shadow_offsets, shadow_colors))
+        bake_text(shadow_stack).draw(art, (self.screen_width // 2, main_text_y))
         
         # Main text with glow effect
-        main_surface = self._render_pixel_text(main_text, self.mega_font, glow_color, 2)
+        main_surface = render_pixel_text(main_text, self.mega_font, GLOW_KEY, 2)
         main_rect = main_surface.get_rect()
         main_rect.centerx = self.screen_width // 2
         main_rect.centery = main_text_y
-        splash_surface.blit(main_surface, main_rect)
+        art.blit(main_surface, main_rect)
         
         # Create underline effect with same glow
         underline_y = main_rect.bottom + 10
@@ -188,45 +158,75 @@ class SplashScene:
         # Multiple underline layers for glow effect
         for i in range(3):
             thickness = underline_thickness + (2 - i) * 2
-            alpha_color = (
-                glow_color[0],
-                glow_color[1], 
-                glow_color[2]
-            )
             
             # Create surface for underline with alpha
             underline_surf = pygame.Surface((main_rect.width + 20, thickness))
-            underline_surf.fill(alpha_color)
+            underline_surf.fill(GLOW_KEY)
             if i > 0:
                 underline_surf.set_alpha(100 - i * 30)  # Fade outer layers
             
             underline_rect = underline_surf.get_rect()
             underline_rect.centerx = self.screen_width // 2
             underline_rect.y = underline_y + i * 2
-            splash_surface.blit(underline_surf, underline_rect)
-        
-        # Add some sparkle effects directly to splash surface
-        for _ in range(8):
-            if random.random() < 0.3:  # 30% chance each frame
-                spark_x = random.randint(main_rect.left - 50, main_rect.right + 50)
-                spark_y = random.randint(main_rect.top - 30, main_rect.bottom + 50)
-                spark_size = random.randint(2, 6)
-                pygame.draw.circle(splash_surface, (255, 255, 255), (spark_x, spark_y), spark_size)
+            art.blit(underline_surf, underline_rect)
         
         # Skip instruction at bottom
-        skip_surface = self._render_pixel_text("PRESS ANY KEY TO CONTINUE", self.large_font, (150, 150, 150), 1)
+        skip_surface = render_pixel_text("PRESS ANY KEY TO CONTINUE", self.large_font, (150, 150, 150), 1)
         skip_rect = skip_surface.get_rect()
         skip_rect.centerx = self.screen_width // 2
         skip_rect.y = self.screen_height - 60
-        splash_surface.blit(skip_surface, skip_rect)
+        art.blit(skip_surface, skip_rect)
         
-        # Apply fade effect to the entire splash surface
-        if fade_alpha < 255:
-            splash_surface.set_alpha(fade_alpha)
+        # Sparkles (up to 6px) are drawn around the main text every frame
+        self.main_text_rect = main_rect
+        sparkle_area = pygame.Rect(main_rect.left - 56, main_rect.top - 36, main_rect.width + 113, main_rect.height + 93)
         
-        # Blit the faded splash surface to the main screen
-        screen.blit(splash_surface, (0, 0))
-
+        return GlowMask(art, ((80, 5, 40), (120, 10, 60), (160, 15, 80), (150, 150, 150), (255, 255, 255)),
+                        sparkle_area)
+    
+    def render(self, screen: pygame.Surface):
+        """Render the splash screen."""
+        # Clear with dark background
+        screen.fill(self.bg_color)
+        
+        # Calculate fade effect
+        fade_alpha = 255  # Default full opacity
+        if self.splash_timer > self.fade_start_time:
+            # Calculate fade progress (0.0 = full opacity, 1.0 = fully transparent)
+            fade_progress = (self.splash_timer - self.fade_start_time) / self.fade_duration
+            fade_progress = min(fade_progress, 1.0)  # Clamp to 1.0
+            fade_alpha = int(255 * (1.0 - fade_progress))  # 255 -> 0
+        
+        # Calculate glow effect intensity
+        glow_intensity = abs(math.cos(self.glow_timer * self.glow_speed))
+        
+        # Create multiple glow layers for flashy effect
+        base_pink = (255, 20, 147)  # Hot pink base
+        bright_pink = (255, 105, 180)  # Brighter pink for glow
+        
+        # Mix colors based on glow intensity
+        glow_color = (
+            int(base_pink[0] + (bright_pink[0] - base_pink[0]) * glow_intensity),
+            int(base_pink[1] + (bright_pink[1] - base_pink[1]) * glow_intensity),
+            int(base_pink[2] + (bright_pink[2] - base_pink[2]) * glow_intensity)
+        )
+        
+        # Static art is drawn once; each frame recolors its glow
+        if self.splash_art is None:
+            self.splash_art = self._build_splash_art()
+        self.splash_art.set_glow(glow_color)
+        
+        # Add some sparkle effects directly to the splash art
+        main_rect = self.main_text_rect
+        for _ in range(8):
+            if random.random() < 0.3:  # 30% chance each frame
+                spark_x = random.randint(main_rect.left - 50, main_rect.right + 50)
+                spark_y = random.randint(main_rect.top - 30, main_rect.bottom + 50)
+                spark_size = random.randint(2, 6)
+                self.splash_art.mark_circle((255, 255, 255), (spark_x, spark_y), spark_size)
+        
+        # Apply fade effect to the entire splash and blit it to the main screen
+        self.splash_art.draw(screen, fade_alpha)
 
 class MainMenuScene:
     """Main menu scene with retro aesthetics."""
@@ -244,6 +244,7 @@ class MainMenuScene:
         self.bg_color = (20, 30, 40)  # Dark blue background
         self.background_image = None
         self._load_background()
+        self.static_background = None  # Merged on the first frame
         
         # Fonts
         self.font = None
@@ -255,35 +256,27 @@ class MainMenuScene:
         self.menu_blink_timer = 0.0
         self.menu_blink_speed = 1.0  # Blinks per second
         
+        # Only the menu options change between frames
+        self.dirty = DirtyTracker()
+        
     def _init_fonts(self):
         """Initialize pixelated retro fonts."""
-        self.font = pygame.font.Font(None, 24)          # Medium pixelated text  
-        self.large_font = pygame.font.Font(None, 32)    # Large pixelated text
-        self.mega_font = pygame.font.Font(None, 48)     # Mega pixelated text
+        self.font = get_font(24)          # Medium pixelated text  
+        self.large_font = get_font(32)    # Large pixelated text
+        self.mega_font = get_font(48)     # Mega pixelated text
     
-    def _render_pixel_text(self, text: str, font: pygame.font.Font, color: tuple, scale: int = 2):
-        """Render text with pixelated, retro look by scaling up small text."""
-        # Render text at small size first
-        small_surface = font.render(text, False, color)  # False = no anti-aliasing for pixel look
-        
-        # Scale up using nearest neighbor to maintain pixel edges
-        original_size = small_surface.get_size()
-        new_size = (original_size[0] * scale, original_size[1] * scale)
-        scaled_surface = pygame.transform.scale(small_surface, new_size)
-        
-        return scaled_surface
+    @classmethod
+    def asset_jobs(cls, screen_width: int, screen_height: int) -> list:
+        """Loads the asset loader can run ahead of building this scene."""
+        return [partial(image_cache.get, "background.png", (screen_width, screen_height))]
     
     def _load_background(self):
         """Load background image if available."""
         bg_path = sprite_path("background.png")
         if os.path.exists(bg_path):
             try:
-                self.background_image = pygame.image.load(bg_path)
-                # Scale to screen size
-                self.background_image = pygame.transform.scale(
-                    self.background_image, 
-                    (self.screen_width, self.screen_height)
-                )
+                # Scaled to screen size (shared, darkened once by the compositor)
+                self.background_image = image_cache.get("background.png", (self.screen_width, self.screen_height))
             except pygame.error:
                 self.background_image = None
     
@@ -313,32 +306,29 @@ class MainMenuScene:
     
     def render(self, screen: pygame.Surface):
         """Render the main menu."""
-        # Draw background
-        if self.background_image:
-            # Darken the background for menu
-            darkened_bg = self.background_image.copy()
-            darkened_bg.fill((0, 0, 0, 180), special_flags=pygame.BLEND_RGBA_MULT)
-            screen.blit(darkened_bg, (0, 0))
-        else:
-            screen.fill(self.bg_color)
-        
-        # Title with neon effect (pink shadow + blue text)
-        # First render the shadow in neon pink, offset by a few pixels
-        title_shadow = self._render_pixel_text("PROPER DUEL", self.large_font, (255, 20, 147), 3)  # Hot pink shadow
-        shadow_rect = title_shadow.get_rect()
-        shadow_rect.centerx = self.screen_width // 2 + 3  # Offset shadow 3 pixels right
-        shadow_rect.y = 80 + 3  # Offset shadow 3 pixels down
-        screen.blit(title_shadow, shadow_rect)
-        
-        # Then render the main title in neon blue on top
-        title_text = self._render_pixel_text("PROPER DUEL", self.large_font, (0, 255, 255), 3)  # Cyan/neon blue
-        title_rect = title_text.get_rect()
+        # Draw background (darkened once, merged with the fallback color)
+        if self.static_background is None:
+            layers = ()
+            if self.background_image:
+                # Darken the background for menu
+                layers = (StaticLayer(self.background_image, tint=(0, 0, 0, 180)),)
+            self.static_background = compose_static((self.screen_width, self.screen_height), layers, self.bg_color)
+        screen.blit(self.static_background, (0, 0))
+        
+        # Title with neon effect (pink shadow + blue text), baked into one surface
+        title_rect = pygame.Rect((0, 0), self.large_font.text_size("PROPER DUEL", 3))
         title_rect.centerx = self.screen_width // 2
         title_rect.y = 80
-        screen.blit(title_text, title_rect)
+        title_layers = (
+            # First the shadow in neon pink, offset 3 pixels right and down
+            TextLayer("PROPER DUEL", self.large_font, (255, 20, 147), 3, offsets=((3, 3),)),  # Hot pink shadow
+            # Then the main title in neon blue on top
+            TextLayer("PROPER DUEL", self.large_font, (0, 255, 255), 3),  # Cyan/neon blue
+        )
+        bake_text(title_layers).draw(screen, title_rect.center)
         
         # Subtitle
-        subtitle_text = self._render_pixel_text("PIXEL FIGHTING CHAMPIONSHIP", self.font, (200, 200, 200), 2)
+        subtitle_text = render_pixel_text("PIXEL FIGHTING CHAMPIONSHIP", self.font, (200, 200, 200), 2)
         subtitle_rect = subtitle_text.get_rect()
         subtitle_rect.centerx = self.screen_width // 2
         subtitle_rect.y = title_rect.bottom + 15  # Closer to the title
@@ -349,6 +339,9 @@ class MainMenuScene:
         option_spacing = 60
         
         for i, option in enumerate(self.menu_options):
+            shadow_rect = None
+            blink_phase = None
+            
             # Determine color and scale based on selection
             if i == self.selected_option:
                 # Neon effect for selected option (same as title)
@@ -363,7 +356,7 @@ class MainMenuScene:
                 prefix = "> "
                 
                 # Render shadow first (offset)
-                shadow_text = self._render_pixel_text(f"{prefix}{option}", self.large_font, shadow_color, scale)
+                shadow_text = render_pixel_text(f"{prefix}{option}", self.large_font, shadow_color, scale)
                 shadow_rect = shadow_text.get_rect()
                 shadow_rect.centerx = self.screen_width // 2 + 2  # Offset shadow 2 pixels right
                 shadow_rect.y = menu_start_y + i * option_spacing + 2  # Offset shadow 2 pixels down
@@ -374,13 +367,20 @@ class MainMenuScene:
                 prefix = "  "
             
             # Render main text
-            option_text = self._render_pixel_text(f"{prefix}{option}", self.large_font, color, scale)
+            option_text = render_pixel_text(f"{prefix}{option}", self.large_font, color, scale)
             option_rect = option_text.get_rect()
             option_rect.centerx = self.screen_width // 2
             option_rect.y = menu_start_y + i * option_spacing
             screen.blit(option_text, option_rect)
+            
+            area = option_rect.union(shadow_rect) if shadow_rect else option_rect
+            self.dirty.track(("option", i), blink_phase, area)
         
         # Instructions removed - cleaner main menu interface
+    
+    def get_dirty_rects(self) -> Optional[list]:
+        """Screen regions changed by the last render (None when all of it changed)."""
+        return self.dirty.collect()
 
 
 class LevelSelectScene:
@@ -399,6 +399,7 @@ class LevelSelectScene:
         self.bg_color = (20, 30, 40)  # Dark blue background
         self.background_image = None
         self._load_background()
+        self.static_background = None  # Merged on the first frame
         
         # Fonts
         self.font = None
@@ -409,29 +410,26 @@ class LevelSelectScene:
         self.menu_blink_timer = 0.0
         self.menu_blink_speed = 1.0  # Blinks per second
         
+        # Only the menu options change between frames
+        self.dirty = DirtyTracker()
+        
     def _init_fonts(self):
         """Initialize pixelated retro fonts."""
-        self.font = pygame.font.Font(None, 24)          # Medium pixelated text  
-        self.large_font = pygame.font.Font(None, 32)    # Large pixelated text
+        self.font = get_font(24)          # Medium pixelated text  
+        self.large_font = get_font(32)    # Large pixelated text
     
-    def _render_pixel_text(self, text: str, font: pygame.font.Font, color: tuple, scale: int = 2):
-        """Render text with pixelated, retro look by scaling up small text."""
-        small_surface = font.render(text, False, color)  # False = no anti-aliasing for pixel look
-        original_size = small_surface.get_size()
-        new_size = (original_size[0] * scale, original_size[1] * scale)
-        scaled_surface = pygame.transform.scale(small_surface, new_size)
-        return scaled_surface
+    @classmethod
+    def asset_jobs(cls, screen_width: int, screen_height: int) -> list:
+        """Loads the asset loader can run ahead of building this scene."""
+        return [partial(image_cache.get, "background.png", (screen_width, screen_height))]
     
     def _load_background(self):
         """Load background image if available."""
         bg_path = sprite_path("background.png")
         if os.path.exists(bg_path):
             try:
-                self.background_image = pygame.image.load(bg_path)
-                self.background_image = pygame.transform.scale(
-                    self.background_image, 
-                    (self.screen_width, self.screen_height)
-                )
+                # Shared with the main menu (darkened once by the compositor)
+                self.background_image = image_cache.get("background.png", (self.screen_width, self.screen_height))
             except pygame.error:
                 self.background_image = None
     
@@ -461,17 +459,17 @@ class LevelSelectScene:
     
     def render(self, screen: pygame.Surface):
         """Render the level select screen."""
-        # Draw background
-        if self.background_image:
-            # Darken the background for menu
-            darkened_bg = self.background_image.copy()
-            darkened_bg.fill((0, 0, 0, 180), special_flags=pygame.BLEND_RGBA_MULT)
-            screen.blit(darkened_bg, (0, 0))
-        else:
-            screen.fill(self.bg_color)
+        # Draw background (darkened once, merged with the fallback color)
+        if self.static_background is None:
+            layers = ()
+            if self.background_image:
+                # Darken the background for menu
+                layers = (StaticLayer(self.background_image, tint=(0, 0, 0, 180)),)
+            self.static_background = compose_static((self.screen_width, self.screen_height), layers, self.bg_color)
+        screen.blit(self.static_background, (0, 0))
         
         # Title
-        title_text = self._render_pixel_text("LEVEL SELECT", self.large_font, (0, 255, 255), 3)  # Cyan
+        title_text = render_pixel_text("LEVEL SELECT", self.large_font, (0, 255, 255), 3)  # Cyan
         title_rect = title_text.get_rect()
         title_rect.centerx = self.screen_width // 2
         title_rect.y = 100
@@ -500,30 +498,45 @@ class LevelSelectScene:
                 color = (180, 180, 180)
                 scale = 2
             
-            option_text = self._render_pixel_text(option, self.large_font, color, scale)
+            option_text = render_pixel_text(option, self.large_font, color, scale)
             option_rect = option_text.get_rect()
             option_rect.centerx = self.screen_width // 2
             option_rect.y = menu_start_y + i * option_spacing
             screen.blit(option_text, option_rect)
+            self.dirty.track(("option", i), color, option_rect)
             
             # Show level description
             if i < len(level_descriptions) and level_descriptions[i]:
-                desc_text = self._render_pixel_text(level_descriptions[i], self.font, (150, 150, 150), 1)
+                desc_text = render_pixel_text(level_descriptions[i], self.font, (150, 150, 150), 1)
                 desc_rect = desc_text.get_rect()
                 desc_rect.centerx = self.screen_width // 2
                 desc_rect.y = option_rect.bottom + 10
                 screen.blit(desc_text, desc_rect)
         
         # Instructions removed - cleaner level select interface
+    
+    def get_dirty_rects(self) -> Optional[list]:
+        """Screen regions changed by the last render (None when all of it changed)."""
+        return self.dirty.collect()
 
 
 class FightScene:
-    """Main fighting scene with player vs AI - First to 3 wins."""
+    """Main fighting scene with player vs AI - First to 3 wins.
+    
+    The scene simulates in game pixels but draws at the samurai sheets' native
+    resolution, pixel_scale times smaller (view_width x view_height). The render
+    backend upscales the frame to the window once.
+    """
+    
+    # Game pixels per drawn pixel
+    pixel_scale = NATIVE_PIXEL_SCALE
     
     def __init__(self, screen_width: int, screen_height: int):
         """Initialize the fight scene."""
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.view_width = screen_width // self.pixel_scale
+        self.view_height = screen_height // self.pixel_scale
         
         # Audio (will be set by the game engine)
         self.attack_sound = None
@@ -534,8 +547,8 @@ class FightScene:
         # Screen height is 600px, character hitbox is 100px, so Y = 600 - 100 = 500
         ground_level_y = self.screen_height - 100  # Bottom edge of hitbox touches bottom of screen
         
-        self.player1 = Samurai1(150, ground_level_y)  # Human player (left side)
-        self.player2 = Samurai2(600, ground_level_y)  # AI opponent (right side)
+        self.player1 = Samurai1(150, ground_level_y, pixel_scale=self.pixel_scale)  # Human player (left side)
+        self.player2 = Samurai2(600, ground_level_y, pixel_scale=self.pixel_scale)  # AI opponent (right side)
         
         # Match state (first to 3 wins)
         self.player_wins = 0
@@ -558,10 +571,17 @@ class FightScene:
         self.round_end_timer = 0.0
         self.round_end_duration = 2.5  # seconds to show death animation and round result
         
+        # Simulated seconds (frozen steps don't count); pulsing effects follow it, so replays draw the same frames
+        self.scene_time = 0.0
+        
         # Pause state
         self.is_paused = False
         self.pause_blink_timer = 0.0
         self.pause_blink_speed = 2.0  # Blinks per second
+        self._pause_glow = None  # Glow layers of the pause text
+        
+        # HUD bars, kept between frames and keyed by kind and position
+        self._hud_bars = {}
         
         # Dialogue state
         self.showing_dialogue = False
@@ -582,30 +602,23 @@ class FightScene:
         
         # Font for UI (will be initialized when needed)
         self.font = None
+        self.tiny_font = None
         self.small_font = None
         self.large_font = None
         self.mega_font = None
+        self.huge_font = None
         self._init_fonts()
     
     def _init_fonts(self):
         """Initialize pixelated retro fonts."""
-        # Create pixelated fonts by using small sizes and no anti-aliasing
-        self.small_font = pygame.font.Font(None, 16)    # Small pixelated text
-        self.font = pygame.font.Font(None, 24)          # Medium pixelated text  
-        self.large_font = pygame.font.Font(None, 32)    # Large pixelated text
-        self.mega_font = pygame.font.Font(None, 48)     # Mega pixelated text
-    
-    def _render_pixel_text(self, text: str, font: pygame.font.Font, color: tuple, scale: int = 2):
-        """Render text with pixelated, retro look by scaling up small text."""
-        # Render text at small size first
-        small_surface = font.render(text, False, color)  # False = no anti-aliasing for pixel look
-        
-        # Scale up using nearest neighbor to maintain pixel edges
-        original_size = small_surface.get_size()
-        new_size = (original_size[0] * scale, original_size[1] * scale)
-        scaled_surface = pygame.transform.scale(small_surface, new_size)
-        
-        return scaled_surface
+        # Create pixelated fonts by using small sizes and no anti-aliasing; text is
+        # drawn unscaled at the native resolution, so sizes are in drawn pixels
+        self.tiny_font = get_font(14)     # Fine print
+        self.small_font = get_font(16)    # Small pixelated text
+        self.font = get_font(24)          # Medium pixelated text  
+        self.large_font = get_font(32)    # Large pixelated text
+        self.mega_font = get_font(48)     # Mega pixelated text
+        self.huge_font = get_font(72)     # Round result
     
     def set_sounds(self, attack_sound, block_sound, pain_sound):
         """Set attack, block, and pain sounds for both characters."""
@@ -622,73 +635,25 @@ class FightScene:
     def _render_blocking_indicators(self, surface: pygame.Surface):
         """Render visual indicators when characters are blocking (Energy Barrier + Weapon Glow)."""
         import math
-        current_time = pygame.time.get_ticks()
+        current_time = int(self.scene_time * 1000)
         
         # Player 1 blocking indicator
         if self.player1.is_blocking:
-            self._render_character_blocking_effect(surface, self.player1, current_time, self.player1_is_parrying)
+            draw_blocking_effect(surface, self.player1, current_time, self.player1_is_parrying)
             
         # Player 2 blocking indicator  
         if self.player2.is_blocking:
-            self._render_character_blocking_effect(surface, self.player2, current_time, self.player2_is_parrying)
+            draw_blocking_effect(surface, self.player2, current_time, self.player2_is_parrying)
     
-    def _render_character_blocking_effect(self, surface: pygame.Surface, character, current_time, is_parrying=False):
-        """Render blocking effect for a specific character."""
-        import math
-        
-        # Choose colors based on parrying state
-        if is_parrying:
-            # Green colors for parrying
-            barrier_base_color = (0, 255, 0)  # Green barrier
-            glow_base_color = (0, 255, 100)  # Green-tinted glow
-        else:
-            # Blue colors for normal blocking
-            barrier_base_color = (0, 100, 255)  # Blue barrier
-            glow_base_color = (100, 100, 255)  # Blue-tinted glow
-        
-        # Energy barrier effect
-        barrier_width = 8
-        barrier_height = character.height - 10
-        barrier_alpha = 180 + int(40 * math.sin(current_time * 0.01))  # Pulsing effect
-        
-        # Position barrier in front of character based on facing direction
-        if character.facing_right:
-            barrier_x = character.x + character.width + 5
-        else:
-            barrier_x = character.x - barrier_width - 5
-            
-        barrier_y = character.y + 5
-        
-        # Create energy barrier surface with transparency
-        barrier_surface = pygame.Surface((barrier_width, barrier_height))
-        barrier_surface.set_alpha(barrier_alpha)
-        
-        # Gradient effect - multiple layers for energy look
-        for i in range(barrier_width):
-            alpha_mult = 1.0 - (i / barrier_width) * 0.5
-            r = int(barrier_base_color[0] * alpha_mult) if barrier_base_color[0] > 0 else 0
-            g = int(barrier_base_color[1] * alpha_mult) if barrier_base_color[1] > 0 else 0
-            b = int(barrier_base_color[2] * alpha_mult) if barrier_base_color[2] > 0 else 0
-            color = (r, g, b)
-            pygame.draw.rect(barrier_surface, color, (i, 0, 1, barrier_height))
-        
-        surface.blit(barrier_surface, (barrier_x, barrier_y))
-        
-        # Weapon glow effect (overlay on character sprite area)
-        glow_intensity = 150 + int(50 * math.sin(current_time * 0.015))  # Pulsing glow
-        glow_color = (glow_intensity if glow_base_color[0] > 0 else glow_intensity // 3,
-                      glow_intensity if glow_base_color[1] > 0 else glow_intensity // 3,
-                      glow_intensity if glow_base_color[2] > 0 else 255)
-        
-        # Create glow outline around character
-        glow_surface = pygame.Surface((character.width + 6, character.height + 6))
-        glow_surface.set_alpha(80)
-        glow_surface.fill(glow_color)
-        
-        # Render glow behind character
-        glow_x = character.x - 3
-        glow_y = character.y - 3
-        surface.blit(glow_surface, (glow_x, glow_y))
+    def begin_step(self):
+        """Remember the fighters' positions before a simulation step, for render interpolation."""
+        self.player1.store_position()
+        self.player2.store_position()
+    
+    def set_render_blend(self, blend: float):
+        """Draw the fighters blend of the way from their previous step positions to the current ones."""
+        self.player1.render_blend = blend
+        self.player2.render_blend = blend
     
     def update_pause(self, dt: float, paused: bool):
         """Update pause state and blinking animation."""
@@ -747,6 +712,7 @@ class FightScene:
     
     def update(self, dt: float, player1_input: PlayerInput, player2_input: PlayerInput):
         """Update the fight scene."""
+        self.scene_time += dt
         if self.match_over:
             return
         
@@ -791,6 +757,10 @@ class FightScene:
     
     def _handle_combat(self):
         """Handle combat between player and AI."""
+        # Warm up the lazily loaded reaction animations before they are needed
+        self.player1.prefetch_reactions(self.player2)
+        self.player2.prefetch_reactions(self.player1)
+        
         # Check if player hits AI with regular attack
         p1_attack = self.player1.get_attack_rect()
         if p1_attack and p1_attack.colliderect(self.player2.get_rect()):
@@ -929,22 +899,33 @@ class FightScene:
         self.player2.on_ground = True
         self.player2.is_dead = False  # Reset death state
         
+        # Teleported, so don't draw them sliding there
+        self.player1.store_position()
+        self.player2.store_position()
+        
         print(f"Round {self.current_round} begins!")
     
+    @classmethod
+    def asset_jobs(cls, screen_width: int, screen_height: int) -> list:
+        """Loads the asset loader can run ahead of building this scene."""
+        view_size = (screen_width // cls.pixel_scale, screen_height // cls.pixel_scale)
+        jobs = [partial(image_cache.get, "background.png", view_size, convert=True),
+                partial(image_cache.get, "portrait.png", (37, 37), alpha=True)]
+        # Both samurai share their sheets, so load them as one batch (lazy animations load on use);
+        # the scene packs them into the atlas on the main thread
+        jobs.append(partial(load_roster_strips, (Samurai1, Samurai2), include_lazy=False,
+                            pixel_scale=cls.pixel_scale, pack=False))
+        return jobs
+    
     def _load_background(self):
         """Load and scale the background image."""
         try:
             bg_path = sprite_path("background.png")
-            original_bg = pygame.image.load(bg_path).convert()
-            
-            # Get original dimensions
-            orig_width, orig_height = original_bg.get_size()
-            print(f"Original background size: {orig_width}x{orig_height}")
             
-            # Scale to fill the screen (800x600) - force exact dimensions
-            self.background_image = pygame.transform.scale(original_bg, (800, 600))
-            print(f"Scaled background to: 800x600")
-            print(f"Loaded background image: {bg_path}")
+            # Scale to fill the view - force exact dimensions
+            view_size = (self.view_width, self.view_height)
+            self.background_image = image_cache.get("background.png", view_size, convert=True)
+            print(f"Loaded background image: {bg_path} ({self.view_width}x{self.view_height})")
         except Exception as e:
             print(f"Could not load background image: {e}")
             self.background_image = None
@@ -954,17 +935,17 @@ class FightScene:
         # Background
         if self.background_image:
             # Render background image scaled to fill screen
-            surface.blit(self.background_image, (0, 0))
+            draw_list.submit(self.background_image, (0, 0), LAYER_BACKGROUND)
         else:
             # Fallback to solid color
             surface.fill(self.bg_color)
         
-        # Render characters
-        self.player1.render(surface)
-        self.player2.render(surface)
-        
-        # Render blocking indicators
-        self._render_blocking_indicators(surface)
+        # Render background and characters in one batch, then blocking indicators (GPU-drawn on the texture backend)
+        with sprite_pass(surface):
+            self.player1.render(draw_list)
+            self.player2.render(draw_list)
+            draw_list.flush(surface)
+            self._render_blocking_indicators(surface)
         
         # Render UI
         self._render_ui(surface)
@@ -980,31 +961,34 @@ class FightScene:
     def _render_ui(self, surface: pygame.Surface):
         """Render the user interface with pixelated retro style."""
         # Timer (large, prominent)
-        timer_text = self._render_pixel_text(f"{int(self.round_time):02d}", self.large_font, (255, 255, 255), 3)
-        timer_rect = timer_text.get_rect(center=(self.screen_width // 2, 40))
-        surface.blit(timer_text, timer_rect)
+        timer_text = render_pixel_text(f"{int(self.round_time):02d}", self.mega_font, (255, 255, 255), 1)
+        timer_rect = timer_text.get_rect(center=(self.view_width // 2, 20))
+        draw_list.blit(timer_text, timer_rect)
         
         # Round counter (small, centered)
-        round_text = self._render_pixel_text(f"ROUND {self.current_round}", self.small_font, (200, 200, 200), 2)
-        round_rect = round_text.get_rect(center=(self.screen_width // 2, 70))
-        surface.blit(round_text, round_rect)
+        round_text = render_pixel_text(f"ROUND {self.current_round}", self.small_font, (200, 200, 200), 1)
+        round_rect = round_text.get_rect(center=(self.view_width // 2, 35))
+        draw_list.blit(round_text, round_rect)
         
         # Player wins counter (left side, blue)
-        p1_text = self._render_pixel_text(f"PLAYER: {self.player_wins}", self.small_font, (100, 150, 255), 2)
-        surface.blit(p1_text, (20, 20))
+        p1_text = render_pixel_text(f"PLAYER: {self.player_wins}", self.small_font, (100, 150, 255), 1)
+        draw_list.blit(p1_text, (10, 10))
         
         # AI wins counter (right side, red)
-        p2_text = self._render_pixel_text(f"EVIL TWIN: {self.ai_wins}", self.small_font, (255, 100, 100), 2)
-        p2_rect = p2_text.get_rect(topright=(self.screen_width - 20, 20))
-        surface.blit(p2_text, p2_rect)
+        p2_text = render_pixel_text(f"EVIL TWIN: {self.ai_wins}", self.small_font, (255, 100, 100), 1)
+        p2_rect = p2_text.get_rect(topright=(self.view_width - 10, 10))
+        draw_list.blit(p2_text, p2_rect)
         
         # Health bars
-        self._render_health_bar(surface, 20, 90, self.player1.health, self.player1.max_health, (100, 100, 255))
-        self._render_health_bar(surface, self.screen_width - 220, 90, self.player2.health, self.player2.max_health, (255, 100, 100))
+        self._render_health_bar(draw_list, 10, 45, self.player1.health, self.player1.max_health, (100, 100, 255))
+        self._render_health_bar(draw_list, self.view_width - 110, 45, self.player2.health, self.player2.max_health, (255, 100, 100))
         
         # Stamina bars (below health bars)
-        self._render_stamina_bar(surface, 20, 120, self.player1.stamina, self.player1.max_stamina, (100, 255, 255), self.player1.is_stunned)
-        self._render_stamina_bar(surface, self.screen_width - 220, 120, self.player2.stamina, self.player2.max_stamina, (255, 255, 100), self.player2.is_stunned)
+        self._render_stamina_bar(draw_list, 10, 60, self.player1.stamina, self.player1.max_stamina, (100, 255, 255), self.player1.is_stunned)
+        self._render_stamina_bar(draw_list, self.view_width - 110, 60, self.player2.stamina, self.player2.max_stamina, (255, 255, 100), self.player2.is_stunned)
+        
+        # Draw the HUD before the result screens over it
+        draw_list.flush(surface)
         
         # Round result screen
         if self.round_over and not self.match_over:
@@ -1014,166 +998,158 @@ class FightScene:
         if self.match_over:
             self._render_match_over(surface)
     
-    def _render_health_bar(self, surface: pygame.Surface, x: int, y: int, health: int, max_health: int, color: tuple):
+    def _hud_pixels(self, game_pixels: int) -> int:
+        """A HUD bar size in game pixels at the scene's pixel scale (never below one drawn pixel).
+        
+        At native resolution the bars keep their size and segment count, but the 1px
+        gaps and the stamina border can only be one drawn pixel.
+        """
+        return max(1, game_pixels // self.pixel_scale)
+    
+    def _hud_bar(self, key, height: int, border: int, outline: int = 0) -> SegmentBar:
+        """The kept bar surface for one HUD bar (sizes in game pixels), created on first use."""
+        bar = self._hud_bars.get(key)
+        if bar is None:
+            bar = SegmentBar(self._hud_pixels(200), self._hud_pixels(height), self._hud_pixels(border),
+                             pixel_size=self._hud_pixels(4), outline=outline)
+            self._hud_bars[key] = bar
+        return bar
+    
+    def _render_health_bar(self, draw_list: DrawList, x: int, y: int, health: int, max_health: int, color: tuple):
         """Render a pixelated retro health bar."""
-        bar_width = 200
-        bar_height = 16  # Reduced for more retro feel
-        pixel_size = 4   # Size of each "pixel" block
+        bar_width = self._hud_pixels(200)
+        pixel_size = self._hud_pixels(4)   # Size of each "pixel" block
         
         # Calculate health segments (each segment is pixel_size wide)
         total_segments = bar_width // pixel_size
         health_segments = int((health / max_health) * total_segments)
         
-        # Draw pixelated background border (retro style)
-        border_thickness = 2
-        border_rect = pygame.Rect(x - border_thickness, y - border_thickness, 
-                                bar_width + border_thickness * 2, bar_height + border_thickness * 2)
-        pygame.draw.rect(surface, (255, 255, 255), border_rect)  # White border
-        
-        # Draw dark background
-        bg_rect = pygame.Rect(x, y, bar_width, bar_height)
-        pygame.draw.rect(surface, (32, 32, 32), bg_rect)  # Dark retro background
-        
-        # Draw pixelated health segments
-        for i in range(health_segments):
-            segment_x = x + (i * pixel_size)
-            segment_rect = pygame.Rect(segment_x, y, pixel_size - 1, bar_height)  # -1 for pixel separation
-            
-            # Color gradient based on health percentage
-            health_percentage = health / max_health
-            if health_percentage > 0.6:
-                # Green when healthy
-                pixel_color = (50, 255, 50)
-            elif health_percentage > 0.3:
-                # Yellow when medium health
-                pixel_color = (255, 255, 50)
-            else:
-                # Red when low health
-                pixel_color = (255, 50, 50)
-            
-            pygame.draw.rect(surface, pixel_color, segment_rect)
+        # Color gradient based on health percentage
+        health_percentage = health / max_health
+        if health_percentage > 0.6:
+            # Green when healthy
+            pixel_color = (50, 255, 50)
+        elif health_percentage > 0.3:
+            # Yellow when medium health
+            pixel_color = (255, 255, 50)
+        else:
+            # Red when low health
+            pixel_color = (255, 50, 50)
+        
+        # White border, dark retro background; redrawn only when health changes
+        bar = self._hud_bar(("health", x, y), 16, 2)
+        bar.draw(draw_list, (x, y), health_segments, pixel_color, (32, 32, 32))
     
-    def _render_stamina_bar(self, surface: pygame.Surface, x: int, y: int, stamina: int, max_stamina: int, color: tuple, is_stunned: bool):
+    def _render_stamina_bar(self, draw_list: DrawList, x: int, y: int, stamina: int, max_stamina: int, color: tuple, is_stunned: bool):
         """Render a pixelated retro stamina bar."""
-        bar_width = 200
-        bar_height = 12  # Smaller than health bar
-        pixel_size = 4   # Size of each "pixel" block
+        bar_width = self._hud_pixels(200)
+        bar_height = self._hud_pixels(12)  # Smaller than health bar
+        pixel_size = self._hud_pixels(4)   # Size of each "pixel" block
         
         # Calculate stamina segments (each segment is pixel_size wide)
         total_segments = bar_width // pixel_size
         stamina_segments = int((stamina / max_stamina) * total_segments)
         
-        # Draw pixelated background border (retro style)
-        border_thickness = 1  # Thinner border for stamina
-        border_color = (255, 255, 255) if not is_stunned else (255, 0, 0)  # Red border when stunned
-        border_rect = pygame.Rect(x - border_thickness, y - border_thickness, 
-                                bar_width + border_thickness * 2, bar_height + border_thickness * 2)
-        pygame.draw.rect(surface, border_color, border_rect)
-        
-        # Draw dark background
-        bg_rect = pygame.Rect(x, y, bar_width, bar_height)
-        bg_color = (16, 16, 16) if not is_stunned else (64, 16, 16)  # Darker red background when stunned
-        pygame.draw.rect(surface, bg_color, bg_rect)
+        # Color gradient based on stamina percentage
+        stamina_percentage = stamina / max_stamina
+        if stamina_percentage > 0.6:
+            # Bright cyan when full stamina
+            pixel_color = color
+        elif stamina_percentage > 0.3:
+            # Dim the color for medium stamina
+            pixel_color = (color[0] // 2, color[1] // 2, color[2])
+        else:
+            # Very dim for low stamina
+            pixel_color = (color[0] // 4, color[1] // 4, color[2] // 2)
         
-        # Draw pixelated stamina segments (unless stunned)
+        # Red border and darker red background when stunned, with no segments
+        bar = self._hud_bar(("stamina", x, y), 12, 1)  # Thinner border for stamina
         if not is_stunned:
-            for i in range(stamina_segments):
-                segment_x = x + (i * pixel_size)
-                segment_rect = pygame.Rect(segment_x, y, pixel_size - 1, bar_height)  # -1 for pixel separation
-                
-                # Color gradient based on stamina percentage
-                stamina_percentage = stamina / max_stamina
-                if stamina_percentage > 0.6:
-                    # Bright cyan when full stamina
-                    pixel_color = color
-                elif stamina_percentage > 0.3:
-                    # Dim the color for medium stamina
-                    pixel_color = (color[0] // 2, color[1] // 2, color[2])
-                else:
-                    # Very dim for low stamina
-                    pixel_color = (color[0] // 4, color[1] // 4, color[2] // 2)
-                
-                pygame.draw.rect(surface, pixel_color, segment_rect)
+            bar.draw(draw_list, (x, y), stamina_segments, pixel_color, (16, 16, 16))
         else:
+            bar.draw(draw_list, (x, y), 0, pixel_color, (64, 16, 16), (255, 0, 0))
+            
             # Show "STUNNED" text when stamina is depleted
-            stun_text = self._render_pixel_text("STUNNED", self.small_font, (255, 50, 50), 1)
+            stun_text = render_pixel_text("STUNNED", self.tiny_font, (255, 50, 50), 1)
             stun_rect = stun_text.get_rect(center=(x + bar_width // 2, y + bar_height // 2))
-            surface.blit(stun_text, stun_rect)
+            draw_list.blit(stun_text, stun_rect)
     
     def _render_round_result(self, surface: pygame.Surface):
         """Render round result screen with pixelated retro style."""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        # Semi-transparent overlay (built once, shared)
+        draw_overlay(surface, 128)
+        
+        # Winner and score only change with the round result, so they are baked together
+        result_layers = []
         
         # Round winner text (large pixelated)
         if self.round_winner:
             if self.round_winner == "Draw":
-                winner_text = self._render_pixel_text("DRAW!", self.mega_font, (255, 255, 0), 3)
+                result_layers.append(TextLayer("DRAW!", self.huge_font, (255, 255, 0), 1, offsets=((0, -30),)))
             else:
-                winner_text = self._render_pixel_text(f"{self.round_winner.upper()} WINS!", self.large_font, (255, 255, 255), 2)
-            winner_rect = winner_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 60))
-            surface.blit(winner_text, winner_rect)
+                result_layers.append(TextLayer(f"{self.round_winner.upper()} WINS!", self.large_font, (255, 255, 255), 1,
+                                               offsets=((0, -30),)))
         
         # Score display (medium pixelated)
-        score_text = self._render_pixel_text(f"PLAYER {self.player_wins} - {self.ai_wins} EVIL TWIN", self.large_font, (200, 200, 200), 2)
-        score_rect = score_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 20))
-        surface.blit(score_text, score_rect)
+        result_layers.append(TextLayer(f"PLAYER {self.player_wins} - {self.ai_wins} EVIL TWIN", self.large_font,
+                                       (200, 200, 200), 1, offsets=((0, 10),)))
+        bake_text(tuple(result_layers)).draw(surface, (self.view_width // 2, self.view_height // 2))
         
         # Next round timer (small pixelated)
         time_remaining = self.round_end_duration - self.round_end_timer
         if time_remaining > 0:
-            timer_text = self._render_pixel_text(f"NEXT ROUND IN {int(time_remaining) + 1}...", self.font, (150, 150, 150), 2)
-            timer_rect = timer_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 80))
+            timer_text = render_pixel_text(f"NEXT ROUND IN {int(time_remaining) + 1}...", self.font, (150, 150, 150), 1)
+            timer_rect = timer_text.get_rect(center=(self.view_width // 2, self.view_height // 2 + 40))
             surface.blit(timer_text, timer_rect)
     
     def _render_match_over(self, surface: pygame.Surface):
         """Render match over screen with pixelated retro style."""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        # Semi-transparent overlay (built once, shared)
+        draw_overlay(surface, 180)
+        
+        # Nothing on the match over screen changes, so all of its text is baked together
+        match_layers = []
         
         # Match winner text (large pixelated with gold color)
         if self.match_winner:
-            winner_text = self._render_pixel_text(f"{self.match_winner.upper()} WINS!", self.large_font, (255, 215, 0), 2)
-            winner_rect = winner_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 80))
-            surface.blit(winner_text, winner_rect)
+            match_layers.append(TextLayer(f"{self.match_winner.upper()} WINS!", self.large_font, (255, 215, 0), 1,
+                                          offsets=((0, -40),)))
         
         # Final score (medium pixelated)
-        final_score = self._render_pixel_text(f"FINAL: {self.player_wins} - {self.ai_wins}", self.font, (255, 255, 255), 2)
-        score_rect = final_score.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-        surface.blit(final_score, score_rect)
+        match_layers.append(TextLayer(f"FINAL: {self.player_wins} - {self.ai_wins}", self.font, (255, 255, 255), 1))
         
         # Match type (medium pixelated)
-        match_text = self._render_pixel_text("FIRST TO 3 WINS", self.font, (200, 200, 200), 2)
-        match_rect = match_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 60))
-        surface.blit(match_text, match_rect)
+        match_layers.append(TextLayer("FIRST TO 3 WINS", self.font, (200, 200, 200), 1, offsets=((0, 30),)))
         
         # Instructions (small pixelated)
-        inst_text = self._render_pixel_text("PRESS ESC TO EXIT", self.small_font, (150, 150, 150), 2)
-        inst_rect = inst_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 120))
-        surface.blit(inst_text, inst_rect)
+        match_layers.append(TextLayer("PRESS ESC TO EXIT", self.small_font, (150, 150, 150), 1, offsets=((0, 60),)))
+        bake_text(tuple(match_layers)).draw(surface, (self.view_width // 2, self.view_height // 2))
     
     def _render_pause_screen(self, surface: pygame.Surface):
         """Render pause screen with retro neon blinking effect."""
-        # Semi-transparent dark overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(150)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        # Semi-transparent dark overlay (built once, shared)
+        draw_overlay(surface, 150)
         
         # Calculate blink effect (on/off cycle)
         blink_cycle = math.sin(self.pause_blink_timer * self.pause_blink_speed * math.pi)
         is_visible = blink_cycle > 0
         
         if is_visible:
-            # Create neon-style "PAUSE" text with multiple glow layers
-            pause_text = "PAUSE"
+            # Center position
+            center_x = self.view_width // 2
+            center_y = self.view_height // 2
             
+            # Neon-style "PAUSE" text, baked once from its glow layers
+            bake_text(self._pause_glow_layers()).draw(surface, (center_x, center_y))
+            
+            # Instructions below pause text
+            inst_text = render_pixel_text("PRESS ESC TO RESUME", self.font, (200, 200, 255), 1)
+            inst_rect = inst_text.get_rect(center=(center_x, center_y + 40))
+            surface.blit(inst_text, inst_rect)
+    
+    def _pause_glow_layers(self) -> tuple:
+        """Glow layers of the "PAUSE" text, outermost first."""
+        if self._pause_glow is None:
             # Multiple shadow/glow layers for neon effect
             glow_colors = [
                 (255, 0, 255, 30),   # Magenta glow (outermost)
@@ -1191,41 +1167,20 @@ class FightScene:
                 [(0, 0)]   # Center text
             ]
             
-            # Center position
-            center_x = self.screen_width // 2
-            center_y = self.screen_height // 2
-            
-            # Render each glow layer
-            for i, (color, offsets) in enumerate(zip(glow_colors, glow_offsets)):
-                # Create the text surface
-                text_surface = self._render_pixel_text(pause_text, self.mega_font, color[:3], 4)
-                
-                # Apply alpha if specified
-                if len(color) == 4:
-                    text_surface.set_alpha(color[3])
-                
-                # Render at each offset position for glow effect
-                for offset_x, offset_y in offsets:
-                    text_rect = text_surface.get_rect()
-                    text_rect.centerx = center_x + offset_x
-                    text_rect.centery = center_y + offset_y
-                    surface.blit(text_surface, text_rect)
-            
-            # Instructions below pause text
-            inst_text = self._render_pixel_text("PRESS ESC TO RESUME", self.font, (200, 200, 255), 2)
-            inst_rect = inst_text.get_rect(center=(center_x, center_y + 80))
-            surface.blit(inst_text, inst_rect)
+            self._pause_glow = tuple(TextLayer("PAUSE", self.mega_font, color[:3], 2, color[3], tuple(offsets))
+                                     for color, offsets in zip(glow_colors, glow_offsets))
+        return self._pause_glow
     
     def _render_dialogue_box(self, surface: pygame.Surface):
         """Render retro dialogue box with Evil Twin's final words and player choices."""
         # Create dialogue box background
-        box_width = 600
-        box_height = 200
-        box_x = (self.screen_width - box_width) // 2
-        box_y = self.screen_height - box_height - 50
+        box_width = 300
+        box_height = 100
+        box_x = (self.view_width - box_width) // 2
+        box_y = self.view_height - box_height - 25
         
         # Dark background with retro border
-        border_thickness = 4
+        border_thickness = 2
         
         # Outer border (bright)
         outer_rect = pygame.Rect(box_x - border_thickness, box_y - border_thickness, 
@@ -1233,8 +1188,8 @@ class FightScene:
         pygame.draw.rect(surface, (255, 255, 255), outer_rect)
         
         # Inner border (dark)
-        inner_border = pygame.Rect(box_x - border_thickness + 2, box_y - border_thickness + 2,
-                                 box_width + (border_thickness - 2) * 2, box_height + (border_thickness - 2) * 2)
+        inner_border = pygame.Rect(box_x - border_thickness + 1, box_y - border_thickness + 1,
+                                 box_width + (border_thickness - 1) * 2, box_height + (border_thickness - 1) * 2)
         pygame.draw.rect(surface, (100, 100, 100), inner_border)
         
         # Main background
@@ -1242,9 +1197,9 @@ class FightScene:
         pygame.draw.rect(surface, (20, 20, 40), main_rect)
         
         # Character portrait area (Evil Twin)
-        portrait_size = 80
-        portrait_x = box_x + 20
-        portrait_y = box_y + 20
+        portrait_size = 40
+        portrait_x = box_x + 10
+        portrait_y = box_y + 10
         portrait_rect = pygame.Rect(portrait_x, portrait_y, portrait_size, portrait_size)
         
         # Draw background for portrait
@@ -1252,13 +1207,9 @@ class FightScene:
         
         # Load and display Evil Twin portrait
         try:
-            # Load the dedicated portrait image
-            portrait_path = sprite_path("portrait.png")
-            portrait_image = pygame.image.load(portrait_path).convert_alpha()
-            
-            # Scale portrait to fit the box (with some padding)
-            portrait_inner_size = portrait_size - 6  # Leave 3px border on each side
-            scaled_portrait = pygame.transform.scale(portrait_image, (portrait_inner_size, portrait_inner_size))
+            # Load the dedicated portrait image, scaled to fit the box (with some padding)
+            portrait_inner_size = portrait_size - 3  # Leave a border around it
+            scaled_portrait = image_cache.get("portrait.png", (portrait_inner_size, portrait_inner_size), alpha=True)
             
             # Center the portrait in the box
             portrait_x_pos = portrait_x + (portrait_size - portrait_inner_size) // 2
@@ -1271,54 +1222,54 @@ class FightScene:
             pygame.draw.rect(surface, (80, 40, 40), portrait_rect)
             
             # Draw a simple "?" as placeholder
-            question_text = self._render_pixel_text("?", self.large_font, (255, 200, 200), 3)
+            question_text = render_pixel_text("?", self.mega_font, (255, 200, 200), 1)
             question_rect = question_text.get_rect(center=(portrait_x + portrait_size//2, portrait_y + portrait_size//2))
             surface.blit(question_text, question_rect)
         
         # Portrait border
-        pygame.draw.rect(surface, (200, 200, 200), portrait_rect, 2)
+        pygame.draw.rect(surface, (200, 200, 200), portrait_rect, 1)
         
         # Evil Twin name
-        name_text = self._render_pixel_text("EVIL TWIN", self.font, (255, 100, 100), 2)
-        name_x = portrait_x + portrait_size + 20
+        name_text = render_pixel_text("EVIL TWIN", self.font, (255, 100, 100), 1)
+        name_x = portrait_x + portrait_size + 10
         name_y = portrait_y
         surface.blit(name_text, (name_x, name_y))
         
         # Dialogue text area
         text_x = name_x
-        text_y = name_y + 30
-        text_width = box_width - (text_x - box_x) - 20
+        text_y = name_y + 15
+        text_width = box_width - (text_x - box_x) - 10
         
         if self.dialogue_phase == "threat":
             # Evil Twin's threat
             threat_text = "You will never get to her alive..."
-            dialogue_surface = self._render_pixel_text(threat_text, self.font, (255, 255, 255), 2)
+            dialogue_surface = render_pixel_text(threat_text, self.font, (255, 255, 255), 1)
             surface.blit(dialogue_surface, (text_x, text_y))
             
         elif self.dialogue_phase == "choices":
             # Player choice prompt
             prompt_text = "What do you do?"
-            prompt_surface = self._render_pixel_text(prompt_text, self.font, (255, 255, 255), 2)
+            prompt_surface = render_pixel_text(prompt_text, self.font, (255, 255, 255), 1)
             surface.blit(prompt_surface, (text_x, text_y))
             
             # Choice options
-            choice_y = text_y + 40
+            choice_y = text_y + 20
             
             # Option 1: Spare
             spare_color = (255, 255, 100) if self.selected_choice == 0 else (200, 200, 200)
             spare_prefix = "> " if self.selected_choice == 0 else "  "
-            spare_text = self._render_pixel_text(f"{spare_prefix}1. Spare him", self.font, spare_color, 2)
+            spare_text = render_pixel_text(f"{spare_prefix}1. Spare him", self.font, spare_color, 1)
             surface.blit(spare_text, (text_x, choice_y))
             
             # Option 2: Finish
             finish_color = (255, 255, 100) if self.selected_choice == 1 else (200, 200, 200)
             finish_prefix = "> " if self.selected_choice == 1 else "  "
-            finish_text = self._render_pixel_text(f"{finish_prefix}2. Finish him", self.font, finish_color, 2)
-            surface.blit(finish_text, (text_x, choice_y + 25))
+            finish_text = render_pixel_text(f"{finish_prefix}2. Finish him", self.font, finish_color, 1)
+            surface.blit(finish_text, (text_x, choice_y + 12))
             
             # Instructions
-            inst_text = self._render_pixel_text("Use 1/2 or UP/DOWN to choose, ENTER to confirm", self.small_font, (150, 150, 150), 1)
-            surface.blit(inst_text, (text_x, choice_y + 60))
+            inst_text = render_pixel_text("Use 1/2 or UP/DOWN to choose, ENTER to confirm", self.tiny_font, (150, 150, 150), 1)
+            surface.blit(inst_text, (text_x, choice_y + 30))
             
         elif self.dialogue_phase == "outcome":
             # Show outcome based on player choice
@@ -1329,12 +1280,12 @@ class FightScene:
                 outcome_text = "Evil Twin defeated."
                 outcome_color = (255, 100, 100)  # Red
                 
-            outcome_surface = self._render_pixel_text(outcome_text, self.font, outcome_color, 1)
+            outcome_surface = render_pixel_text(outcome_text, self.small_font, outcome_color, 1)
             surface.blit(outcome_surface, (text_x, text_y))
             
             # Continue instruction
-            continue_text = self._render_pixel_text("Press SPACE to continue...", self.small_font, (150, 150, 150), 1)
-            surface.blit(continue_text, (text_x, text_y + 25))
+            continue_text = render_pixel_text("Press SPACE to continue...", self.tiny_font, (150, 150, 150), 1)
+            surface.blit(continue_text, (text_x, text_y + 12))
 
 
 class Level2Scene:
@@ -1371,11 +1322,18 @@ class Level2Scene:
         self.round_end_timer = 0.0
         self.round_end_duration = 2.5  # seconds to show death animation and round result
         
+        # Simulated seconds (frozen steps don't count); pulsing effects follow it, so replays draw the same frames
+        self.scene_time = 0.0
+        
         # Pause state
         self.is_paused = False
         self.pause_blink_timer = 0.0
         self.pause_blink_speed = 2.0  # Blinks per second
         
+        # HUD bars and health labels, kept between frames and keyed by kind and position
+        self._hud_bars = {}
+        self._health_labels = {}
+        
         # Dialogue state (using Level 1's proven system)
         self.showing_dialogue = False
         self.dialogue_phase = "threat"  # "threat", "choices", "outcome"
@@ -1402,6 +1360,9 @@ class Level2Scene:
         self.ground_image = None
         self.ground_top_y = 0.0  # will be set when ground.png loads
         
+        # Background and ground merged on the first frame
+        self.static_background = None
+        
         # Arena boundaries (same as Level 1)
         self.arena_left = -100
         self.arena_right = 900
@@ -1417,16 +1378,16 @@ class Level2Scene:
     def _init_fonts(self):
         """Initialize fonts."""
         try:
-            self.small_font = pygame.font.Font(None, 16)
-            self.font = pygame.font.Font(None, 24)
-            self.large_font = pygame.font.Font(None, 32)
-            self.mega_font = pygame.font.Font(None, 48)
+            self.small_font = get_font(16)
+            self.font = get_font(24)
+            self.large_font = get_font(32)
+            self.mega_font = get_font(48)
         except:
             # Use default fonts if loading fails
-            self.small_font = pygame.font.Font(None, 16)
-            self.font = pygame.font.Font(None, 24)
-            self.large_font = pygame.font.Font(None, 32)
-            self.mega_font = pygame.font.Font(None, 48)
+            self.small_font = get_font(16)
+            self.font = get_font(24)
+            self.large_font = get_font(32)
+            self.mega_font = get_font(48)
         
     def _detect_ground_surface(self, ground_image):
         """Detect the actual ground surface by scanning for opaque pixels from bottom up."""
@@ -1465,22 +1426,27 @@ class Level2Scene:
         except Exception as e:
             print(f"Error detecting ground surface: {e}")
             return float(self.screen_height - self.ground_image.get_height())
-
+    
+    @classmethod
+    def asset_jobs(cls, screen_width: int, screen_height: int) -> list:
+        """Loads the asset loader can run ahead of building this scene."""
+        jobs = [partial(image_cache.get, "background.png", (screen_width, screen_height)),
+                partial(image_cache.get, "ground.png", alpha=True),
+                partial(image_cache.get, "portrait1.png", (74, 74), alpha=True)]
+        jobs.append(partial(load_roster_strips, (Samurai1, YellowNinja), include_lazy=False, pack=False))
+        return jobs
+    
     def _load_background(self):
         """Load the background image."""
         try:
             background_path = sprite_path("background.png")
             if os.path.exists(background_path):
-                self.background_image = pygame.image.load(background_path)
-                self.background_image = pygame.transform.scale(
-                    self.background_image,
-                    (self.screen_width, self.screen_height)
-                )
+                self.background_image = image_cache.get("background.png", (self.screen_width, self.screen_height))
                 print(f"Loaded Level 2 background: {background_path}")
             # Load ground image (assets/sprites/ground.png)
             ground_path = sprite_path("ground.png")
             if os.path.exists(ground_path):
-                ground_img = pygame.image.load(ground_path).convert_alpha()
+                ground_img = image_cache.get("ground.png", alpha=True)
                 # Scale horizontally to screen width, keep original height
                 g_height = ground_img.get_height()
                 if ground_img.get_width() != self.screen_width:
@@ -1521,6 +1487,8 @@ class Level2Scene:
         # Enemy positioning  
         self.player2.y = enemy_ground_y
         self.player2.on_ground = True
+        self.player1.store_position()
+        self.player2.store_position()
         
         print(f"Positioned characters on ground surface (Y: {self.ground_surface_y}) - Player: {self.player1.y}, Enemy: {self.player2.y}")
         print(f"Character hitbox: {self.player1.width}x{self.player1.height}, bottom edge at Y: {self.player1.y + self.player1.height}")
@@ -1528,82 +1496,16 @@ class Level2Scene:
     def _render_blocking_indicators(self, surface: pygame.Surface):
         """Render visual indicators when characters are blocking (Energy Barrier + Weapon Glow)."""
         import math
-        current_time = pygame.time.get_ticks()
+        current_time = int(self.scene_time * 1000)
         
         # Player 1 blocking indicator
         if self.player1.is_blocking:
-            self._render_character_blocking_effect(surface, self.player1, current_time, self.player1_is_parrying)
+            draw_blocking_effect(surface, self.player1, current_time, self.player1_is_parrying)
             
         # Player 2 blocking indicator  
         if self.player2.is_blocking:
-            self._render_character_blocking_effect(surface, self.player2, current_time, self.player2_is_parrying)
+            draw_blocking_effect(surface, self.player2, current_time, self.player2_is_parrying)
     
-    def _render_character_blocking_effect(self, surface: pygame.Surface, character, current_time, is_parrying=False):
-        """Render blocking effect for a specific character."""
-        import math
-        
-        # Choose colors based on parrying state
-        if is_parrying:
-            # Green colors for parrying
-            barrier_base_color = (0, 255, 0)  # Green barrier
-            glow_base_color = (0, 255, 100)  # Green-tinted glow
-        else:
-            # Blue colors for normal blocking
-            barrier_base_color = (0, 100, 255)  # Blue barrier
-            glow_base_color = (100, 100, 255)  # Blue-tinted glow
-        
-        # Energy barrier effect
-        barrier_width = 8
-        barrier_height = character.height - 10
-        barrier_alpha = 180 + int(40 * math.sin(current_time * 0.01))  # Pulsing effect
-        
-        # Position barrier in front of character based on facing direction
-        if character.facing_right:
-            barrier_x = character.x + character.width + 5
-        else:
-            barrier_x = character.x - barrier_width - 5
-            
-        barrier_y = character.y + 5
-        
-        # Create energy barrier surface with transparency
-        barrier_surface = pygame.Surface((barrier_width, barrier_height))
-        barrier_surface.set_alpha(barrier_alpha)
-        
-        # Gradient effect - multiple layers for energy look
-        for i in range(barrier_width):
-            alpha_mult = 1.0 - (i / barrier_width) * 0.5
-            r = int(barrier_base_color[0] * alpha_mult) if barrier_base_color[0] > 0 else 0
-            g = int(barrier_base_color[1] * alpha_mult) if barrier_base_color[1] > 0 else 0
-            b = int(barrier_base_color[2] * alpha_mult) if barrier_base_color[2] > 0 else 0
-            color = (r, g, b)
-            pygame.draw.rect(barrier_surface, color, (i, 0, 1, barrier_height))
-        
-        surface.blit(barrier_surface, (barrier_x, barrier_y))
-        
-        # Weapon glow effect (overlay on character sprite area)
-        glow_intensity = 150 + int(50 * math.sin(current_time * 0.015))  # Pulsing glow
-        glow_color = (glow_intensity if glow_base_color[0] > 0 else glow_intensity // 3,
-                      glow_intensity if glow_base_color[1] > 0 else glow_intensity // 3,
-                      glow_intensity if glow_base_color[2] > 0 else 255)
-        
-        # Create glow outline around character
-        glow_surface = pygame.Surface((character.width + 6, character.height + 6))
-        glow_surface.set_alpha(80)
-        glow_surface.fill(glow_color)
-        
-        # Render glow behind character
-        glow_x = character.x - 3
-        glow_y = character.y - 3
-        surface.blit(glow_surface, (glow_x, glow_y))
-        
-    def _render_pixel_text(self, text: str, font: pygame.font.Font, color: tuple, scale: int = 2):
-        """Render text with pixelated, retro look by scaling up small text."""
-        small_surface = font.render(text, False, color)
-        original_size = small_surface.get_size()
-        new_size = (original_size[0] * scale, original_size[1] * scale)
-        scaled_surface = pygame.transform.scale(small_surface, new_size)
-        return scaled_surface
-        
     def set_sounds(self, attack_sound, block_sound, pain_sound):
         """Set sounds for characters."""
         self.attack_sound = attack_sound
@@ -1689,6 +1591,16 @@ class Level2Scene:
             self.showing_dialogue = False
             print(f"LEVEL 2 COMPLETE! Player wins with choice: {self.player_choice}")
         
+    def begin_step(self):
+        """Remember the fighters' positions before a simulation step, for render interpolation."""
+        self.player1.store_position()
+        self.player2.store_position()
+    
+    def set_render_blend(self, blend: float):
+        """Draw the fighters blend of the way from their previous step positions to the current ones."""
+        self.player1.render_blend = blend
+        self.player2.render_blend = blend
+    
     def update(self, dt: float, player1_input=None, player2_input=None):
         """Update Level 2 scene."""
         # Handle initial positioning after sprite loading
@@ -1708,6 +1620,8 @@ class Level2Scene:
             self.pause_blink_timer += dt
             return
         
+        self.scene_time += dt
+        
         # Handle match over state
         if self.match_over:
             return
@@ -1756,6 +1670,10 @@ class Level2Scene:
     
     def _check_collisions(self):
         """Check for combat collisions between characters using Level 1's proven system."""
+        # Warm up the lazily loaded reaction animations before they are needed
+        self.player1.prefetch_reactions(self.player2)
+        self.player2.prefetch_reactions(self.player1)
+        
         # Check if player hits enemy with regular attack
         p1_attack = self.player1.get_attack_rect()
         if p1_attack and p1_attack.colliderect(self.player2.get_rect()):
@@ -1921,40 +1839,48 @@ class Level2Scene:
         self.player2.is_stunned = False
         self.player2.stun_timer = 0.0
         
+        # Teleported, so don't draw them sliding there
+        self.player1.store_position()
+        self.player2.store_position()
+        
     def render(self, screen: pygame.Surface):
         """Render Level 2 scene."""
-        # Draw background
-        if self.background_image:
-            screen.blit(self.background_image, (0, 0))
-        else:
-            screen.fill(self.bg_color)
-        
-        # Draw ground layer
-        if self.ground_image:
-            screen.blit(self.ground_image, (0, int(self.screen_height - self.ground_image.get_height())))
+        # Draw background and ground layer (merged once)
+        if self.static_background is None:
+            layers = []
+            if self.background_image:
+                layers.append(StaticLayer(self.background_image))
+            if self.ground_image:
+                layers.append(StaticLayer(self.ground_image, (0, int(self.screen_height - self.ground_image.get_height()))))
+            self.static_background = compose_static((self.screen_width, self.screen_height), tuple(layers), self.bg_color)
+        draw_list.submit(self.static_background, (0, 0), LAYER_BACKGROUND)
         
         # Handle dialogue rendering
         if self.showing_dialogue:
+            draw_list.flush(screen)
             self._render_dialogue_box(screen)
             return
         
-        # Render characters
-        self.player1.render(screen)
-        self.player2.render(screen)
-        
-        # Render blocking indicators
-        self._render_blocking_indicators(screen)
+        # Render background and characters in one batch, then blocking indicators (GPU-drawn on the texture backend)
+        with sprite_pass(screen):
+            self.player1.render(draw_list)
+            self.player2.render(draw_list)
+            draw_list.flush(screen)
+            self._render_blocking_indicators(screen)
         
         # Draw UI - identical to Level 1
-        self._render_health_bar(screen, 20, 90, self.player1.health, self.player1.max_health, (100, 100, 255))
-        self._render_health_bar(screen, self.screen_width - 220, 90, self.player2.health, self.player2.max_health, (255, 100, 100))
+        self._render_health_bar(draw_list, 20, 90, self.player1.health, self.player1.max_health, (100, 100, 255))
+        self._render_health_bar(draw_list, self.screen_width - 220, 90, self.player2.health, self.player2.max_health, (255, 100, 100))
         
         # Draw stamina bars
-        self._render_stamina_bar(screen, 20, 120, self.player1.stamina, self.player1.max_stamina, (100, 255, 255), self.player1.is_stunned)
-        self._render_stamina_bar(screen, self.screen_width - 220, 120, self.player2.stamina, self.player2.max_stamina, (255, 255, 100), self.player2.is_stunned)
+        self._render_stamina_bar(draw_list, 20, 120, self.player1.stamina, self.player1.max_stamina, (100, 255, 255), self.player1.is_stunned)
+        self._render_stamina_bar(draw_list, self.screen_width - 220, 120, self.player2.stamina, self.player2.max_stamina, (255, 255, 100), self.player2.is_stunned)
         
         # Draw round info
-        self._render_round_info(screen)
+        self._render_round_info(draw_list)
+        
+        # Draw the HUD before the overlays on top
+        draw_list.flush(screen)
         
         # Draw pause overlay
         if self.is_paused:
@@ -2002,14 +1928,9 @@ class Level2Scene:
         
         # Load and display Yellow Ninja portrait
         try:
-            # Load the Yellow Ninja portrait image (portrait1.png)
-            from game.resource_utils import sprite_path
-            portrait_path = sprite_path("portrait1.png")
-            portrait_image = pygame.image.load(portrait_path).convert_alpha()
-            
-            # Scale portrait to fit the box (with some padding)
+            # Load the Yellow Ninja portrait image (portrait1.png), scaled to fit the box (with some padding)
             portrait_inner_size = portrait_size - 6  # Leave 3px border on each side
-            scaled_portrait = pygame.transform.scale(portrait_image, (portrait_inner_size, portrait_inner_size))
+            scaled_portrait = image_cache.get("portrait1.png", (portrait_inner_size, portrait_inner_size), alpha=True)
             
             # Center the portrait in the box
             portrait_x_pos = portrait_x + (portrait_size - portrait_inner_size) // 2
@@ -2022,7 +1943,7 @@ class Level2Scene:
             pygame.draw.rect(surface, (80, 80, 40), portrait_rect)
             
             # Draw a simple "?" as placeholder
-            question_text = self._render_pixel_text("?", self.large_font, (255, 255, 200), 3)
+            question_text = render_pixel_text("?", self.large_font, (255, 255, 200), 3)
             question_rect = question_text.get_rect(center=(portrait_x + portrait_size//2, portrait_y + portrait_size//2))
             surface.blit(question_text, question_rect)
         
@@ -2030,7 +1951,7 @@ class Level2Scene:
         pygame.draw.rect(surface, (200, 200, 200), portrait_rect, 2)
         
         # Yellow Ninja name
-        name_text = self._render_pixel_text("YELLOW NINJA", self.font, (255, 255, 100), 2)
+        name_text = render_pixel_text("YELLOW NINJA", self.font, (255, 255, 100), 2)
         name_x = portrait_x + portrait_size + 20
         name_y = portrait_y
         surface.blit(name_text, (name_x, name_y))
@@ -2043,13 +1964,13 @@ class Level2Scene:
         if self.dialogue_phase == "threat":
             # Yellow Ninja's threat
             threat_text = "My skills are unmatched... you cannot defeat me!"
-            dialogue_surface = self._render_pixel_text(threat_text, self.font, (255, 255, 255), 2)
+            dialogue_surface = render_pixel_text(threat_text, self.font, (255, 255, 255), 2)
             surface.blit(dialogue_surface, (text_x, text_y))
             
         elif self.dialogue_phase == "choices":
             # Player choice prompt
             prompt_text = "What do you do?"
-            prompt_surface = self._render_pixel_text(prompt_text, self.font, (255, 255, 255), 2)
+            prompt_surface = render_pixel_text(prompt_text, self.font, (255, 255, 255), 2)
             surface.blit(prompt_surface, (text_x, text_y))
             
             # Choice options
@@ -2058,17 +1979,17 @@ class Level2Scene:
             # Option 1: Spare
             spare_color = (255, 255, 100) if self.selected_choice == 0 else (200, 200, 200)
             spare_prefix = "> " if self.selected_choice == 0 else "  "
-            spare_text = self._render_pixel_text(f"{spare_prefix}1. Show mercy", self.font, spare_color, 2)
+            spare_text = render_pixel_text(f"{spare_prefix}1. Show mercy", self.font, spare_color, 2)
             surface.blit(spare_text, (text_x, choice_y))
             
             # Option 2: Finish
             finish_color = (255, 255, 100) if self.selected_choice == 1 else (200, 200, 200)
             finish_prefix = "> " if self.selected_choice == 1 else "  "
-            finish_text = self._render_pixel_text(f"{finish_prefix}2. Finish him", self.font, finish_color, 2)
+            finish_text = render_pixel_text(f"{finish_prefix}2. Finish him", self.font, finish_color, 2)
             surface.blit(finish_text, (text_x, choice_y + 25))
             
             # Instructions
-            inst_text = self._render_pixel_text("Use 1/2 or UP/DOWN to choose, ENTER to confirm", self.small_font, (150, 150, 150), 1)
+            inst_text = render_pixel_text("Use 1/2 or UP/DOWN to choose, ENTER to confirm", self.small_font, (150, 150, 150), 1)
             surface.blit(inst_text, (text_x, choice_y + 60))
             
         elif self.dialogue_phase == "outcome":
@@ -2080,123 +2001,111 @@ class Level2Scene:
                 outcome_text = "The Yellow Ninja has been defeated... Your path continues."
                 outcome_color = (255, 100, 100)  # Red
                 
-            outcome_surface = self._render_pixel_text(outcome_text, self.font, outcome_color, 2)
+            outcome_surface = render_pixel_text(outcome_text, self.font, outcome_color, 2)
             surface.blit(outcome_surface, (text_x, text_y))
             
             # Continue instruction
-            continue_text = self._render_pixel_text("Press SPACE to continue...", self.small_font, (150, 150, 150), 1)
+            continue_text = render_pixel_text("Press SPACE to continue...", self.small_font, (150, 150, 150), 1)
             surface.blit(continue_text, (text_x, text_y + 40))
     
-    def _render_round_info(self, surface: pygame.Surface):
+    def _render_round_info(self, draw_list: DrawList):
         """Render round and score information."""
         # Round number
-        round_text = self._render_pixel_text(f"ROUND {self.current_round}", self.font, (255, 255, 255), 2)
+        round_text = render_pixel_text(f"ROUND {self.current_round}", self.font, (255, 255, 255), 2)
         round_rect = round_text.get_rect(center=(self.screen_width // 2, 30))
-        surface.blit(round_text, round_rect)
+        draw_list.blit(round_text, round_rect)
         
         # Timer
-        timer_text = self._render_pixel_text(f"{int(self.round_time)}", self.large_font, (255, 255, 0), 2)
+        timer_text = render_pixel_text(f"{int(self.round_time)}", self.large_font, (255, 255, 0), 2)
         timer_rect = timer_text.get_rect(center=(self.screen_width // 2, 60))
-        surface.blit(timer_text, timer_rect)
+        draw_list.blit(timer_text, timer_rect)
         
         # Show god mode indicator
         if self.player1.god_mode:
-            god_text = self._render_pixel_text("KOJIMA MODE: ON", self.font, (255, 255, 0), 2)
-            surface.blit(god_text, (self.screen_width - 250, 10))
+            god_text = render_pixel_text("KOJIMA MODE: ON", self.font, (255, 255, 0), 2)
+            draw_list.blit(god_text, (self.screen_width - 250, 10))
     
     def _render_pause_overlay(self, surface: pygame.Surface):
         """Render pause overlay."""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        # Semi-transparent overlay (built once, shared)
+        draw_overlay(surface, 128)
         
         # Blinking PAUSE text
         if int(self.pause_blink_timer * self.pause_blink_speed) % 2:
-            pause_text = self._render_pixel_text("PAUSED", self.large_font, (255, 255, 255), 3)
+            pause_text = render_pixel_text("PAUSED", self.large_font, (255, 255, 255), 3)
             pause_rect = pause_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
             surface.blit(pause_text, pause_rect)
     
     def _render_round_end_overlay(self, surface: pygame.Surface):
         """Render round end overlay."""
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        # Semi-transparent overlay (built once, shared)
+        draw_overlay(surface, 128)
         
         # Round result
         if self.round_winner:
             if self.round_winner == "Draw":
-                result_text = self._render_pixel_text("DRAW!", self.large_font, (255, 255, 0), 2)
+                result_text = render_pixel_text("DRAW!", self.large_font, (255, 255, 0), 2)
             else:
-                result_text = self._render_pixel_text(f"{self.round_winner.upper()} WINS!", self.large_font, (255, 255, 0), 2)
+                result_text = render_pixel_text(f"{self.round_winner.upper()} WINS!", self.large_font, (255, 255, 0), 2)
             result_rect = result_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
             surface.blit(result_text, result_rect)
     
     def _render_match_end_overlay(self, surface: pygame.Surface):
         """Render match end overlay."""
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        # Semi-transparent overlay (built once, shared)
+        draw_overlay(surface, 128)
         
         # Match result
         if self.match_winner:
             if self.match_winner == "Player":
-                result_text = self._render_pixel_text("VICTORY!", self.large_font, (0, 255, 0), 3)
+                result_text = render_pixel_text("VICTORY!", self.large_font, (0, 255, 0), 3)
             else:
-                result_text = self._render_pixel_text("DEFEAT!", self.large_font, (255, 0, 0), 3)
+                result_text = render_pixel_text("DEFEAT!", self.large_font, (255, 0, 0), 3)
             result_rect = result_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
             surface.blit(result_text, result_rect)
     
-    def _render_health_bar(self, surface: pygame.Surface, x: int, y: int, health: int, max_health: int, color: tuple):
+    def _hud_bar(self, key, height: int, border: int, outline: int = 0) -> SegmentBar:
+        """The kept bar surface for one HUD bar, created on first use."""
+        bar = self._hud_bars.get(key)
+        if bar is None:
+            bar = SegmentBar(200, height, border, outline=outline)
+            self._hud_bars[key] = bar
+        return bar
+    
+    def _render_health_bar(self, draw_list: DrawList, x: int, y: int, health: int, max_health: int, color: tuple):
         """Render a pixelated retro health bar."""
         bar_width = 200
-        bar_height = 16  # Reduced for more retro feel
         pixel_size = 4   # Size of each "pixel" block
         
         # Calculate health segments (each segment is pixel_size wide)
         total_segments = bar_width // pixel_size
         health_segments = int((health / max_health) * total_segments)
         
-        # Draw pixelated background border (retro style)
-        border_thickness = 2
-        border_rect = pygame.Rect(x - border_thickness, y - border_thickness, 
-                                bar_width + border_thickness * 2, bar_height + border_thickness * 2)
-        pygame.draw.rect(surface, (255, 255, 255), border_rect)  # White border
-        
-        # Draw dark background
-        bg_rect = pygame.Rect(x, y, bar_width, bar_height)
-        pygame.draw.rect(surface, (32, 32, 32), bg_rect)  # Dark retro background
-        
-        # Draw pixelated health segments
-        for i in range(health_segments):
-            segment_x = x + (i * pixel_size)
-            segment_rect = pygame.Rect(segment_x, y, pixel_size - 1, bar_height)  # -1 for pixel separation
-            
-            # Color gradient based on health percentage
-            health_percentage = health / max_health
-            if health_percentage > 0.6:
-                # Green when healthy
-                pixel_color = (50, 255, 50)
-            elif health_percentage > 0.3:
-                # Yellow when medium health
-                pixel_color = (255, 255, 50)
-            else:
-                # Red when low health
-                pixel_color = (255, 50, 50)
-            
-            pygame.draw.rect(surface, pixel_color, segment_rect)
-        
-        # Border
-        pygame.draw.rect(surface, (255, 255, 255), (x, y, bar_width, bar_height), 2)
-        
-        # Health text
-        health_text = self._render_pixel_text(f"HEALTH: {health}/{max_health}", self.small_font, (255, 255, 255), 1)
-        surface.blit(health_text, (x + bar_width + 10, y + 2))
+        # Color gradient based on health percentage
+        health_percentage = health / max_health
+        if health_percentage > 0.6:
+            # Green when healthy
+            pixel_color = (50, 255, 50)
+        elif health_percentage > 0.3:
+            # Yellow when medium health
+            pixel_color = (255, 255, 50)
+        else:
+            # Red when low health
+            pixel_color = (255, 50, 50)
+        
+        # White border (also over the edge of the segments), dark retro background;
+        # redrawn only when health changes
+        bar = self._hud_bar(("health", x, y), 16, 2, outline=2)
+        bar.draw(draw_list, (x, y), health_segments, pixel_color, (32, 32, 32))
+        
+        # Health text, re-rendered only when the value changes
+        label = self._health_labels.get((x, y))
+        if label is None or label[0] != (health, max_health):
+            label = ((health, max_health), render_pixel_text(f"HEALTH: {health}/{max_health}", self.small_font, (255, 255, 255), 1))
+            self._health_labels[(x, y)] = label
+        draw_list.blit(label[1], (x + bar_width + 10, y + 2))
     
-    def _render_stamina_bar(self, surface: pygame.Surface, x: int, y: int, stamina: int, max_stamina: int, color: tuple, is_stunned: bool):
+    def _render_stamina_bar(self, draw_list: DrawList, x: int, y: int, stamina: int, max_stamina: int, color: tuple, is_stunned: bool):
         """Render a pixelated retro stamina bar."""
         bar_width = 200
         bar_height = 12  # Smaller than health bar
@@ -2209,39 +2118,22 @@ class Level2Scene:
         total_segments = bar_width // pixel_size
         stamina_segments = int((stamina / max_stamina) * total_segments)
         
-        # Draw pixelated background border (retro style)
-        border_thickness = 1  # Thinner border for stamina
-        border_color = (255, 255, 255) if not is_stunned else (255, 0, 0)  # Red border when stunned
-        border_rect = pygame.Rect(x - border_thickness, y - border_thickness, 
-                                bar_width + border_thickness * 2, bar_height + border_thickness * 2)
-        pygame.draw.rect(surface, border_color, border_rect)
-        
-        # Draw dark background
-        bg_rect = pygame.Rect(x, y, bar_width, bar_height)
-        bg_color = (16, 16, 16) if not is_stunned else (64, 16, 16)  # Darker red background when stunned
-        pygame.draw.rect(surface, bg_color, bg_rect)
+        # Color gradient based on stamina percentage
+        stamina_percentage = stamina / max_stamina
+        if stamina_percentage > 0.6:
+            # Bright cyan when full stamina
+            pixel_color = (100, 255, 255)
+        elif stamina_percentage > 0.3:
+            # Dim the color for medium stamina
+            pixel_color = (50, 127, 255)
+        else:
+            # Very dim for low stamina
+            pixel_color = (25, 63, 127)
         
-        # Draw pixelated stamina segments (unless stunned)
+        bar = self._hud_bar(("stamina", x, y), bar_height, 1)  # Thinner border for stamina
         if not is_stunned:
-            for i in range(stamina_segments):
-                segment_x = x + (i * pixel_size)
-                segment_rect = pygame.Rect(segment_x, y, pixel_size - 1, bar_height)  # -1 for pixel separation
-                
-                # Color gradient based on stamina percentage
-                stamina_percentage = stamina / max_stamina
-                if stamina_percentage > 0.6:
-                    # Bright cyan when full stamina
-                    pixel_color = (100, 255, 255)
-                elif stamina_percentage > 0.3:
-                    # Dim the color for medium stamina
-                    pixel_color = (50, 127, 255)
-                else:
-                    # Very dim for low stamina
-                    pixel_color = (25, 63, 127)
-                
-                pygame.draw.rect(surface, pixel_color, segment_rect)
+            bar.draw(draw_list, (x, y), stamina_segments, pixel_color, (16, 16, 16))
         else:
-            # Show red flash effect when stunned
-            if int(pygame.time.get_ticks() / 200) % 2:  # Flash every 200ms
-                flash_rect = pygame.Rect(x, y, bar_width, bar_height)
-                pygame.draw.rect(surface, (128, 0, 0), flash_rect)
\ No newline at end of file
+            # Red border when stunned, with a red flash every 200ms over the darker red background
+            flash = int(self.scene_time / 0.2) % 2
+            bar.draw(draw_list, (x, y), 0, pixel_color, (128, 0, 0) if flash else (64, 16, 16), (255, 0, 0))
@@ -0,0 +1,134 @@
+"""
+Sprite Bake
+Processes every character sprite strip ahead of time into a ready-to-blit cache.
+
+Run from the project root (before packaging, and whenever sprites change):
+    python -m game.sprite_bake [--force] [--jobs N]
+
+Each strip is decoded, recolored, scaled, sliced and trimmed exactly like FrameCache
+does at runtime, then written as raw 32-bit frames to assets/baked/<hash>.bin together
+with an index.json. Only strips whose sheet content or parameters changed are
+rebuilt, and those are processed in parallel across cores.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+from game.animation_manifest import animation_manifest
+from game.render_backend import NATIVE_PIXEL_SCALE
+from game.resource_utils import asset_path, sprite_path
+from game.sprite_system import BAKE_PIXEL_FORMAT, BakedSprites, SpriteSheet, bake_hash, bake_key, decode_strip
+
+
+BLOB_EXTENSION = ".bin"
+
+
+def bake_specs() -> List[Tuple[str, int, float, Optional[Tuple[int, int, int, int]]]]:
+    """Every (sheet, frame count, scale, tint, palette) combination in the animation manifest.
+    
+    Strips are baked at the game's scale, and for scenes drawn at native resolution
+    where the sheet scales down to a whole number (the only ones such scenes use).
+    """
+    specs = animation_manifest.all_specs()
+    specs += [spec for spec in animation_manifest.all_specs((NATIVE_PIXEL_SCALE,))
+              if float(spec[2]).is_integer() and spec not in specs]
+    return specs
+
+
+def _init_worker():
+    """Give each worker process a hidden display so convert_alpha works."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+
+def _bake_sheet(jobs: List[Tuple], directory: str) -> List[Tuple[str, dict]]:
+    """Process every strip cut from one sheet, decoding it once, and write their blobs."""
+    sheet = SpriteSheet(jobs[0][0])
+    results = []
+    for path, frame_count, scale, tint, palette, content_hash in jobs:
+        strip = decode_strip(path, frame_count, scale, tint, palette, sheet=sheet)
+        
+        blob = content_hash + BLOB_EXTENSION
+        temp_path = os.path.join(directory, blob + ".tmp")
+        with open(temp_path, "wb") as blob_file:
+            for frame in strip.frames:
+                blob_file.write(pygame.image.tobytes(frame, BAKE_PIXEL_FORMAT))
+        os.replace(temp_path, os.path.join(directory, blob))
+        
+        rects = [[x, y, frame.get_width(), frame.get_height()] for frame, (x, y) in zip(strip.frames, strip.offsets)]
+        entry = {"hash": content_hash, "blob": blob, "format": BAKE_PIXEL_FORMAT,
+                 "cell": list(strip.cell_size), "frames": rects}
+        results.append((bake_key(path, frame_count, scale, tint, palette), entry))
+    return results
+
+
+def bake(directory: Optional[str] = None, force: bool = False, jobs: Optional[int] = None) -> int:
+    """Bake all character strips into directory, returning how many were rebuilt."""
+    directory = directory or asset_path("baked")
+    os.makedirs(directory, exist_ok=True)
+    old_index = BakedSprites(directory).index
+    
+    index = {}
+    pending: Dict[str, List[Tuple]] = {}
+    for filename, frame_count, scale, tint, palette in bake_specs():
+        path = sprite_path(filename)
+        try:
+            content_hash = bake_hash(path, frame_count, scale, tint, palette)
+        except OSError as e:
+            print(f"Skipping {filename}: {e}")
+            continue
+        key = bake_key(path, frame_count, scale, tint, palette)
+        entry = old_index.get(key)
+        if (not force and entry is not None and entry.get("hash") == content_hash
+                and os.path.exists(os.path.join(directory, entry["blob"]))):
+            index[key] = entry
+        else:
+            pending.setdefault(path, []).append((path, frame_count, scale, tint, palette, content_hash))
+    
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+            # One task per sheet so strips sharing a sheet decode it once
+            for results in pool.map(_bake_sheet, pending.values(), repeat(directory)):
+                for key, entry in results:
+                    index[key] = entry
+                    cell_width, cell_height = entry["cell"]
+                    print(f"Baked {key} ({len(entry['frames'])} frames trimmed from {cell_width}x{cell_height})")
+    
+    temp_path = os.path.join(directory, BakedSprites.INDEX_NAME + ".tmp")
+    with open(temp_path, "w") as index_file:
+        json.dump(index, index_file, indent=1, sort_keys=True)
+    os.replace(temp_path, os.path.join(directory, BakedSprites.INDEX_NAME))
+    
+    # Remove blobs left behind by sheets that changed or were dropped
+    live_blobs = {entry["blob"] for entry in index.values()}
+    for name in os.listdir(directory):
+        if name.endswith(BLOB_EXTENSION) and name not in live_blobs:
+            os.remove(os.path.join(directory, name))
+    
+    return sum(len(jobs) for jobs in pending.values())
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Bake character sprites into a ready-to-blit cache.")
+    parser.add_argument("--force", action="store_true", help="rebuild every strip, even unchanged ones")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--output", default=None, help="output directory (default: assets/baked)")
+    args = parser.parse_args(argv)
+    
+    start = time.perf_counter()
+    rebuilt = bake(args.output, force=args.force, jobs=args.jobs)
+    total = len(bake_specs())
+    print(f"Sprite bake: {rebuilt} rebuilt, {total - rebuilt} up to date ({time.perf_counter() - start:.2f}s)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
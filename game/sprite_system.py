@@ -5,17 +5,27 @@ Handles loading and animating sprite sheets.
 
 import pygame
 import os
-from typing import List, Tuple
+import hashlib
+import json
+import mmap
+import threading
+import weakref
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+from game.asset_loader import asset_loader
+from game.palette import Palette, recolor_surface
+from game.resource_utils import asset_path, sprite_path
 
 
 class SpriteSheet:
     """Handles sprite sheet loading and frame extraction."""
     
-    def __init__(self, filename: str):
-        """Load a sprite sheet image."""
+    def __init__(self, filename: str, surface: Optional[pygame.Surface] = None):
+        """Load a sprite sheet image (or wrap an already loaded one)."""
         self.filename = filename
         try:
-            self.sheet = pygame.image.load(filename).convert_alpha()
+            self.sheet = surface if surface is not None else pygame.image.load(filename).convert_alpha()
         except pygame.error as e:
             print(f"Unable to load sprite sheet: {filename}")
             print(f"Error: {e}")
@@ -26,9 +36,32 @@ class SpriteSheet:
         self.width = self.sheet.get_width()
         self.height = self.sheet.get_height()
     
-    def get_frames(self, frame_width: int, frame_height: int, frame_count: int, y_offset: int = 0) -> List[pygame.Surface]:
-        """Extract frames from sprite sheet."""
+    def get_frames(self, frame_width: int, frame_height: int, frame_count: int, y_offset: int = 0,
+                   copy: bool = True) -> List[pygame.Surface]:
+        """Extract frames from sprite sheet.
+        
+        With copy=False the frames are subsurface views that share the sheet's pixels.
+        """
+        return self._slice_frames(self.sheet, frame_width, frame_height, frame_count, y_offset, copy)
+    
+    def get_scaled_frames(self, frame_width: int, frame_height: int, frame_count: int, scale: float,
+                          y_offset: int = 0, copy: bool = False) -> List[pygame.Surface]:
+        """Extract frames scaled by scale, scaling the whole sheet once instead of every frame.
+        
+        By default the frames are views over the single scaled copy of the sheet.
+        """
+        if scale == 1:
+            return self.get_frames(frame_width, frame_height, frame_count, y_offset, copy)
+        
+        scaled_sheet = pygame.transform.scale(self.sheet, (int(self.width * scale), int(self.height * scale)))
+        return self._slice_frames(scaled_sheet, int(frame_width * scale), int(frame_height * scale),
+                                  frame_count, int(y_offset * scale), copy)
+    
+    def _slice_frames(self, source: pygame.Surface, frame_width: int, frame_height: int, frame_count: int,
+                      y_offset: int, copy: bool) -> List[pygame.Surface]:
+        """Cut frame_count frames out of a horizontal strip, as copies or as views."""
         frames = []
+        source_width, source_height = source.get_size()
         
         for i in range(frame_count):
             x = i * frame_width
@@ -38,9 +71,12 @@ class SpriteSheet:
             frame_rect = pygame.Rect(x, y, frame_width, frame_height)
             
             # Extract frame from sheet
-            if x + frame_width <= self.width and y + frame_height <= self.height:
-                frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                frame.blit(self.sheet, (0, 0), frame_rect)
+            if x + frame_width <= source_width and y + frame_height <= source_height:
+                if copy:
+                    frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
+                    frame.blit(source, (0, 0), frame_rect)
+                else:
+                    frame = source.subsurface(frame_rect)
                 frames.append(frame)
             else:
                 print(f"Warning: Frame {i} is outside sprite sheet bounds")
@@ -55,14 +91,26 @@ class SpriteSheet:
 class Animation:
     """Handles sprite animation playback."""
     
-    def __init__(self, frames: List[pygame.Surface], frame_duration: float = 0.1):
-        """Initialize animation with frames and timing."""
+    def __init__(self, frames: List[pygame.Surface], frame_duration: float = 0.1,
+                 offsets: Optional[List[Tuple[int, int]]] = None, cell_size: Optional[Tuple[int, int]] = None):
+        """Initialize animation with frames and timing.
+        
+        Trimmed frames pass their offsets inside the cell_size cell (see FrameStrip).
+        """
         self.frames = frames
+        self.offsets = offsets if offsets is not None else [(0, 0)] * len(frames)
+        if cell_size is None:
+            cell_size = frames[0].get_size() if frames else (32, 48)
+        self.cell_size = cell_size
         self.frame_duration = frame_duration  # seconds per frame
         self.current_frame = 0
         self.time_since_last_frame = 0.0
         self.is_playing = True
         self.loop = True
+        
+        # Left-facing (horizontally mirrored) frames, built lazily on first request
+        self._mirrored_frames: List[Optional[pygame.Surface]] = []
+        self._mirrored_source: Optional[List[pygame.Surface]] = None
     
     def update(self, dt: float):
         """Update animation timing."""
@@ -82,16 +130,41 @@ class Animation:
                     self.current_frame = len(self.frames) - 1
                     self.is_playing = False
     
-    def get_current_frame(self) -> pygame.Surface:
-        """Get the current animation frame."""
+    def get_current_frame(self, flipped: bool = False) -> pygame.Surface:
+        """Get the current animation frame, mirrored horizontally if flipped."""
         if not self.frames:
             # Return fallback surface
             fallback = pygame.Surface((32, 48), pygame.SRCALPHA)
             fallback.fill((100, 100, 200))
             return fallback
         
+        if flipped:
+            return self._get_mirrored_frame(self.current_frame)
         return self.frames[self.current_frame]
     
+    def get_current_offset(self, flipped: bool = False) -> Tuple[int, int]:
+        """Position of the current frame inside its cell, mirrored horizontally if flipped."""
+        if not self.frames:
+            return (0, 0)
+        
+        offset_x, offset_y = self.offsets[self.current_frame]
+        if flipped:
+            offset_x = self.cell_size[0] - offset_x - self.frames[self.current_frame].get_width()
+        return (offset_x, offset_y)
+    
+    def _get_mirrored_frame(self, index: int) -> pygame.Surface:
+        """Get a mirrored frame, flipping it only the first time it is requested."""
+        # Rebuild the mirror set if the frame list was swapped out
+        if self._mirrored_source is not self.frames:
+            self._mirrored_frames = [None] * len(self.frames)
+            self._mirrored_source = self.frames
+        
+        frame = self._mirrored_frames[index]
+        if frame is None:
+            frame = pygame.transform.flip(self.frames[index], True, False)
+            self._mirrored_frames[index] = frame
+        return frame
+    
     def reset(self):
         """Reset animation to beginning."""
         self.current_frame = 0
@@ -111,14 +184,97 @@ class Animation:
         return not self.loop and not self.is_playing
 
 
+class LazyAnimation(Animation):
+    """Animation whose frames are loaded on first use instead of up front.
+    
+    The loader returns the FrameStrip (normally straight from the frame cache).
+    prefetch() calls it with pack=False on the background asset loader, which
+    decodes the strip without touching the atlas pages the main thread draws
+    from; the first use waits for the prefetch and loads again on the main thread,
+    which only packs the decoded strip. release() drops the frames and calls the
+    unloader, which evicts the strip from the frame cache so its memory can be
+    reused.
+    """
+    
+    def __init__(self, loader: Callable[..., "FrameStrip"], frame_duration: float = 0.1,
+                 unloader: Optional[Callable[[], None]] = None):
+        """Initialize an unloaded animation."""
+        super().__init__([], frame_duration)
+        self.loader = loader
+        self.unloader = unloader
+        self.is_loaded = False
+        self._prefetch = None
+    
+    def ensure_loaded(self):
+        """Load the frames if they are not loaded yet."""
+        if self.is_loaded:
+            return
+        prefetch, self._prefetch = self._prefetch, None
+        # A queued prefetch is cancelled and loaded here; a running one is waited for rather than loaded twice
+        if prefetch is not None and (prefetch.done() or not prefetch.cancel()):
+            try:
+                prefetch.result()
+            except Exception as e:
+                print(f"Prefetch failed, loading on first use instead: {e}")
+        # After a prefetch this finds the decoded strip and packs it into the atlas
+        strip = self.loader()
+        self.frames = strip.frames
+        self.offsets = strip.offsets
+        self.cell_size = strip.cell_size
+        self.current_frame = min(self.current_frame, max(0, len(self.frames) - 1))
+        self.is_loaded = True
+    
+    def prefetch(self):
+        """Start loading the frames in the background; ensure_loaded() uses them."""
+        if self.is_loaded or self._prefetch is not None:
+            return
+        self._prefetch = asset_loader.submit(partial(self.loader, pack=False))
+    
+    def release(self):
+        """Drop the frames (and their mirrored copies) until the animation is used again."""
+        self.frames = []
+        self.offsets = []
+        self._mirrored_frames = []
+        self._mirrored_source = None
+        self.is_loaded = False
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+            self._prefetch = None
+        if self.unloader is not None:
+            self.unloader()
+    
+    @property
+    def memory_bytes(self) -> int:
+        """Pixel memory of the loaded frames and their mirrored copies, which release() frees."""
+        frames = list(self.frames) + [frame for frame in self._mirrored_frames if frame is not None]
+        return sum(frame.get_width() * frame.get_height() * frame.get_bytesize() for frame in frames)
+    
+    def update(self, dt: float):
+        """Update animation timing (loading the frames if needed)."""
+        self.ensure_loaded()
+        super().update(dt)
+    
+    def get_current_frame(self, flipped: bool = False) -> pygame.Surface:
+        """Get the current animation frame (loading the frames if needed)."""
+        self.ensure_loaded()
+        return super().get_current_frame(flipped)
+
+
+# Pixel memory each animator may keep in loaded lazy animations before releasing the oldest
+LAZY_ANIMATION_BUDGET = 4 * 1024 * 1024
+
+
 class SpriteAnimator:
     """Manages multiple animations for a character."""
     
-    def __init__(self):
+    def __init__(self, lazy_budget_bytes: int = LAZY_ANIMATION_BUDGET):
         """Initialize sprite animator."""
         self.animations = {}
         self.current_animation = None
         self.current_animation_name = ""
+        self.lazy_budget_bytes = lazy_budget_bytes
+        # Loaded lazy animations, least recently played first
+        self._loaded_lazy: "OrderedDict[int, LazyAnimation]" = OrderedDict()
     
     def add_animation(self, name: str, animation: Animation):
         """Add an animation to the animator."""
@@ -135,21 +291,495 @@ class SpriteAnimator:
             if self.current_animation_name != name or reset:
                 self.current_animation = self.animations[name]
                 self.current_animation_name = name
+                if isinstance(self.current_animation, LazyAnimation):
+                    self._use_lazy(self.current_animation)
                 if reset:
                     self.current_animation.reset()
                 self.current_animation.play()
     
+    def prefetch(self, name: str):
+        """Hint that an animation will probably play soon."""
+        animation = self.animations.get(name)
+        if isinstance(animation, LazyAnimation):
+            animation.prefetch()
+    
+    def _use_lazy(self, animation: LazyAnimation):
+        """Load a lazy animation that is about to play, releasing old ones over budget."""
+        animation.ensure_loaded()
+        self._loaded_lazy[id(animation)] = animation
+        self._loaded_lazy.move_to_end(id(animation))
+        
+        loaded_bytes = sum(loaded.memory_bytes for loaded in self._loaded_lazy.values())
+        for key, loaded in list(self._loaded_lazy.items()):
+            if loaded_bytes <= self.lazy_budget_bytes:
+                break
+            if loaded is animation:
+                continue
+            loaded_bytes -= loaded.memory_bytes
+            loaded.release()
+            del self._loaded_lazy[key]
+    
     def update(self, dt: float):
         """Update current animation."""
         if self.current_animation:
             self.current_animation.update(dt)
     
-    def get_current_frame(self) -> pygame.Surface:
-        """Get current animation frame."""
+    def get_current_frame(self, flipped: bool = False) -> pygame.Surface:
+        """Get current animation frame, mirrored horizontally if flipped."""
         if self.current_animation:
-            return self.current_animation.get_current_frame()
+            return self.current_animation.get_current_frame(flipped)
         
         # Return fallback surface
         fallback = pygame.Surface((32, 48), pygame.SRCALPHA)
         fallback.fill((100, 100, 200))
-        return fallback
\ No newline at end of file
+        return fallback
+    
+    def get_current_offset(self, flipped: bool = False) -> Tuple[int, int]:
+        """Position of the current frame inside its cell, mirrored horizontally if flipped."""
+        if self.current_animation:
+            return self.current_animation.get_current_offset(flipped)
+        return (0, 0)
+    
+    def get_cell_size(self) -> Tuple[int, int]:
+        """Untrimmed frame size of the current animation."""
+        if self.current_animation:
+            return self.current_animation.cell_size
+        return (32, 48)
+
+
+class AtlasPage:
+    """One large surface of a texture atlas, filled shelf by shelf.
+    
+    Every handed out frame is tracked with a weak reference. Its region is only
+    freed once nothing references the frame any more (frames are subsurfaces of
+    the page, and animations can hold them after the cache dropped them), and
+    freed regions are reused before the shelves grow.
+    """
+    
+    def __init__(self, width: int, height: int):
+        """Create an empty transparent page."""
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.width = width
+        self.height = height
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+        self._regions: List[Tuple[weakref.ref, pygame.Rect]] = []  # Handed out frames and their (padded) rects
+        self._free: List[pygame.Rect] = []  # Regions of frames that are gone
+    
+    @property
+    def live_regions(self) -> int:
+        """Frames from this page that are still referenced."""
+        return sum(1 for frame, _ in self._regions if frame() is not None)
+    
+    def allocate(self, width: int, height: int) -> Optional[pygame.Rect]:
+        """Reserve a free rect on the page, or return None if it does not fit."""
+        rect = self._reuse(width, height)
+        if rect is not None:
+            return rect
+        
+        shelf_x, shelf_y, shelf_height = self.shelf_x, self.shelf_y, self.shelf_height
+        if shelf_x + width > self.width:
+            # Start a new shelf below the current one
+            shelf_y += shelf_height
+            shelf_x = 0
+            shelf_height = 0
+        
+        if width > self.width or shelf_y + height > self.height:
+            return None
+        
+        self.shelf_x = shelf_x + width
+        self.shelf_y = shelf_y
+        self.shelf_height = max(shelf_height, height)
+        return pygame.Rect(shelf_x, shelf_y, width, height)
+    
+    def _reuse(self, width: int, height: int) -> Optional[pygame.Rect]:
+        """Take the smallest freed region that fits, returning the unused rest of it to the free list."""
+        fitting = [rect for rect in self._free if rect.width >= width and rect.height >= height]
+        if not fitting:
+            return None
+        region = min(fitting, key=lambda rect: rect.width * rect.height)
+        self._free.remove(region)
+        if region.width > width:
+            self._free.append(pygame.Rect(region.x + width, region.y, region.width - width, height))
+        if region.height > height:
+            self._free.append(pygame.Rect(region.x, region.y + height, region.width, region.height - height))
+        rect = pygame.Rect(region.x, region.y, width, height)
+        # Packing blits with RGBA_MAX, so the old frame's pixels are cleared first
+        self.surface.fill((0, 0, 0, 0), rect)
+        return rect
+    
+    def track(self, frame: pygame.Surface, rect: pygame.Rect):
+        """Remember a handed out frame and the region it occupies."""
+        self._regions.append((weakref.ref(frame), rect))
+    
+    def collect(self):
+        """Free the regions of frames nobody references any more."""
+        live = []
+        for frame, rect in self._regions:
+            if frame() is None:
+                self._free.append(rect)
+            else:
+                live.append((frame, rect))
+        self._regions = live
+        if not live:
+            self.reset()
+    
+    def reset(self):
+        """Forget every allocation and clear the page for reuse (only once no frame from it is referenced)."""
+        self.surface.fill((0, 0, 0, 0))
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+        self._regions = []
+        self._free = []
+
+
+class TextureAtlas:
+    """Packs animation frames into a few large surfaces and hands out subsurface views."""
+    
+    def __init__(self, page_size: int = 2048, padding: int = 1):
+        """Initialize an empty atlas with square pages of page_size pixels."""
+        self.page_size = page_size
+        self.padding = padding  # Transparent gap between frames
+        self.pages: List[AtlasPage] = []
+    
+    def pack(self, frames: List[pygame.Surface]) -> List[pygame.Surface]:
+        """Copy frames into the atlas and return subsurfaces addressing them."""
+        self.collect()
+        packed = []
+        for frame in frames:
+            width, height = frame.get_size()
+            page, region = self._allocate(width + self.padding, height + self.padding)
+            rect = pygame.Rect(region.topleft, (width, height))
+            # Atlas regions start fully transparent, so RGBA_MAX copies pixels exactly
+            page.surface.blit(frame, rect.topleft, special_flags=pygame.BLEND_RGBA_MAX)
+            packed_frame = page.surface.subsurface(rect)
+            page.track(packed_frame, region)
+            packed.append(packed_frame)
+        return packed
+    
+    def _allocate(self, width: int, height: int) -> Tuple[AtlasPage, pygame.Rect]:
+        """Find room on an existing page (freed regions first), opening a new page if needed."""
+        for page in self.pages:
+            rect = page.allocate(width, height)
+            if rect is not None:
+                return page, rect
+        
+        # Oversized frames get a page of their own
+        page = AtlasPage(max(self.page_size, width), max(self.page_size, height))
+        self.pages.append(page)
+        return page, page.allocate(width, height)
+    
+    def collect(self):
+        """Free the regions of frames that are no longer referenced, dropping pages left empty.
+        
+        The newest page is kept (cleared) for the next frames.
+        """
+        for page in self.pages:
+            page.collect()
+        newest = self.pages[-1] if self.pages else None
+        self.pages = [page for page in self.pages if page.live_regions or page is newest]
+    
+    @property
+    def memory_bytes(self) -> int:
+        """Total pixel memory held by atlas pages."""
+        return sum(page.width * page.height * page.surface.get_bytesize() for page in self.pages)
+    
+    def clear(self):
+        """Drop every page (frames still referenced keep their page's pixels alive)."""
+        self.pages = []
+
+
+class FrameStrip:
+    """Frames of one sprite strip, trimmed to their visible pixels.
+    
+    offsets[i] is where frames[i] sits inside the original cell_size cell, so
+    drawing it at the cell position plus its offset matches drawing the full cell.
+    """
+    
+    def __init__(self, frames: List[pygame.Surface], offsets: Optional[List[Tuple[int, int]]] = None,
+                 cell_size: Optional[Tuple[int, int]] = None):
+        """Wrap frames with their offsets (untrimmed frames if omitted)."""
+        self.frames = frames
+        self.offsets = offsets if offsets is not None else [(0, 0)] * len(frames)
+        if cell_size is None:
+            cell_size = frames[0].get_size() if frames else (0, 0)
+        self.cell_size = cell_size
+    
+    @classmethod
+    def trimmed(cls, frames: List[pygame.Surface]) -> "FrameStrip":
+        """Trim every frame to its bounding rect of non-transparent pixels (as views)."""
+        trimmed_frames = []
+        offsets = []
+        for frame in frames:
+            rect = frame.get_bounding_rect()
+            if rect.width == 0 or rect.height == 0:
+                # Fully transparent frame, keep a single (transparent) pixel
+                rect = pygame.Rect(0, 0, 1, 1)
+            trimmed_frames.append(frame.subsurface(rect))
+            offsets.append(rect.topleft)
+        cell_size = frames[0].get_size() if frames else (0, 0)
+        return cls(trimmed_frames, offsets, cell_size)
+    
+    @property
+    def size_bytes(self) -> int:
+        """Pixel memory of the frames."""
+        return sum(frame.get_width() * frame.get_height() * frame.get_bytesize() for frame in self.frames)
+    
+    def __len__(self) -> int:
+        return len(self.frames)
+
+
+def decode_strip(path: str, frame_count: int, scale: float,
+                 tint: Optional[Tuple[int, int, int, int]] = None, palette: Optional[Palette] = None,
+                 sheet: Optional[SpriteSheet] = None) -> FrameStrip:
+    """Decode, recolor, scale, slice and trim a sprite strip.
+    
+    The palette swap and tint are applied to the decoded sheet once and the sheet
+    is scaled as a whole, so the trimmed frames are views over one scaled copy. An
+    already decoded sheet can be passed to share it between strips (and color
+    variants); it is never modified.
+    """
+    recolored = tint is not None or bool(palette)
+    if sheet is None:
+        sheet = SpriteSheet(path)
+    elif recolored:
+        sheet = SpriteSheet(path, sheet.sheet.copy())
+    if recolored:
+        # Recoloring then nearest-neighbour scaling equals scaling then recoloring
+        recolor_surface(sheet.sheet, tint, palette)
+    
+    frame_width = sheet.width // frame_count
+    frames = sheet.get_scaled_frames(frame_width, sheet.height, frame_count, scale, copy=False)
+    return FrameStrip.trimmed(frames)
+
+
+# Bump whenever decode_strip changes its output so stale bakes are ignored
+BAKE_VERSION = 2
+
+# Byte order of baked pixels; BGRA matches SRCALPHA surfaces (and atlas pages) on
+# little-endian machines, so packing baked frames is a plain copy, not a conversion
+BAKE_PIXEL_FORMAT = "BGRA"
+
+
+def bake_key(path: str, frame_count: int, scale: float, tint: Optional[Tuple[int, int, int, int]],
+             palette: Optional[Palette] = None) -> str:
+    """Index key of a processed strip, independent of where the game is installed."""
+    relative = os.path.relpath(path, sprite_path("")).replace(os.sep, "/")
+    key = f"{relative}|{frame_count}|{scale}|{tint}"
+    if palette:
+        key += f"|{palette}"
+    return key
+
+
+def bake_hash(path: str, frame_count: int, scale: float, tint: Optional[Tuple[int, int, int, int]],
+              palette: Optional[Palette] = None) -> str:
+    """Content hash of a strip's source sheet and processing parameters."""
+    digest = hashlib.sha1(repr((BAKE_VERSION, frame_count, scale, tint, palette)).encode())
+    with open(path, "rb") as source:
+        digest.update(source.read())
+    return digest.hexdigest()
+
+
+class BakedSprites:
+    """Read side of the offline sprite bake (see game/sprite_bake.py).
+    
+    The bake stores every processed (trimmed) strip as raw 32-bit frames in its own blob file
+    plus a JSON index. Blobs are memory mapped and the frames wrap the mapping
+    with pygame.image.frombuffer, so loading a baked strip copies no pixels.
+    Strips whose source sheet changed since the bake are reported as missing.
+    """
+    
+    INDEX_NAME = "index.json"
+    
+    def __init__(self, directory: str):
+        """Point at a bake output directory (it may not exist)."""
+        self.directory = directory
+        self._index: Optional[Dict[str, dict]] = None
+        self._maps: Dict[str, mmap.mmap] = {}
+    
+    @property
+    def index(self) -> Dict[str, dict]:
+        """The bake index, read on first use (empty if nothing was baked)."""
+        if self._index is None:
+            try:
+                with open(os.path.join(self.directory, self.INDEX_NAME), "r") as index_file:
+                    self._index = json.load(index_file)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+    
+    def get_strip(self, path: str, frame_count: int, scale: float,
+                  tint: Optional[Tuple[int, int, int, int]] = None,
+                  palette: Optional[Palette] = None) -> Optional[FrameStrip]:
+        """A baked strip, or None if it was never baked or is out of date."""
+        entry = self.index.get(bake_key(path, frame_count, scale, tint, palette))
+        if entry is None:
+            return None
+        try:
+            if entry["hash"] != bake_hash(path, frame_count, scale, tint, palette):
+                return None
+            data = self._map(entry["blob"])
+        except (OSError, ValueError) as e:
+            print(f"Ignoring baked sprites for {path}: {e}")
+            return None
+        
+        # Trimmed frames are stored back to back, each with its rect in the cell
+        if len(data) < sum(w * h * 4 for _, _, w, h in entry["frames"]):
+            return None
+        view = memoryview(data)
+        pixel_format = entry.get("format", BAKE_PIXEL_FORMAT)
+        frames = []
+        offsets = []
+        position = 0
+        for x, y, w, h in entry["frames"]:
+            frames.append(pygame.image.frombuffer(view[position:position + w * h * 4], (w, h), pixel_format))
+            offsets.append((x, y))
+            position += w * h * 4
+        return FrameStrip(frames, offsets, tuple(entry["cell"]))
+    
+    def _map(self, blob: str) -> mmap.mmap:
+        """Memory map a blob file, keeping the mapping alive for the frames using it."""
+        data = self._maps.get(blob)
+        if data is None:
+            with open(os.path.join(self.directory, blob), "rb") as blob_file:
+                data = mmap.mmap(blob_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[blob] = data
+        return data
+
+
+class FrameCache:
+    """Process-wide LRU cache of processed (sliced, scaled, recolored, trimmed) animation frames.
+    
+    Entries are keyed by (sheet path, frame count, scale, tint, palette) so every scene that
+    builds the same character reuses the frames decoded by the first one. Cached
+    surfaces are shared between characters and must never be drawn on.
+    
+    The memory cap applies to the frames of the cached strips. With an atlas
+    attached, frames are packed into its pages; an evicted strip's regions are
+    reused once no animation holds its frames any more. Atlas pages are only
+    touched on the main thread (which blits from them): the background loader
+    asks for strips with pack=False, which leaves them decoded but unpacked until
+    the main thread gets them. With a baked sprite cache attached, up-to-date
+    strips are mapped from disk instead of decoded.
+    """
+    
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, atlas: Optional[TextureAtlas] = None,
+                 baked: Optional["BakedSprites"] = None):
+        """Initialize an empty cache with a memory cap in bytes."""
+        self.max_bytes = max_bytes
+        self.atlas = atlas
+        self.baked = baked
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # (strip, size in bytes, whether the strip is packed into the atlas yet)
+        self._entries: "OrderedDict[Tuple, Tuple[FrameStrip, int, bool]]" = OrderedDict()
+        # Scenes and the background asset loader share the cache
+        self._lock = threading.RLock()
+    
+    def get_strip(self, path: str, frame_count: int, scale: float = 1.0,
+                  tint: Optional[Tuple[int, int, int, int]] = None,
+                  palette: Optional[Palette] = None, pack: bool = True) -> FrameStrip:
+        """Get the trimmed frames of a horizontal sprite strip, loading them on a cache miss."""
+        return self.get_strips([(path, frame_count, scale, tint, palette)], pack)[0]
+    
+    def get_strips(self, specs: List[Tuple], pack: bool = True) -> List[FrameStrip]:
+        """Get several (path, frame count, scale, tint, palette) strips in one pass.
+        
+        Every sheet missing from the cache is decoded at most once per batch, however
+        many strips (scales, color variants) are cut from it. With pack=False (off
+        the main thread) new strips are cached unpacked; the next call with pack=True
+        packs them into the atlas instead of decoding them again.
+        """
+        with self._lock:
+            sheets: Dict[str, SpriteSheet] = {}
+            strips = []
+            for path, frame_count, scale, tint, palette in specs:
+                key = (path, frame_count, scale, tint, palette)
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    strip, size_bytes, packed = entry
+                    if pack and not packed:
+                        # Loaded in the background: adopt it into the atlas now
+                        strip = self._pack(strip)
+                        self._entries[key] = (strip, size_bytes, True)
+                    strips.append(strip)
+                    continue
+                
+                self.misses += 1
+                strip = self._load_strip(path, frame_count, scale, tint, palette, sheets)
+                if pack:
+                    strip = self._pack(strip)
+                size_bytes = strip.size_bytes
+                self._entries[key] = (strip, size_bytes, pack)
+                self.current_bytes += size_bytes
+                self._evict()
+                strips.append(strip)
+            return strips
+    
+    def _pack(self, strip: FrameStrip) -> FrameStrip:
+        """The strip with its frames copied into the atlas (unchanged without one); main thread only."""
+        if self.atlas is None:
+            return strip
+        return FrameStrip(self.atlas.pack(strip.frames), strip.offsets, strip.cell_size)
+    
+    def _load_strip(self, path: str, frame_count: int, scale: float,
+                    tint: Optional[Tuple[int, int, int, int]], palette: Optional[Palette],
+                    sheets: Dict[str, SpriteSheet]) -> FrameStrip:
+        """Load a processed sprite strip, preferring the offline bake over decoding.
+        
+        Decoded sheets are kept in sheets for the other strips of the batch.
+        """
+        if self.baked is not None:
+            strip = self.baked.get_strip(path, frame_count, scale, tint, palette)
+            if strip is not None:
+                return strip
+        if path not in sheets:
+            sheets[path] = SpriteSheet(path)
+        return decode_strip(path, frame_count, scale, tint, palette, sheet=sheets[path])
+    
+    def discard(self, path: str, frame_count: int, scale: float = 1.0,
+                tint: Optional[Tuple[int, int, int, int]] = None, palette: Optional[Palette] = None):
+        """Evict one strip; its atlas regions are reused once no animation holds its frames (main thread only)."""
+        with self._lock:
+            entry = self._entries.pop((path, frame_count, scale, tint, palette), None)
+            if entry is not None:
+                self.current_bytes -= entry[1]
+                del entry
+            if self.atlas is not None:
+                self.atlas.collect()
+    
+    @property
+    def memory_bytes(self) -> int:
+        """Pixel memory held for cached frames (atlas pages when packing)."""
+        if self.atlas is not None:
+            return self.atlas.memory_bytes
+        return self.current_bytes
+    
+    def _evict(self):
+        """Drop least recently used entries until the cached strips fit the memory cap."""
+        # Always keep the newest entry, even if it alone exceeds the cap
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, size_bytes, _) = self._entries.popitem(last=False)
+            self.current_bytes -= size_bytes
+    
+    def clear(self):
+        """Remove every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            if self.atlas is not None:
+                self.atlas.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by every scene so rematches and level changes skip decoding entirely;
+# frames of all characters are packed together into a handful of atlas pages.
+# Strips baked with `python -m game.sprite_bake` are mapped from assets/baked.
+frame_cache = FrameCache(atlas=TextureAtlas(), baked=BakedSprites(asset_path("baked")))
@@ -0,0 +1,65 @@
+"""
+Text Rendering
+Pixelated retro text shared by every scene, cached so static strings cost a blit.
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Tuple
+from game.bitmap_font import BitmapFont
+
+
+class TextCache:
+    """Process-wide LRU cache of rendered pixel text.
+    
+    Entries are keyed by (text, font, color, scale). HUD strings barely change
+    between frames (the round timer once a second), so after the first frame they
+    are served from here. Cached surfaces are shared between scenes and must never
+    be drawn on; callers that change their alpha must restore it after blitting.
+    """
+    
+    def __init__(self, max_entries: int = 512):
+        """Initialize an empty cache holding at most max_entries surfaces."""
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+    
+    def render(self, text: str, font: BitmapFont, color: tuple, scale: int = 2) -> pygame.Surface:
+        """Render text with a pixelated look (no anti-aliasing, nearest-neighbor upscale)."""
+        key = (text, font, tuple(color), scale)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        # Composed from the font's pre-scaled glyph atlas
+        surface = font.render(text, color, scale)
+        
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return surface
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def clear(self):
+        """Drop every cached surface (counters are kept)."""
+        self._entries.clear()
+
+
+# Shared by every scene
+text_cache = TextCache()
+
+
+def render_pixel_text(text: str, font: BitmapFont, color: tuple, scale: int = 2) -> pygame.Surface:
+    """Render (or fetch) text with a pixelated, retro look by scaling up small text."""
+    return text_cache.render(text, font, color, scale)